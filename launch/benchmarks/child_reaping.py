@@ -0,0 +1,82 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the threads and the time it takes for launch to reap many processes.
+
+For each mode of the child watcher and each number of processes, that many
+processes are started and watched, the number of threads is counted, then
+all the processes are killed at once, and the time from killing them until
+all their exits are delivered to the event loop is measured.
+
+Usage: python3 child_reaping.py [--processes N [N ...]] [--modes MODE [MODE ...]]
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))  # noqa
+
+from launch.child_watcher import ChildWatcher  # noqa: E402
+
+
+async def run(mode, number_of_processes):
+    """Watch the given number of processes, and return the threads used and the time to reap."""
+    loop = asyncio.get_running_loop()
+    watcher = ChildWatcher(mode)
+    thread_count = threading.active_count()
+    popens = [subprocess.Popen(['sleep', '60']) for _ in range(number_of_processes)]
+    remaining = number_of_processes
+    all_exited = loop.create_future()
+
+    def on_exit(returncode):
+        nonlocal remaining
+        remaining -= 1
+        if remaining == 0:
+            all_exited.set_result(time.perf_counter())
+
+    try:
+        for popen in popens:
+            watcher.add_child(loop, popen, on_exit)
+        threads = threading.active_count() - thread_count
+        killed_at = time.perf_counter()
+        for popen in popens:
+            popen.kill()
+        return threads, await all_exited - killed_at
+    finally:
+        watcher.close()
+
+
+def main(argv=sys.argv[1:]):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--processes', type=int, nargs='+', default=[100, 500])
+    parser.add_argument('--modes', nargs='+', choices=ChildWatcher.MODES,
+                        default=list(ChildWatcher.MODES))
+    args = parser.parse_args(argv)
+
+    for mode in args.modes:
+        for number_of_processes in args.processes:
+            threads, elapsed = asyncio.run(run(mode, number_of_processes))
+            print('mode: {}, processes: {}, threads: {}, all reaped in {:.3f} s'.format(
+                mode, number_of_processes, threads, elapsed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark visiting a large tree of scoped groups with many launch configurations.
+
+Hundreds of launch configurations are set at the top level, and a tree of
+scoped GroupActions, nested several levels deep, sets and reads launch
+configurations within each group.
+The whole tree is visited with a LaunchContext and the elapsed time is reported.
+
+Usage: python3 launch_configuration_scopes.py [--groups N] [--depth N] [--arguments N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))  # noqa
+
+import launch  # noqa: E402
+from launch.actions import GroupAction  # noqa: E402
+from launch.actions import LogInfo  # noqa: E402
+from launch.actions import SetLaunchConfiguration  # noqa: E402
+from launch.substitutions import LaunchConfiguration  # noqa: E402
+from launch.utilities import visit_all_entities_and_collect_futures  # noqa: E402
+
+
+def generate_groups(number_of_groups, depth, number_of_arguments):
+    """Generate a list of nested groups, with number_of_groups groups in total."""
+    groups_per_level = max(1, number_of_groups // depth)
+    groups = []
+    for i in range(groups_per_level):
+        # Nest depth groups, innermost first.
+        group = GroupAction([
+            LogInfo(msg=LaunchConfiguration('arg_{}'.format(i % number_of_arguments))),
+        ])
+        for level in range(1, depth):
+            group = GroupAction([
+                SetLaunchConfiguration('group_{}'.format(level), str(i)),
+                group,
+            ])
+        groups.append(group)
+    return groups
+
+
+def main(argv=sys.argv[1:]):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--groups', type=int, default=5000)
+    parser.add_argument('--depth', type=int, default=8)
+    parser.add_argument('--arguments', type=int, default=500)
+    args = parser.parse_args(argv)
+
+    context = launch.LaunchContext()
+    for i in range(args.arguments):
+        context.launch_configurations['arg_{}'.format(i)] = 'value_{}'.format(i)
+    # Silence LogInfo while visiting.
+    launch.logging.get_logger('launch.user').setLevel('ERROR')
+    description = launch.LaunchDescription(
+        generate_groups(args.groups, args.depth, args.arguments))
+
+    start = time.perf_counter()
+    visit_all_entities_and_collect_futures(description, context)
+    elapsed = time.perf_counter() - start
+    print('groups: {}, depth: {}, arguments: {}'.format(
+        args.groups, args.depth, args.arguments))
+    print('visited in {:.3f} s'.format(elapsed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
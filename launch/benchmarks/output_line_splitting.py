@@ -0,0 +1,71 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark splitting process output into lines.
+
+Chunks of output, as read from a process pipe, are fed to a LineSplitter,
+and the achieved throughput is compared to the target output rate.
+Chunks are cut at arbitrary offsets, so lines and multibyte characters
+are split across chunks.
+
+Usage: python3 output_line_splitting.py [--megabytes N] [--chunk-size BYTES] [--target MB/S]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))  # noqa
+
+from launch.utilities import LineSplitter  # noqa: E402
+
+
+def generate_chunks(total_size, chunk_size):
+    """Generate a list of chunks of output, for about total_size bytes overall."""
+    lines = ''.join(
+        '[INFO] [{:.6f}] [talker]: Publishing: "Hello Wörld: {}"\n'.format(1e9 + i, i)
+        for i in range(1000)
+    ).encode('utf-8')
+    data = lines * max(1, total_size // len(lines))
+    return [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
+def main(argv=sys.argv[1:]):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--megabytes', type=int, default=100)
+    parser.add_argument('--chunk-size', type=int, default=1021)
+    parser.add_argument('--target', type=float, default=100.0)
+    args = parser.parse_args(argv)
+
+    chunks = generate_chunks(args.megabytes * 10**6, args.chunk_size)
+    total_size = sum(len(chunk) for chunk in chunks)
+    splitter = LineSplitter()
+    number_of_lines = 0
+    start = time.perf_counter()
+    for chunk in chunks:
+        number_of_lines += len(splitter.feed(chunk))
+    splitter.flush()
+    elapsed = time.perf_counter() - start
+
+    throughput = total_size / elapsed / 10**6
+    print('bytes: {}, chunks: {}, lines: {}'.format(total_size, len(chunks), number_of_lines))
+    print('split in {:.3f} s, {:.1f} MB/s (target {:.1f} MB/s)'.format(
+        elapsed, throughput, args.target))
+    return 0 if throughput >= args.target else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
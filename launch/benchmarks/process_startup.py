@@ -0,0 +1,96 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the time it takes for launch to start many processes.
+
+For each number of processes, a launch description with that many
+ExecuteProcess actions is run, and the time from the start of the run until
+all ProcessStarted events are handled is measured, after which launch is shut
+down.
+Ballast memory can be allocated beforehand, to account for the cost of starting
+processes from a large launch process.
+
+Usage: python3 process_startup.py [--processes N [N ...]] [--max-concurrent-spawns N]
+                                  [--ballast MEGABYTES]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))  # noqa
+
+import launch  # noqa: E402
+from launch.event_handlers import OnProcessStart  # noqa: E402
+
+
+def run(number_of_processes, max_concurrent_spawns):
+    """Run launch with the given number of processes, and return the time to start them."""
+    ls = launch.LaunchService(max_concurrent_spawns=max_concurrent_spawns)
+    started_count = 0
+    all_started_at = None
+
+    def on_start(event, context):
+        nonlocal started_count, all_started_at
+        started_count += 1
+        if started_count == number_of_processes:
+            all_started_at = time.perf_counter()
+            return launch.actions.Shutdown(reason='all processes started')
+        return None
+
+    ls.include_launch_description(launch.LaunchDescription([
+        launch.actions.RegisterEventHandler(OnProcessStart(on_start=on_start)),
+    ] + [
+        launch.actions.ExecuteProcess(
+            cmd=['sleep', '60'],
+            name='sleeper_{}'.format(i),
+            output='log',
+        )
+        for i in range(number_of_processes)
+    ]))
+    start = time.perf_counter()
+    ls.run()
+    if all_started_at is None:
+        return None
+    return all_started_at - start
+
+
+def main(argv=sys.argv[1:]):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--processes', type=int, nargs='+', default=[100, 500, 1000])
+    parser.add_argument('--max-concurrent-spawns', type=int, default=None)
+    parser.add_argument('--ballast', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    # Touch every page, so that the memory is actually mapped.
+    ballast = bytearray(args.ballast * 2**20)
+    for i in range(0, len(ballast), 4096):
+        ballast[i] = 1
+
+    print('max concurrent spawns: {}, ballast: {} MB'.format(
+        args.max_concurrent_spawns or 'default', args.ballast))
+    for number_of_processes in args.processes:
+        elapsed = run(number_of_processes, args.max_concurrent_spawns)
+        if elapsed is None:
+            print('processes: {}, not all started'.format(number_of_processes))
+            return 1
+        print('processes: {}, all started in {:.3f} s ({:.3f} ms per process)'.format(
+            number_of_processes, elapsed, elapsed / number_of_processes * 1e3))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
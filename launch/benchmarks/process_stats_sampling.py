@@ -0,0 +1,107 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the CPU cost of sampling the resource usage of many processes.
+
+Launch is run with many idle processes, first without and then with process
+stats sampling, and the CPU time used by launch itself while all the processes
+are running is measured, from which the cost of sampling is derived.
+
+Usage: python3 process_stats_sampling.py [--processes N] [--period SECONDS]
+                                         [--duration SECONDS]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))  # noqa
+
+import launch  # noqa: E402
+from launch.event_handlers import OnProcessStart  # noqa: E402
+from launch.event_handlers import OnProcessStats  # noqa: E402
+
+
+def run(number_of_processes, period, duration):
+    """Run launch with the given number of processes, and return its CPU time and samples."""
+    ls = launch.LaunchService(process_stats_period=period)
+    started_count = 0
+    sample_count = 0
+    cpu_time_at_start = None
+    cpu_time_at_end = None
+
+    def on_start(event, context):
+        nonlocal started_count, cpu_time_at_start
+        started_count += 1
+        if started_count == number_of_processes:
+            cpu_time_at_start = time.process_time()
+            return launch.actions.TimerAction(period=duration, actions=[
+                launch.actions.OpaqueFunction(function=on_end),
+                launch.actions.Shutdown(reason='benchmark done'),
+            ])
+        return None
+
+    def on_end(context):
+        nonlocal cpu_time_at_end
+        cpu_time_at_end = time.process_time()
+
+    def on_stats(event, context):
+        nonlocal sample_count
+        if cpu_time_at_start is not None and cpu_time_at_end is None:
+            sample_count += 1
+
+    ls.include_launch_description(launch.LaunchDescription([
+        launch.actions.RegisterEventHandler(OnProcessStart(on_start=on_start)),
+        launch.actions.RegisterEventHandler(OnProcessStats(on_stats=on_stats)),
+    ] + [
+        launch.actions.ExecuteProcess(
+            cmd=['sleep', str(duration + 60)],
+            name='sleeper_{}'.format(i),
+            output='log',
+        )
+        for i in range(number_of_processes)
+    ]))
+    ls.run()
+    if cpu_time_at_end is None:
+        return None
+    return cpu_time_at_end - cpu_time_at_start, sample_count
+
+
+def main(argv=sys.argv[1:]):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--processes', type=int, default=500)
+    parser.add_argument('--period', type=float, default=1.0)
+    parser.add_argument('--duration', type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    baseline = run(args.processes, None, args.duration)
+    sampled = run(args.processes, args.period, args.duration)
+    if baseline is None or sampled is None:
+        print('processes: {}, not all started'.format(args.processes))
+        return 1
+    cost = sampled[0] - baseline[0]
+    passes = sampled[1] / args.processes
+    print('processes: {}, period: {} s, duration: {} s'.format(
+        args.processes, args.period, args.duration))
+    print('cpu time without sampling: {:.3f} s, with sampling: {:.3f} s ({} samples)'.format(
+        baseline[0], sampled[0], sampled[1]))
+    print('sampling cost: {:.3f} ms per pass, {:.2f} % of one CPU'.format(
+        cost / passes * 1e3 if passes else float('nan'), cost / args.duration * 100.0))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
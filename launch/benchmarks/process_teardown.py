@@ -0,0 +1,94 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the time it takes for launch to shut down many processes.
+
+For each number of processes, a launch description with that many
+ExecuteProcess actions is run, launch is shut down once all the processes
+started, and the time from the shutdown until launch is done is measured.
+Processes can ignore SIGINT, in which case they are only terminated once
+shutdown escalates to SIGTERM, after the SIGTERM timeout.
+
+Usage: python3 process_teardown.py [--processes N [N ...]] [--ignore-sigint]
+                                   [--sigterm-timeout SECONDS]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))  # noqa
+
+import launch  # noqa: E402
+from launch.event_handlers import OnProcessStart  # noqa: E402
+
+
+def run(number_of_processes, ignore_sigint, sigterm_timeout):
+    """Run launch with the given number of processes, and return the time to shut them down."""
+    ls = launch.LaunchService()
+    started_count = 0
+    shutdown_at = None
+
+    def on_start(event, context):
+        nonlocal started_count, shutdown_at
+        started_count += 1
+        if started_count == number_of_processes:
+            shutdown_at = time.perf_counter()
+            return launch.actions.Shutdown(reason='all processes started')
+        return None
+
+    if ignore_sigint:
+        # Ignored signals stay ignored once sleep is executed.
+        cmd = ['sh', '-c', "trap '' INT; exec sleep 60"]
+    else:
+        cmd = ['sleep', '60']
+    ls.include_launch_description(launch.LaunchDescription([
+        launch.actions.RegisterEventHandler(OnProcessStart(on_start=on_start)),
+    ] + [
+        launch.actions.ExecuteProcess(
+            cmd=cmd,
+            name='sleeper_{}'.format(i),
+            output='log',
+            sigterm_timeout=str(sigterm_timeout),
+        )
+        for i in range(number_of_processes)
+    ]))
+    ls.run()
+    if shutdown_at is None:
+        return None
+    return time.perf_counter() - shutdown_at
+
+
+def main(argv=sys.argv[1:]):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--processes', type=int, nargs='+', default=[100, 500])
+    parser.add_argument('--ignore-sigint', action='store_true')
+    parser.add_argument('--sigterm-timeout', type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    print('ignore SIGINT: {}, SIGTERM timeout: {} s'.format(
+        args.ignore_sigint, args.sigterm_timeout))
+    for number_of_processes in args.processes:
+        elapsed = run(number_of_processes, args.ignore_sigint, args.sigterm_timeout)
+        if elapsed is None:
+            print('processes: {}, not all started'.format(number_of_processes))
+            return 1
+        print('processes: {}, all shut down in {:.3f} s'.format(number_of_processes, elapsed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the latency from a SIGINT to launch until the first child process receives SIGINT.
+
+Several processes flood their stdout while launch is running, so that SIGINT is
+received while the launch event queue is full of process output events.
+Each child process records when it receives SIGINT, and the earliest of those
+times is compared against the time the launch process was sent SIGINT.
+
+Usage: python3 shutdown_latency.py [--processes N] [--load-time SECONDS]
+"""
+
+import argparse
+import os
+import signal
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))  # noqa
+
+import launch  # noqa: E402
+
+# Floods stdout until SIGINT is received, at which point the (monotonic, system-wide on
+# Linux) time of reception is written to the file given as first argument.
+CHILD_SCRIPT = """
+import os, signal, sys, time
+def on_sigint(signum, frame):
+    now = time.monotonic()
+    with open(sys.argv[1], 'w') as f:
+        f.write(repr(now))
+    os._exit(0)
+signal.signal(signal.SIGINT, on_sigint)
+chunk = ('x' * 79 + '\\n') * 64
+while True:
+    sys.stdout.write(chunk)
+    sys.stdout.flush()
+"""
+
+
+def generate_launch_description(number_of_processes, output_directory):
+    return launch.LaunchDescription([
+        launch.actions.ExecuteProcess(
+            cmd=[
+                sys.executable, '-c', CHILD_SCRIPT,
+                os.path.join(output_directory, 'sigint_{}'.format(i)),
+            ],
+            name='flooder_{}'.format(i),
+            output='log',
+        )
+        for i in range(number_of_processes)
+    ])
+
+
+def main(argv=sys.argv[1:]):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--processes', type=int, default=20)
+    parser.add_argument('--load-time', type=float, default=3.0)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as output_directory:
+        # noninteractive, so that launch forwards SIGINT to its children itself.
+        ls = launch.LaunchService(noninteractive=True)
+        ls.include_launch_description(
+            generate_launch_description(args.processes, output_directory))
+
+        sigint_sent_at = None
+
+        def send_sigint():
+            nonlocal sigint_sent_at
+            sigint_sent_at = time.monotonic()
+            os.kill(os.getpid(), signal.SIGINT)
+
+        timer = threading.Timer(args.load_time, send_sigint)
+        timer.start()
+        ls.run()
+        timer.join()
+
+        received_at = []
+        for filename in os.listdir(output_directory):
+            with open(os.path.join(output_directory, filename), 'r') as f:
+                received_at.append(float(f.read()))
+
+    if not received_at:
+        print('no child process recorded receiving SIGINT')
+        return 1
+    print('processes: {}, received SIGINT: {}'.format(args.processes, len(received_at)))
+    print('SIGINT to first child SIGINT: {:.3f} ms'.format(
+        (min(received_at) - sigint_sent_at) * 1e3))
+    print('SIGINT to last child SIGINT: {:.3f} ms'.format(
+        (max(received_at) - sigint_sent_at) * 1e3))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
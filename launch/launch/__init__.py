@@ -37,6 +37,7 @@ from .some_actions_type import SomeActionsType_types_tuple
 from .some_substitutions_type import SomeSubstitutionsType
 from .some_substitutions_type import SomeSubstitutionsType_types_tuple
 from .substitution import Substitution
+from .tracer import Tracer
 
 __all__ = [
     'actions',
@@ -62,4 +63,5 @@ __all__ = [
     'SomeSubstitutionsType',
     'SomeSubstitutionsType_types_tuple',
     'Substitution',
+    'Tracer',
 ]
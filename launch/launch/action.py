@@ -109,14 +109,17 @@ class Action(LaunchDescriptionEntity):
             finally:
                 from .events import ExecutionComplete  # noqa
                 event = ExecutionComplete(action=self)
-                if context.would_handle_event(event):
-                    future = self.get_asyncio_future()
-                    if future is not None:
-                        future.add_done_callback(
-                            lambda _: context.emit_event_sync(event)
-                        )
-                    else:
-                        context.emit_event_sync(event)
+                would_handle_event = context.would_handle_event(event)
+                future = self.get_asyncio_future()
+                if future is not None:
+                    # Event handlers registered on behalf of this action are unregistered
+                    # once this event is processed, see LaunchContext.register_event_handler().
+                    def on_done(_):
+                        if would_handle_event or context._has_event_handlers_owned_by(self):
+                            context.emit_event_sync(event)
+                    future.add_done_callback(on_done)
+                elif would_handle_event or context._has_event_handlers_owned_by(self):
+                    context.emit_event_sync(event)
         return None
 
     def execute(self, context: LaunchContext) -> Optional[List[LaunchDescriptionEntity]]:
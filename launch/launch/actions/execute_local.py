@@ -15,21 +15,27 @@
 """Module for the ExecuteLocal action."""
 
 import asyncio
-import io
-import logging
+import collections
 import os
 import platform
+import random
+import re
 import signal
 import threading
+import time
 import traceback
 from typing import Any  # noqa: F401
 from typing import Callable
 from typing import cast
+from typing import Deque  # noqa: F401
 from typing import Dict
+from typing import Iterable
 from typing import List
+from typing import Mapping
 from typing import Optional
 from typing import Text
-from typing import Tuple  # noqa: F401
+from typing import Tuple
+from typing import Type
 from typing import Union
 
 import launch.logging
@@ -37,9 +43,7 @@ import launch.logging
 from osrf_pycommon.process_utils import async_execute_process
 from osrf_pycommon.process_utils import AsyncSubprocessProtocol
 
-from .emit_event import EmitEvent
 from .opaque_function import OpaqueFunction
-from .timer_action import TimerAction
 
 from ..action import Action
 from ..conditions import evaluate_condition_expression
@@ -50,11 +54,12 @@ from ..event_handlers import OnProcessExit
 from ..event_handlers import OnProcessIO
 from ..event_handlers import OnProcessStart
 from ..event_handlers import OnShutdown
-from ..events import matches_action
 from ..events import Shutdown
 from ..events.process import ProcessExited
 from ..events.process import ProcessIO
+from ..events.process import ProcessRespawnLimitReached
 from ..events.process import ProcessStarted
+from ..events.process import ProcessStats
 from ..events.process import ProcessStderr
 from ..events.process import ProcessStdin
 from ..events.process import ProcessStdout
@@ -63,15 +68,26 @@ from ..events.process import SignalProcess
 from ..launch_context import LaunchContext
 from ..launch_description import LaunchDescription
 from ..launch_description_entity import LaunchDescriptionEntity
+from ..process_groups import ProcessGroups
+from ..shutdown_supervisor import ShutdownEscalation  # noqa: F401
 from ..some_actions_type import SomeActionsType
 from ..some_substitutions_type import SomeSubstitutionsType
+from ..start_scheduler import StartSlot  # noqa: F401
 from ..substitution import Substitution  # noqa: F401
 from ..substitutions import LaunchConfiguration
-from ..substitutions import PythonExpression
+from ..utilities import CachedOutput
+from ..utilities import compile_output_format
 from ..utilities import create_future
+from ..utilities import ensure_argument_type
 from ..utilities import is_a_subclass
+from ..utilities import LineRateLimiter
+from ..utilities import LineSplitter
 from ..utilities import normalize_to_list_of_substitutions
+from ..utilities import OutputPump
 from ..utilities import perform_substitutions
+from ..utilities import ProcessPipe
+from ..utilities import ProcessResources
+from ..utilities import RepeatedLineCollapser
 
 _global_process_counter_lock = threading.Lock()
 _global_process_counter = 0  # in Python3, this number is unbounded (no rollover)
@@ -93,6 +109,13 @@ class ExecuteLocal(Action):
         output: SomeSubstitutionsType = 'log',
         output_format: Text = '[{this.process_description.final_name}] {line}',
         cached_output: bool = False,
+        cached_output_size_limit: Optional[int] = None,
+        direct_output: bool = False,
+        direct_output_timestamps: bool = False,
+        output_rate_limit: Optional[float] = None,
+        output_rate_burst: Optional[int] = None,
+        collapse_repeated_output: bool = False,
+        output_filter_summary_period: float = 60.0,
         log_cmd: bool = False,
         on_exit: Optional[Union[
             SomeActionsType,
@@ -100,6 +123,18 @@ class ExecuteLocal(Action):
         ]] = None,
         respawn: bool = False,
         respawn_delay: Optional[float] = None,
+        respawn_backoff: float = 1.0,
+        respawn_max_delay: Optional[float] = None,
+        respawn_jitter: float = 0.0,
+        respawn_max_restarts: Optional[int] = None,
+        respawn_restart_window: float = 60.0,
+        ready_pattern: Optional[Text] = None,
+        cpu_affinity: Optional[Iterable[int]] = None,
+        cpu_affinity_round_robin: bool = False,
+        nice: Optional[int] = None,
+        rlimits: Optional[Mapping[Text, Union[int, Tuple[int, int]]]] = None,
+        stdin_file: Optional[SomeSubstitutionsType] = None,
+        stdin_from: Optional['ExecuteLocal'] = None,
         **kwargs
     ) -> None:
         """
@@ -179,11 +214,78 @@ class ExecuteLocal(Action):
             process, which is useful for debugging when substitutions are
             involved.
         :param: cached_output if `True`, both stdout and stderr will be cached.
-            Use get_stdout() and get_stderr() to read the buffered output.
+            Use get_stdout() and get_stderr() to read the buffered output, or
+            read_stdout() and read_stderr() to read it incrementally.
+        :param: cached_output_size_limit maximum number of characters of stdout,
+            and of stderr, to cache, discarding the oldest output first.
+            Defaults to None, i.e. to caching all the output.
+        :param: direct_output if True, output that is only configured to go to the
+            process own log files ('own_log') is written to those files without going
+            through launch: the process is either handed the log file directly, or a
+            pipe that a separate thread copies to the log files.
+            No ProcessStdout and ProcessStderr events are emitted for that output, and
+            the output_format is not applied.
+            Output is still handled as usual if, when the process starts, any other
+            event handler matches the process output events, e.g. an OnProcessIO
+            event handler targeting this action.
+            Has no effect if emulating a tty, caching output or if ready_pattern is set.
+        :param: direct_output_timestamps if True, each line of output that is written
+            directly to log files is prefixed with the time it was read at.
+        :param: output_rate_limit maximum number of lines of output, of stdout and
+            stderr combined, logged per second on average, lines beyond it are dropped.
+            Defaults to None, i.e. to no limit.
+        :param: output_rate_burst maximum number of lines of output logged at once,
+            when output_rate_limit is set. Defaults to one second worth of lines.
+        :param: collapse_repeated_output if True, identical consecutive lines of
+            output are logged once, followed by a 'last message repeated N times'
+            line.
+        :param: output_filter_summary_period minimum time in seconds between two
+            reports of the number of lines dropped or collapsed, while output is
+            produced. Those numbers are also reported when the process exits.
         :param: on_exit list of actions to execute upon process exit.
         :param: respawn if 'True', relaunch the process that abnormally died.
             Defaults to 'False'.
         :param: respawn_delay a delay time to relaunch the died process if respawn is 'True'.
+        :param: respawn_backoff factor the respawn delay is multiplied by for each
+            consecutive respawn of a process that ran for less than respawn_restart_window.
+            Defaults to 1.0, i.e. to a fixed respawn delay. Requires a positive
+            respawn_delay if greater than 1.0.
+        :param: respawn_max_delay maximum respawn delay, before jitter is applied.
+            Defaults to None, i.e. to no maximum.
+        :param: respawn_jitter fraction of the respawn delay by which each delay is
+            randomly shortened or lengthened, between 0.0 (default) and 1.0.
+        :param: respawn_max_restarts maximum number of respawns within
+            respawn_restart_window, beyond which the process is no longer respawned and
+            a launch.events.process.ProcessRespawnLimitReached event is emitted.
+            Defaults to None, i.e. to no limit.
+        :param: respawn_restart_window time window in seconds over which respawns are
+            counted against respawn_max_restarts, and that a process must run for to
+            reset the respawn backoff. Defaults to 60 seconds.
+        :param: ready_pattern regular expression matching a line of output that signals
+            the process is ready. Processes wait for the launch-wide start scheduler to
+            admit them before starting, and are considered starting until they are ready,
+            or until the start ready timeout expires, see :class:`launch.LaunchService`.
+            Defaults to None, i.e. to processes being considered started once running.
+        :param: cpu_affinity CPUs the process may run on. Only supported on Linux.
+            Defaults to None, i.e. to the CPUs of the launch process.
+        :param: cpu_affinity_round_robin if True, the process runs on a single CPU of
+            cpu_affinity, the next one for each process given the same CPUs, launch-wide.
+        :param: nice nice value of the process, between -20 and 19.
+            Defaults to None, i.e. to the nice value of the launch process.
+        :param: rlimits resource limits of the process, by resource name, e.g. 'as',
+            'nofile' or 'core' for RLIMIT_AS, RLIMIT_NOFILE and RLIMIT_CORE, each limit
+            being either a soft limit or a tuple of soft and hard limits.
+            CPU affinity, nice value and resource limits are applied by launch right
+            after the process started, or in the process before it executes its program
+            where they cannot be applied to another process, see ProcessResources.
+        :param: stdin_file path of a file the process reads as its standard input,
+            instead of a pipe written to by launch, see write_stdin().
+        :param: stdin_from action of another process whose standard output is the
+            standard input of the process, through a pipe that launch does not read,
+            so that the output of that process is neither logged nor emitted as events.
+            The process reads the end of its input once that action is complete.
+            Processes reading from a file or from another process, or writing to
+            another process, do not emulate a tty.
         """
         super().__init__(**kwargs)
         self.__process_description = process_description
@@ -194,22 +296,101 @@ class ExecuteLocal(Action):
         self.__output = os.environ.get('OVERRIDE_LAUNCH_PROCESS_OUTPUT', output)
         self.__output = normalize_to_list_of_substitutions(self.__output)
         self.__output_format = output_format
+        # Compiled output format, see compile_output_format().
+        self.__format_output_line = \
+            lambda line: output_format.format(line=line, this=self)  # type: Callable[[Text], Text]
 
         self.__log_cmd = log_cmd
         self.__cached_output = cached_output
+        self.__direct_output = direct_output
+        self.__direct_output_timestamps = direct_output_timestamps
+        # Log files that output can be written to directly, for each source.
+        self.__direct_output_files = {}  # type: Dict[Text, List[Text]]
+        self.__process_io_event_handler = None  # type: Optional[OnProcessIO]
+        # Output filters, applied to output before it is logged.
+        self.__output_rate_limit = output_rate_limit
+        self.__output_rate_burst = output_rate_burst
+        self.__collapse_repeated_output = collapse_repeated_output
+        self.__output_rate_limiter = None  # type: Optional[LineRateLimiter]
+        if output_rate_limit is not None:
+            self.__output_rate_limiter = LineRateLimiter(output_rate_limit, output_rate_burst)
+        self.__stdout_collapser = None  # type: Optional[RepeatedLineCollapser]
+        self.__stderr_collapser = None  # type: Optional[RepeatedLineCollapser]
+        if collapse_repeated_output:
+            self.__stdout_collapser = RepeatedLineCollapser()
+            self.__stderr_collapser = RepeatedLineCollapser()
+        self.__output_filter_summary_period = output_filter_summary_period
+        self.__output_filter_summary_time = time.monotonic()
+        self.__reported_dropped_count = 0
+        self.__reported_collapsed_count = 0
         self.__on_exit = on_exit
         self.__respawn = respawn
+        if respawn_backoff > 1.0 and not respawn_delay:
+            # The delay would stay at 0, and processes exiting right away respawn in a loop.
+            raise ValueError(
+                "'respawn_backoff' greater than 1 requires a positive 'respawn_delay', got "
+                "'{}'".format(respawn_delay))
         self.__respawn_delay = respawn_delay
+        self.__respawn_backoff = respawn_backoff
+        self.__respawn_max_delay = respawn_max_delay
+        self.__respawn_jitter = respawn_jitter
+        self.__respawn_max_restarts = respawn_max_restarts
+        self.__respawn_restart_window = respawn_restart_window
+        # Times of the respawns within the restart window, and the respawn delay backed off
+        # by the respawns of processes that did not run for the restart window.
+        self.__respawn_times = collections.deque()  # type: Deque[float]
+        self.__backed_off_respawn_delay = respawn_delay or 0.0
+        self.__respawn_count = 0
+        self.__respawn_limit_reached = False
+        self.__started_at = None  # type: Optional[float]
+        self.__exited_at = None  # type: Optional[float]
+        self.__ready_pattern = re.compile(ready_pattern) if ready_pattern is not None else None
+        self.__process_resources = ProcessResources(
+            cpu_affinity=cpu_affinity, nice=nice, rlimits=rlimits)
+        if cpu_affinity_round_robin and cpu_affinity is None:
+            raise ValueError("'cpu_affinity_round_robin' requires 'cpu_affinity' to be set")
+        self.__cpu_affinity_round_robin = cpu_affinity_round_robin
+        if stdin_file is not None and stdin_from is not None:
+            raise ValueError("'stdin_file' and 'stdin_from' are mutually exclusive")
+        self.__stdin_file = None  # type: Optional[List[Substitution]]
+        if stdin_file is not None:
+            self.__stdin_file = normalize_to_list_of_substitutions(stdin_file)
+        self.__stdin_from = stdin_from
+        # Pipes connecting the process to other processes, see launch.utilities.ProcessPipe.
+        self.__stdin_pipe = None  # type: Optional[ProcessPipe]
+        self.__stdout_pipe = None  # type: Optional[ProcessPipe]
+        if stdin_from is not None:
+            ensure_argument_type(stdin_from, ExecuteLocal, 'stdin_from', 'ExecuteLocal')
+            if stdin_from.__stdout_pipe is not None:
+                raise ValueError(
+                    "the standard output of the process of 'stdin_from' is already the "
+                    'standard input of another process')
+            self.__stdin_pipe = ProcessPipe()
+            stdin_from.__stdout_pipe = self.__stdin_pipe
+        # Start scheduling, see launch.start_scheduler.
+        self.__max_concurrent_starts = None  # type: Optional[int]
+        self.__start_ready_timeout = None  # type: Optional[float]
+        self.__start_slot_request = None  # type: Optional[asyncio.Future]
+        self.__start_slot = None  # type: Optional[StartSlot]
+        self.__start_ready_timer = None  # type: Optional[asyncio.TimerHandle]
 
         self.__process_event_args = None  # type: Optional[Dict[Text, Any]]
         self._subprocess_protocol = None  # type: Optional[Any]
         self._subprocess_transport = None
         self.__completed_future = None  # type: Optional[asyncio.Future]
         self.__shutdown_future = None  # type: Optional[asyncio.Future]
-        self.__sigterm_timer = None  # type: Optional[TimerAction]
-        self.__sigkill_timer = None  # type: Optional[TimerAction]
-        self.__stdout_buffer = io.StringIO()
-        self.__stderr_buffer = io.StringIO()
+        self.__shutdown_escalation = None  # type: Optional[ShutdownEscalation]
+        # Set while the process runs in its own process group, and while what is left of
+        # that group is shut down, see launch.process_groups.
+        self.__process_groups = None  # type: Optional[ProcessGroups]
+        self.__stdout_splitter = LineSplitter()
+        self.__stderr_splitter = LineSplitter()
+        # Complete lines of output, only kept if cached_output is True.
+        self.__stdout_buffer = CachedOutput(cached_output_size_limit)
+        self.__stderr_buffer = CachedOutput(cached_output_size_limit)
+        self.__backpressure_pause_count = 0
+        self.__backpressure_paused_time = 0.0
+        self.__backpressure_paused_since = None  # type: Optional[float]
 
         self.__executed = False
 
@@ -233,6 +414,116 @@ class ExecuteLocal(Action):
         """Getter for the process details, e.g. name, pid, cmd, etc., or None if not started."""
         return self.__process_event_args
 
+    @property
+    def backpressure_counters(self) -> Dict[Text, Any]:
+        """
+        Getter for the process output flow control counters.
+
+        These count how many times reading the process output was paused because the
+        launch event queue was congested, and for how long in total, in seconds.
+        """
+        paused_time = self.__backpressure_paused_time
+        if self.__backpressure_paused_since is not None:
+            paused_time += time.monotonic() - self.__backpressure_paused_since
+        return {
+            'pause_count': self.__backpressure_pause_count,
+            'paused_time': paused_time,
+            'is_paused': self.__backpressure_paused_since is not None,
+        }
+
+    @property
+    def process_resources(self) -> ProcessResources:
+        """Getter for the CPU affinity, nice value and resource limits of the process."""
+        return self.__process_resources
+
+    @property
+    def stdin_file(self) -> Optional[List[Substitution]]:
+        """Getter for stdin_file."""
+        return self.__stdin_file
+
+    @property
+    def output_rate_limit(self) -> Optional[float]:
+        """Getter for output_rate_limit."""
+        return self.__output_rate_limit
+
+    @property
+    def output_rate_burst(self) -> Optional[int]:
+        """Getter for output_rate_burst."""
+        return self.__output_rate_burst
+
+    @property
+    def collapse_repeated_output(self) -> bool:
+        """Getter for collapse_repeated_output."""
+        return self.__collapse_repeated_output
+
+    @property
+    def stdin_from(self) -> Optional['ExecuteLocal']:
+        """Getter for stdin_from."""
+        return self.__stdin_from
+
+    @property
+    def respawn_counters(self) -> Dict[Text, Any]:
+        """
+        Getter for the process respawn counters.
+
+        These count how many times the process was respawned, how long the current
+        process has been running, or the last one ran for, in seconds, and whether
+        respawning was given up on because of respawn_max_restarts.
+        """
+        uptime = None
+        if self.__started_at is not None:
+            until = self.__exited_at if self.__exited_at is not None else time.monotonic()
+            uptime = until - self.__started_at
+        return {
+            'respawn_count': self.__respawn_count,
+            'uptime': uptime,
+            'respawn_limit_reached': self.__respawn_limit_reached,
+        }
+
+    def _on_output_reading_paused(self) -> None:
+        self.__backpressure_pause_count += 1
+        self.__backpressure_paused_since = time.monotonic()
+
+    def _on_output_reading_resumed(self) -> None:
+        if self.__backpressure_paused_since is not None:
+            self.__backpressure_paused_time += \
+                time.monotonic() - self.__backpressure_paused_since
+            self.__backpressure_paused_since = None
+
+    async def write_stdin(self, data: bytes) -> None:
+        """
+        Write to the standard input of the process, waiting while it does not keep up.
+
+        Data is buffered by launch up to the high-water mark of the pipe transport,
+        64 KiB by default, beyond which this waits for the process to read it, so
+        that writers go at the pace of the process.
+
+        :raises RuntimeError: if the process is not running, or if its standard input
+            is not written to by launch, see stdin_file and stdin_from
+        :raises BrokenPipeError: if the standard input of the process is closed
+        """
+        self.__get_stdin_transport().write(data)
+        await self._subprocess_protocol.drain()
+
+    def close_stdin(self) -> None:
+        """
+        Close the standard input of the process, once what was written to it is flushed.
+
+        :raises RuntimeError: if the process is not running, or if its standard input
+            is not written to by launch
+        """
+        self.__get_stdin_transport().close()
+
+    def __get_stdin_transport(self) -> asyncio.WriteTransport:
+        if self._subprocess_transport is None or self._subprocess_protocol.complete.done():
+            raise RuntimeError('process is not running')
+        stdin = self._subprocess_transport.get_pipe_transport(0)
+        if stdin is None:
+            raise RuntimeError('standard input of the process is not written to by launch')
+        if stdin.is_closing():
+            raise BrokenPipeError('standard input of the process is closed')
+        return stdin
+
     def get_sub_entities(self):
         if isinstance(self.__on_exit, list):
             return self.__on_exit
@@ -253,23 +544,29 @@ class ExecuteLocal(Action):
             self.__shutdown_future.set_result(None)
             return None
 
+        if self.__start_slot_request is not None and not self.__start_slot_request.done():
+            # Waiting to be admitted to start, so the process is never started.
+            self.__start_slot_request.cancel()
+            self.__shutdown_future.set_result(None)
+            return None
+
         # Defer shut down if the process is scheduled to be started
         if (self.process_details is None or self._subprocess_transport is None):
             # Do not set shutdown result, as event is postponed
             context.register_event_handler(
                 OnProcessStart(
                     on_start=lambda event, context:
-                    self._shutdown_process(context, send_sigint=send_sigint)))
+                    self._shutdown_process(context, send_sigint=send_sigint)),
+                owner=self)
             return None
 
         self.__shutdown_future.set_result(None)
 
         # Otherwise process is still running, start the shutdown procedures.
-        context.extend_locals({'process_name': self.process_details['name']})
-        actions_to_return = self.__get_shutdown_timer_actions()
+        self.__supervise_shutdown(context)
         if send_sigint:
-            actions_to_return.append(self.__get_sigint_event())
-        return actions_to_return
+            self.__signal_process(signal.SIGINT)
+        return None
 
     def __on_shutdown_process_event(
         self,
@@ -293,35 +590,42 @@ class ExecuteLocal(Action):
             raise RuntimeError('Signal event received before execution.')
         if self._subprocess_transport is None:
             raise RuntimeError('Signal event received before subprocess transport available.')
-        if self._subprocess_protocol.complete.done():
+        self.__signal_process(typed_event.signal)
+        return None
+
+    def __signal_process(self, signal_to_send: Union[Text, signal.Signals]) -> None:
+        signal_name = signal_to_send if isinstance(signal_to_send, str) else signal_to_send.name
+        if self._subprocess_protocol.complete.done() and self.__process_groups is None:
             # the process is done or is cleaning up, no need to signal
             self.__logger.debug(
                 "signal '{}' not set to '{}' because it is already closing".format(
-                    typed_event.signal_name, self.process_details['name']),
+                    signal_name, self.process_details['name']),
             )
-            return None
-        if platform.system() == 'Windows' and typed_event.signal_name == 'SIGINT':
+            return
+        if platform.system() == 'Windows' and signal_name == 'SIGINT':
             # TODO(wjwwood): remove this when/if SIGINT is fixed on Windows
             self.__logger.warning(
                 "'SIGINT' sent to process[{}] not supported on Windows, escalating to 'SIGTERM'"
                 .format(self.process_details['name']),
             )
-            typed_event = SignalProcess(
-                signal_number=signal.SIGTERM,
-                process_matcher=lambda process: True)
+            signal_to_send, signal_name = signal.SIGTERM, 'SIGTERM'
         self.__logger.info("sending signal '{}' to process[{}]".format(
-            typed_event.signal_name, self.process_details['name']
+            signal_name, self.process_details['name']
         ))
         try:
-            if typed_event.signal_name == 'SIGKILL':
+            if self.__process_groups is not None:
+                # Also to the processes it started, which are in its process group.
+                self.__process_groups.signal(
+                    self._subprocess_transport.get_pid(), getattr(signal, signal_name))
+                return
+            if signal_name == 'SIGKILL':
                 self._subprocess_transport.kill()  # works on both Windows and POSIX
-                return None
-            self._subprocess_transport.send_signal(typed_event.signal)
-            return None
+                return
+            self._subprocess_transport.send_signal(signal_to_send)
         except ProcessLookupError:
             self.__logger.debug(
                 "signal '{}' not sent to '{}' because it has closed already".format(
-                    typed_event.signal_name, self.process_details['name']
+                    signal_name, self.process_details['name']
                 )
             )
 
@@ -329,163 +633,152 @@ class ExecuteLocal(Action):
         self,
         event: ProcessIO
     ) -> Optional[SomeActionsType]:
-        self.__logger.warning(
-            "in ExecuteProcess('{}').__on_process_stdin_event()".format(id(self)),
-        )
-        cast(ProcessStdin, event)
+        # Written without waiting for the process to read it, for small messages,
+        # see write_stdin() otherwise.
+        text = cast(ProcessStdin, event).text
+        if isinstance(text, str):
+            text = text.encode()
+        try:
+            self.__get_stdin_transport().write(text)
+        except (RuntimeError, BrokenPipeError) as exc:
+            self.__logger.warning(
+                'failed to write to the standard input of the process: {}'.format(exc))
         return None
 
     def __on_process_output(
-        self, event: ProcessIO, buffer: io.TextIOBase, logger: logging.Logger
-    ) -> Optional[SomeActionsType]:
-        to_write = event.text.decode(errors='replace')
-        if buffer.closed:
-            # buffer was probably closed by __flush_buffers on shutdown.  Output without
-            # buffering.
-            buffer.info(
-                self.__output_format.format(line=to_write, this=self)
-            )
-        else:
-            buffer.write(to_write)
-            buffer.seek(0)
-            last_line = None
-            for line in buffer:
-                if line.endswith(os.linesep):
-                    logger.info(
-                        self.__output_format.format(line=line[:-len(os.linesep)], this=self)
-                    )
-                else:
-                    last_line = line
-                    break
-            buffer.seek(0)
-            buffer.truncate(0)
-            if last_line is not None:
-                buffer.write(last_line)
-
-    def __flush_buffers(self, event, context):
-        line = self.__stdout_buffer.getvalue()
-        if line != '':
-            self.__stdout_logger.info(
-                self.__output_format.format(line=line, this=self)
-            )
-
-        line = self.__stderr_buffer.getvalue()
-        if line != '':
-            self.__stderr_logger.info(
-                self.__output_format.format(line=line, this=self)
-            )
-
-        # the respawned process needs to reuse these StringIO resources,
-        # close them only after receiving the shutdown
-        if self.__shutdown_future is None or self.__shutdown_future.done():
-            self.__stdout_buffer.close()
-            self.__stderr_buffer.close()
-        else:
-            self.__stdout_buffer.seek(0)
-            self.__stdout_buffer.truncate(0)
-            self.__stderr_buffer.seek(0)
-            self.__stderr_buffer.truncate(0)
-
-    def __on_process_output_cached(
-        self, event: ProcessIO, buffer, logger
+        self,
+        event: ProcessIO,
+        splitter: LineSplitter,
+        buffer: Optional[CachedOutput],
+        write_line: Callable[[Text], None],
+        collapser: Optional[RepeatedLineCollapser]
     ) -> Optional[SomeActionsType]:
-        to_write = event.text.decode(errors='replace')
-        last_cursor = buffer.tell()
-        buffer.seek(0, os.SEEK_END)  # go to end of buffer
-        buffer.write(to_write)
-        buffer.seek(last_cursor)
-        new_cursor = last_cursor
-        for line in buffer:
-            if not line.endswith(os.linesep):
-                break
-            new_cursor = buffer.tell()
-            logger.info(
-                self.__output_format.format(line=line[:-len(os.linesep)], this=self)
-            )
-        buffer.seek(new_cursor)
+        lines = splitter.feed(event.text)
+        if not lines:
+            return None
+        if self.__start_slot is not None and self.__ready_pattern is not None:
+            if any(self.__ready_pattern.search(line) for line in lines):
+                self.__logger.debug('process is ready')
+                self.__release_start_slot()
+        if buffer is not None:
+            buffer.write('\n'.join(lines))
+            buffer.write('\n')
+        filtered = False
+        if collapser is not None:
+            lines = collapser.collapse(lines)
+            filtered = True
+        if self.__output_rate_limiter is not None:
+            lines = self.__output_rate_limiter.filter(lines)
+            filtered = True
+        format_output_line = self.__format_output_line
+        for line in lines:
+            write_line(format_output_line(line))
+        if filtered:
+            now = time.monotonic()
+            if now - self.__output_filter_summary_time >= self.__output_filter_summary_period:
+                self.__log_output_filter_summary(now)
+        return None
 
-    def __flush_cached_buffers(self, event, context):
-        for line in self.__stdout_buffer:
-            self.__stdout_logger.info(
-                self.__output_format.format(line=line, this=self)
-            )
+    def __log_output_filter_summary(self, now: float) -> None:
+        """Log the number of lines of output dropped or collapsed since the last summary."""
+        dropped_count = 0
+        if self.__output_rate_limiter is not None:
+            dropped_count = self.__output_rate_limiter.dropped_count
+        collapsed_count = 0
+        for collapser in (self.__stdout_collapser, self.__stderr_collapser):
+            if collapser is not None:
+                collapsed_count += collapser.collapsed_count
+        new_dropped_count = dropped_count - self.__reported_dropped_count
+        new_collapsed_count = collapsed_count - self.__reported_collapsed_count
+        if new_dropped_count or new_collapsed_count:
+            self.__logger.warning(
+                'output filtered in the last {:.1f} seconds: {} lines dropped by the rate '
+                'limit, {} repeated lines collapsed'.format(
+                    now - self.__output_filter_summary_time,
+                    new_dropped_count,
+                    new_collapsed_count))
+        self.__reported_dropped_count = dropped_count
+        self.__reported_collapsed_count = collapsed_count
+        self.__output_filter_summary_time = now
 
-        for line in self.__stderr_buffer:
-            self.__stderr_logger.info(
-                self.__output_format.format(line=line, this=self)
-            )
+    def __flush_buffers(self, event, context):
+        for splitter, buffer, write_line, collapser in (
+            (
+                self.__stdout_splitter, self.__stdout_buffer, self.__stdout_line_writer,
+                self.__stdout_collapser
+            ),
+            (
+                self.__stderr_splitter, self.__stderr_buffer, self.__stderr_line_writer,
+                self.__stderr_collapser
+            ),
+        ):
+            if collapser is not None:
+                notice = collapser.flush()
+                if notice is not None:
+                    write_line(self.__format_output_line(notice))
+            line = splitter.flush()
+            if line != '':
+                if self.__cached_output:
+                    buffer.write(line)
+                write_line(self.__format_output_line(line))
+        if self.__output_rate_limiter is not None or self.__stdout_collapser is not None:
+            self.__log_output_filter_summary(time.monotonic())
 
     def __on_shutdown(self, event: Event, context: LaunchContext) -> Optional[SomeActionsType]:
         due_to_sigint = cast(Shutdown, event).due_to_sigint
+        # Processes in their own process group do not receive the SIGINT of the terminal.
         return self._shutdown_process(
             context,
-            send_sigint=not due_to_sigint or context.noninteractive,
-        )
-
-    def __get_shutdown_timer_actions(self) -> List[Action]:
-        base_msg = \
-            "process[{}] failed to terminate '{}' seconds after receiving '{}', escalating to '{}'"
-
-        def printer(context, msg, timeout_substitutions):
-            self.__logger.error(msg.format(
-                context.locals.process_name,
-                perform_substitutions(context, timeout_substitutions),
-            ))
-
-        sigterm_timeout = self.__sigterm_timeout
-        sigkill_timeout = [PythonExpression(
-            ('float(', *self.__sigterm_timeout, ') + float(', *self.__sigkill_timeout, ')')
-        )]
-        # Setup a timer to send us a SIGTERM if we don't shutdown quickly.
-        self.__sigterm_timer = TimerAction(
-            period=sigterm_timeout,
-            actions=[
-                OpaqueFunction(
-                    function=printer,
-                    args=(base_msg.format('{}', '{}', 'SIGINT', 'SIGTERM'), sigterm_timeout)
-                ),
-                EmitEvent(event=SignalProcess(
-                    signal_number=signal.SIGTERM,
-                    process_matcher=matches_action(self)
-                )),
-            ],
-            cancel_on_shutdown=False,
-        )
-        # Setup a timer to send us a SIGKILL if we don't shutdown after SIGTERM.
-        self.__sigkill_timer = TimerAction(
-            period=sigkill_timeout,
-            actions=[
-                OpaqueFunction(
-                    function=printer,
-                    args=(base_msg.format('{}', '{}', 'SIGTERM', 'SIGKILL'), sigkill_timeout)
-                ),
-                EmitEvent(event=SignalProcess(
-                    signal_number='SIGKILL',
-                    process_matcher=matches_action(self)
-                ))
-            ],
-            cancel_on_shutdown=False,
+            send_sigint=(
+                not due_to_sigint or context.noninteractive or self.__process_groups is not None
+            ),
         )
-        return [
-            cast(Action, self.__sigterm_timer),
-            cast(Action, self.__sigkill_timer),
-        ]
 
-    def __get_sigint_event(self):
-        return EmitEvent(event=SignalProcess(
-            signal_number=signal.SIGINT,
-            process_matcher=matches_action(self),
-        ))
+    def __supervise_shutdown(self, context: LaunchContext) -> None:
+        """Have the launch-wide shutdown supervisor escalate to SIGTERM, then to SIGKILL."""
+        sigterm_timeout = float(perform_substitutions(context, self.__sigterm_timeout))
+        sigkill_timeout = float(perform_substitutions(context, self.__sigkill_timeout))
+        name = self.process_details['name']
+
+        def escalate(signal_name: Text, timeout: float) -> None:
+            self.__logger.error(
+                "process[{}] failed to terminate '{}' seconds after receiving '{}', "
+                "escalating to '{}'".format(
+                    name, timeout, 'SIGINT' if signal_name == 'SIGTERM' else 'SIGTERM',
+                    signal_name))
+            self.__signal_process(signal.SIGTERM if signal_name == 'SIGTERM' else 'SIGKILL')
+
+        self.__shutdown_escalation = context._shutdown_supervisor.supervise(
+            context.asyncio_loop, escalate, sigterm_timeout, sigkill_timeout)
+
+    def __release_start_slot(self) -> None:
+        if self.__start_ready_timer is not None:
+            self.__start_ready_timer.cancel()
+            self.__start_ready_timer = None
+        if self.__start_slot is not None:
+            self.__start_slot.release()
+            self.__start_slot = None
+
+    def __on_start_ready_timeout(self) -> None:
+        self.__start_ready_timer = None
+        self.__logger.warning(
+            'process not ready after {} seconds, no longer considered starting'.format(
+                self.__start_ready_timeout))
+        self.__release_start_slot()
 
     def __cleanup(self):
-        # Cancel any pending timers we started.
-        if self.__sigterm_timer is not None:
-            self.__sigterm_timer.cancel()
-        if self.__sigkill_timer is not None:
-            self.__sigkill_timer.cancel()
+        self.__release_start_slot()
+        # Stop escalating the shutdown of the process, if it was shut down.
+        if self.__shutdown_escalation is not None:
+            self.__shutdown_escalation.cancel()
         # Close subprocess transport if any.
         if self._subprocess_transport is not None:
             self._subprocess_transport.close()
+        # No process is started with the pipes to other processes anymore.
+        if self.__stdin_pipe is not None:
+            self.__stdin_pipe.close_read_end()
+        if self.__stdout_pipe is not None:
+            self.__stdout_pipe.close_write_end()
         # Signal that we're done to the launch system.
         self.__completed_future.set_result(None)
 
@@ -498,9 +791,15 @@ class ExecuteLocal(Action):
             **kwargs
         ) -> None:
             super().__init__(**kwargs)
+            self.__action = action
             self.__context = context
             self.__process_event_args = process_event_args
             self.__logger = launch.logging.get_logger(process_event_args['name'])
+            self.__reading_paused = False
+            # Flow control of the standard input of the process, see drain().
+            self.__writing_paused = False
+            self.__stdin_closed = False
+            self.__drain_waiters = []  # type: List[asyncio.Future]
 
         def connection_made(self, transport):
             self.__logger.info(
@@ -511,15 +810,193 @@ class ExecuteLocal(Action):
 
         def on_stdout_received(self, data: bytes) -> None:
             self.__context.emit_event_sync(ProcessStdout(text=data, **self.__process_event_args))
+            if not self.__reading_paused and self.__context._is_event_queue_congested():
+                self.__pause_reading()
 
         def on_stderr_received(self, data: bytes) -> None:
             self.__context.emit_event_sync(ProcessStderr(text=data, **self.__process_event_args))
+            if not self.__reading_paused and self.__context._is_event_queue_congested():
+                self.__pause_reading()
+
+        def pause_writing(self) -> None:
+            self.__writing_paused = True
+
+        def resume_writing(self) -> None:
+            self.__writing_paused = False
+            self.__wake_drain_waiters()
+
+        def pipe_connection_lost(self, fd: int, exc: Optional[Exception]) -> None:
+            super().pipe_connection_lost(fd, exc)
+            if fd == 0:
+                self.__stdin_closed = True
+                self.__wake_drain_waiters()
+
+        async def drain(self) -> None:
+            """Wait until what was written to the standard input is below the high-water mark."""
+            if self.__writing_paused and not self.__stdin_closed:
+                waiter = asyncio.get_running_loop().create_future()
+                self.__drain_waiters.append(waiter)
+                await waiter
+            if self.__stdin_closed:
+                raise BrokenPipeError('standard input of the process is closed')
+
+        def __wake_drain_waiters(self) -> None:
+            waiters, self.__drain_waiters = self.__drain_waiters, []
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+        def __get_read_transports(self) -> List[asyncio.ReadTransport]:
+            read_transports = []
+            # When emulating a tty, output is read from pty's through separate transports.
+            for pipe, pty_tuple in (
+                (self.stdout, getattr(self, 'stdout_tuple', None)),
+                (self.stderr, getattr(self, 'stderr_tuple', None)),
+            ):
+                if pty_tuple is not None:
+                    read_transports.append(pty_tuple[0])
+                elif isinstance(pipe, asyncio.ReadTransport):
+                    read_transports.append(pipe)
+            return read_transports
+
+        def __pause_reading(self) -> None:
+            # Stop reading output until the launch event queue drains, the process will
+            # then block on writes once the pipe buffers are full.
+            for read_transport in self.__get_read_transports():
+                read_transport.pause_reading()
+            self.__reading_paused = True
+            self.__action._on_output_reading_paused()
+            self.__context._add_resume_callback(self.__resume_reading)
+
+        def __resume_reading(self) -> None:
+            for read_transport in self.__get_read_transports():
+                read_transport.resume_reading()
+            self.__reading_paused = False
+            self.__action._on_output_reading_resumed()
+
+    def __get_direct_output_files(
+        self,
+        context: LaunchContext,
+        process_event_args: Dict[Text, Any]
+    ) -> Dict[Text, List[Text]]:
+        """Get the log files to write output to directly, for each source."""
+        if not self.__direct_output_files:
+            return {}
+        probe_event_args = dict(process_event_args, pid=None)
+        direct_output_files = {}
+        for source, event_type in (('stdout', ProcessStdout), ('stderr', ProcessStderr)):
+            if source not in self.__direct_output_files:
+                continue
+            # Output goes through launch if anything else subscribes to it.
+            probe_event = event_type(text=b'', **probe_event_args)
+            if any(
+                event_handler is not self.__process_io_event_handler and
+                event_handler.matches(probe_event)
+                for event_handler in context._event_handlers.candidates(probe_event)
+            ):
+                continue
+            direct_output_files[source] = self.__direct_output_files[source]
+        return direct_output_files
+
+    async def __spawn_process(
+        self,
+        context: LaunchContext,
+        process_event_args: Dict[Text, Any],
+        *,
+        stdin: int = asyncio.subprocess.PIPE,
+        stdout: int = asyncio.subprocess.PIPE,
+        stderr: int = asyncio.subprocess.PIPE
+    ) -> Tuple[asyncio.SubprocessTransport, AsyncSubprocessProtocol]:
+        def protocol_factory():
+            return self.__ProcessProtocol(self, context, process_event_args)
+        cmd = process_event_args['cmd']
+        kwargs = {
+            'cwd': process_event_args['cwd'],
+            'env': process_event_args['env'],
+            'stdin': stdin,
+            'stdout': stdout,
+            'stderr': stderr,
+        }
+        preexec_fn = None
+        process_resources = self.__process_resources
+        if not process_resources.empty and not process_resources.applies_to_other_processes:
+            # Resources are otherwise applied right after the process is started.
+            preexec_fn = process_resources.apply
+        if platform.system() != 'Windows':
+            preexec_fn = context._process_groups.get_preexec_fn(preexec_fn)
+        if preexec_fn is not None:
+            kwargs['preexec_fn'] = preexec_fn
+        if platform.system() != 'Windows':
+            # Start the process from a separate thread, concurrently with others.
+            return await context._process_spawner.spawn(
+                context.asyncio_loop, protocol_factory, cmd, shell=self.__shell,
+                new_process_group=context._process_groups.enabled, **kwargs)
+        if self.__shell:
+            return await context.asyncio_loop.subprocess_shell(
+                protocol_factory, ' '.join(cmd), **kwargs)
+        return await context.asyncio_loop.subprocess_exec(
+            protocol_factory, *cmd, **kwargs)
+
+    async def __execute_process_with_direct_output(
+        self,
+        context: LaunchContext,
+        process_event_args: Dict[Text, Any],
+        direct_output_files: Dict[Text, List[Text]],
+        *,
+        stdin: int = asyncio.subprocess.PIPE,
+        stdout: int = asyncio.subprocess.PIPE
+    ) -> Tuple[asyncio.SubprocessTransport, AsyncSubprocessProtocol]:
+        targets = {'stdout': stdout, 'stderr': asyncio.subprocess.PIPE}  # type: Dict[Text, int]
+        pumps = []  # type: List[OutputPump]
+        fds_to_close = []  # type: List[int]
+        try:
+            for source in ('stdout', 'stderr'):
+                if source not in direct_output_files:
+                    continue
+                file_paths = [
+                    launch.logging.launch_config.get_log_file_path(file_name)
+                    for file_name in direct_output_files[source]
+                ]
+                if len(file_paths) == 1 and not self.__direct_output_timestamps:
+                    fd = os.open(file_paths[0], os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                else:
+                    read_fd, fd = os.pipe()
+                    pumps.append(OutputPump(
+                        read_fd, file_paths, timestamps=self.__direct_output_timestamps))
+                fds_to_close.append(fd)
+                targets[source] = fd
+
+            result = await self.__spawn_process(
+                context, process_event_args,
+                stdin=stdin, stdout=targets['stdout'], stderr=targets['stderr'])
+        except Exception:
+            for pump in pumps:
+                pump.close()
+            raise
+        finally:
+            # The process has its own copies of these, if it was started.
+            for fd in fds_to_close:
+                os.close(fd)
+        for pump in pumps:
+            pump.start()
+        return result
 
     async def __execute_process(self, context: LaunchContext) -> None:
         process_event_args = self.__process_event_args
         if process_event_args is None:
             raise RuntimeError('process_event_args unexpectedly None')
 
+        self.__start_slot_request = asyncio.ensure_future(
+            context._start_scheduler.acquire(self.__max_concurrent_starts))
+        try:
+            self.__start_slot = await self.__start_slot_request
+        except asyncio.CancelledError:
+            # Shut down while waiting to start.
+            self.__cleanup()
+            return
+        finally:
+            self.__start_slot_request = None
+
         cmd = process_event_args['cmd']
         cwd = process_event_args['cwd']
         env = process_event_args['env']
@@ -528,6 +1005,12 @@ class ExecuteLocal(Action):
                 ', '.join(cmd), cwd, 'True' if env is not None else 'False'
             ))
 
+        # Resolve what does not change for the lifetime of the process once,
+        # instead of for every line of output.
+        self.__format_output_line = compile_output_format(self.__output_format, self)
+        self.__stdout_line_writer = launch.logging.get_output_line_writer(self.__stdout_logger)
+        self.__stderr_line_writer = launch.logging.get_output_line_writer(self.__stderr_logger)
+
         emulate_tty = self.__emulate_tty
         if 'emulate_tty' in context.launch_configurations:
             emulate_tty = evaluate_condition_expression(
@@ -537,31 +1020,115 @@ class ExecuteLocal(Action):
                 ),
             )
 
+        if emulate_tty and (
+            self.__stdin_file is not None or
+            self.__stdin_pipe is not None or
+            self.__stdout_pipe is not None
+        ):
+            self.__logger.warning(
+                'not emulating a tty, since the process reads from a file or another '
+                'process, or writes to another process')
+            emulate_tty = False
+
+        direct_output_files = {}  # type: Dict[Text, List[Text]]
+        if not emulate_tty:
+            direct_output_files = self.__get_direct_output_files(context, process_event_args)
+            if self.__stdout_pipe is not None:
+                direct_output_files.pop('stdout', None)
+
+        # Standard input and output connected directly to a file or to other processes.
+        stdin = asyncio.subprocess.PIPE  # type: int
+        stdout = asyncio.subprocess.PIPE  # type: int
+        stdin_file_fd = None  # type: Optional[int]
         try:
-            transport, self._subprocess_protocol = await async_execute_process(
-                lambda **kwargs: self.__ProcessProtocol(
-                    self, context, process_event_args, **kwargs
-                ),
-                cmd=cmd,
-                cwd=cwd,
-                env=env,
-                shell=self.__shell,
-                emulate_tty=emulate_tty,
-                stderr_to_stdout=False,
-            )
+            if self.__stdin_pipe is not None:
+                stdin = self.__stdin_pipe.get_read_end()
+            if self.__stdout_pipe is not None:
+                stdout = self.__stdout_pipe.get_write_end()
+            if self.__stdin_file is not None:
+                stdin = stdin_file_fd = os.open(
+                    perform_substitutions(context, self.__stdin_file),
+                    os.O_RDONLY | os.O_CLOEXEC)
+            if direct_output_files:
+                transport, self._subprocess_protocol = \
+                    await self.__execute_process_with_direct_output(
+                        context, process_event_args, direct_output_files,
+                        stdin=stdin, stdout=stdout)
+            elif not emulate_tty:
+                transport, self._subprocess_protocol = await self.__spawn_process(
+                    context, process_event_args, stdin=stdin, stdout=stdout)
+            else:
+                # Output is read from pseudo-terminals, which osrf_pycommon sets up.
+                transport, self._subprocess_protocol = await async_execute_process(
+                    lambda **kwargs: self.__ProcessProtocol(
+                        self, context, process_event_args, **kwargs
+                    ),
+                    cmd=cmd,
+                    cwd=cwd,
+                    env=env,
+                    shell=self.__shell,
+                    emulate_tty=emulate_tty,
+                    stderr_to_stdout=False,
+                )
         except Exception:
             self.__logger.error('exception occurred while executing process:\n{}'.format(
                 traceback.format_exc()
             ))
             self.__cleanup()
             return
+        finally:
+            # The process has its own copy of it, if it was started.
+            if stdin_file_fd is not None:
+                os.close(stdin_file_fd)
 
         pid = transport.get_pid()
         self._subprocess_transport = transport
+        context.process_table.set_pid(self, pid)
+        if context._process_groups.enabled:
+            if emulate_tty:
+                # Processes with a pseudo-terminal are started by osrf_pycommon.
+                self.__logger.debug('process not started in its own process group')
+            else:
+                self.__process_groups = context._process_groups
+                self.__process_groups.add(pid)
+        process_resources = self.__process_resources
+        if not process_resources.empty and (
+            emulate_tty or process_resources.applies_to_other_processes
+        ):
+            # Applied from here rather than before the process executes its program, see
+            # ProcessResources, and processes with a pseudo-terminal are started by
+            # osrf_pycommon.
+            try:
+                process_resources.apply(pid)
+            except OSError as exc:
+                self.__logger.warning(
+                    'failed to apply CPU affinity, nice value or resource limits: {}'.format(
+                        exc))
+        self.__started_at = time.monotonic()
+        self.__exited_at = None
+
+        if self.__ready_pattern is None:
+            self.__release_start_slot()
+        elif self.__start_slot is not None and self.__start_ready_timeout is not None:
+            self.__start_ready_timer = context.asyncio_loop.call_later(
+                self.__start_ready_timeout, self.__on_start_ready_timeout)
 
         await context.emit_event(ProcessStarted(**process_event_args))
+        context._process_stats_sampler.add(pid, lambda stats: context.emit_event_sync(
+            ProcessStats(**stats, **process_event_args)))
 
         returncode = await self._subprocess_protocol.complete
+        self.__exited_at = time.monotonic()
+        context._process_stats_sampler.remove(pid)
+        context.process_table.set_pid(self, None)
+        if self.__process_groups is not None and not (
+            context.is_shutdown or self.__shutdown_future.done()
+        ):
+            # Processes left in its process group keep running until launch is done,
+            # see LaunchService, and are otherwise shut down below.
+            self.__process_groups.release(context.asyncio_loop, pid)
+            self.__process_groups = None
+        self.__release_start_slot()
         if returncode == 0:
             self.__logger.info('process has finished cleanly [pid {}]'.format(pid))
         else:
@@ -571,19 +1138,74 @@ class ExecuteLocal(Action):
         await context.emit_event(ProcessExited(returncode=returncode, **process_event_args))
         # respawn the process if necessary
         if not context.is_shutdown and not self.__shutdown_future.done() and self.__respawn:
-            if self.__respawn_delay is not None and self.__respawn_delay > 0.0:
-                # wait for a timeout(`self.__respawn_delay`) to respawn the process
+            respawn_delay = self.__get_respawn_delay(self.__exited_at - self.__started_at)
+            if respawn_delay is None:
+                self.__respawn_limit_reached = True
+                self.__logger.error(
+                    'process respawned {} times within {} seconds, no longer respawning it'
+                    .format(len(self.__respawn_times), self.__respawn_restart_window))
+                await context.emit_event(ProcessRespawnLimitReached(
+                    respawn_count=self.__respawn_count,
+                    restart_window=self.__respawn_restart_window,
+                    **process_event_args))
+                self.__cleanup()
+                return
+            if respawn_delay > 0.0:
+                # wait for a timeout(`respawn_delay`) to respawn the process
                 # and handle shutdown event with future(`self.__shutdown_future`)
                 # to make sure `ros2 launch` exit in time
                 await asyncio.wait(
                     (self.__shutdown_future,),
-                    timeout=self.__respawn_delay
+                    timeout=respawn_delay
                 )
             if not self.__shutdown_future.done():
+                self.__respawn_count += 1
                 context.asyncio_loop.create_task(self.__execute_process(context))
                 return
+        if self.__process_groups is not None:
+            await self.__shut_down_process_group(context, pid)
         self.__cleanup()
 
+    async def __shut_down_process_group(self, context: LaunchContext, pgid: int) -> None:
+        """Wait for what is left of the process group to exit, escalating its shutdown."""
+        process_groups = cast(ProcessGroups, self.__process_groups)
+        process_groups.reap(pgid)
+        if pgid in process_groups and self.__shutdown_escalation is None:
+            # The process exited on its own while launch was shutting down.
+            self._shutdown_process(context, send_sigint=True)
+        # Signals are still sent to the whole group when escalating, see __signal_process().
+        while (
+            pgid in process_groups and self.__shutdown_escalation is not None and
+            self.__shutdown_escalation.next_signal is not None
+        ):
+            await asyncio.sleep(process_groups.poll_period)
+            process_groups.reap(pgid)
+        # Once sent SIGKILL, killed once launch is done at the latest, if not gone.
+        process_groups.release(context.asyncio_loop, pgid)
+        self.__process_groups = None
+
+    def __get_respawn_delay(self, uptime: float) -> Optional[float]:
+        """Get the delay before respawning a process, or None if it must not be respawned."""
+        now = time.monotonic()
+        window = self.__respawn_restart_window
+        while self.__respawn_times and now - self.__respawn_times[0] > window:
+            self.__respawn_times.popleft()
+        if (
+            self.__respawn_max_restarts is not None and
+            len(self.__respawn_times) >= self.__respawn_max_restarts
+        ):
+            return None
+        self.__respawn_times.append(now)
+        if uptime >= window:
+            self.__backed_off_respawn_delay = self.__respawn_delay or 0.0
+        delay = self.__backed_off_respawn_delay
+        if self.__respawn_max_delay is not None:
+            delay = min(delay, self.__respawn_max_delay)
+        self.__backed_off_respawn_delay = delay * self.__respawn_backoff
+        if self.__respawn_jitter > 0.0:
+            delay *= random.uniform(1.0 - self.__respawn_jitter, 1.0 + self.__respawn_jitter)
+        return delay
+
     def prepare(self, context: LaunchContext):
         """Prepare the action for execution."""
         self.__process_description.prepare(context, self)
@@ -623,29 +1245,39 @@ class ExecuteLocal(Action):
             return None
 
         if self.__cached_output:
-            on_output_method = self.__on_process_output_cached
-            flush_buffers_method = self.__flush_cached_buffers
+            stdout_buffer = self.__stdout_buffer
+            stderr_buffer = self.__stderr_buffer
         else:
-            on_output_method = self.__on_process_output
-            flush_buffers_method = self.__flush_buffers
-
+            stdout_buffer = stderr_buffer = None
+
+        self.__process_io_event_handler = OnProcessIO(
+            target_action=self,
+            on_stdin=self.__on_process_stdin,
+            on_stdout=lambda event: self.__on_process_output(
+                event, self.__stdout_splitter, stdout_buffer, self.__stdout_line_writer,
+                self.__stdout_collapser),
+            on_stderr=lambda event: self.__on_process_output(
+                event, self.__stderr_splitter, stderr_buffer, self.__stderr_line_writer,
+                self.__stderr_collapser),
+        )
+        # Events targeted at processes are only delivered to the processes of the
+        # process table they may be for, see launch.process_table.
+        context.process_table.add(
+            self, name=name, executable=self.__process_event_args['cmd'][0])
         event_handlers = [
             EventHandler(
                 matcher=lambda event: is_a_subclass(event, ShutdownProcess),
+                event_types=(ShutdownProcess,),
+                target_action=self,
                 entities=OpaqueFunction(function=self.__on_shutdown_process_event),
             ),
             EventHandler(
                 matcher=lambda event: is_a_subclass(event, SignalProcess),
-                entities=OpaqueFunction(function=self.__on_signal_process_event),
-            ),
-            OnProcessIO(
+                event_types=(SignalProcess,),
                 target_action=self,
-                on_stdin=self.__on_process_stdin,
-                on_stdout=lambda event: on_output_method(
-                    event, self.__stdout_buffer, self.__stdout_logger),
-                on_stderr=lambda event: on_output_method(
-                    event, self.__stderr_buffer, self.__stderr_logger),
+                entities=OpaqueFunction(function=self.__on_signal_process_event),
             ),
+            self.__process_io_event_handler,
             OnShutdown(
                 on_shutdown=self.__on_shutdown,
             ),
@@ -655,11 +1287,11 @@ class ExecuteLocal(Action):
             ),
             OnProcessExit(
                 target_action=self,
-                on_exit=flush_buffers_method,
+                on_exit=self.__flush_buffers,
             ),
         ]
         for event_handler in event_handlers:
-            context.register_event_handler(event_handler)
+            context.register_event_handler(event_handler, owner=self)
 
         try:
             self.__completed_future = create_future(context.asyncio_loop)
@@ -668,10 +1300,31 @@ class ExecuteLocal(Action):
             self.__output = perform_substitutions(context, self.__output)
             self.__stdout_logger, self.__stderr_logger = \
                 launch.logging.get_output_loggers(name, self.__output)
+            self.__stdout_line_writer = self.__stdout_logger.info
+            self.__stderr_line_writer = self.__stderr_logger.info
+            self.__max_concurrent_starts = _get_launch_configuration_number(
+                context, 'max_concurrent_starts', int)
+            self.__start_ready_timeout = _get_launch_configuration_number(
+                context, 'start_ready_timeout', float)
+            if self.__start_ready_timeout is None:
+                self.__start_ready_timeout = context._start_scheduler.start_ready_timeout
+            if self.__cpu_affinity_round_robin:
+                cpus = self.__process_resources.cpu_affinity
+                count = context._cpu_affinity_round_robin_counts.get(cpus, 0)
+                context._cpu_affinity_round_robin_counts[cpus] = count + 1
+                self.__process_resources = self.__process_resources.with_cpu_affinity(
+                    [sorted(cpus)[count % len(cpus)]])
+            if (
+                self.__direct_output and not self.__cached_output and
+                self.__ready_pattern is None
+            ):
+                self.__direct_output_files = \
+                    launch.logging.get_own_log_only_output_files(name, self.__output)
             context.asyncio_loop.create_task(self.__execute_process(context))
         except Exception:
             for event_handler in event_handlers:
                 context.unregister_event_handler(event_handler)
+            context.process_table.discard(self)
             raise
         return None
 
@@ -689,7 +1342,7 @@ class ExecuteLocal(Action):
             raise RuntimeError(
                 'cached output must be true to be able to get stdout,'
                 f" proc '{self.__process_description.name}'")
-        return self.__stdout_buffer.getvalue()
+        return self.__stdout_buffer.getvalue() + self.__stdout_splitter.pending_text()
 
     def get_stderr(self):
         """
@@ -701,7 +1354,65 @@ class ExecuteLocal(Action):
             raise RuntimeError(
                 'cached output must be true to be able to get stderr, proc'
                 f" '{self.__process_description.name}'")
-        return self.__stderr_buffer.getvalue()
+        return self.__stderr_buffer.getvalue() + self.__stderr_splitter.pending_text()
+
+    def read_stdout(self, offset: int = 0) -> Tuple[Text, int]:
+        """
+        Read cached stdout written since the given offset.
+
+        Unlike get_stdout(), only complete lines are returned, and an incomplete
+        last line is only returned once the process exits, see get_pending_stdout().
+
+        :param: offset the offset returned by a previous call, 0 to read from the start
+        :returns: the cached stdout since the offset, and the offset to read from next
+        :raises RuntimeError: if cached_output is false.
+        """
+        if not self.__cached_output:
+            raise RuntimeError(
+                'cached output must be true to be able to read stdout,'
+                f" proc '{self.__process_description.name}'")
+        return self.__stdout_buffer.read(offset)
+
+    def read_stderr(self, offset: int = 0) -> Tuple[Text, int]:
+        """
+        Read cached stderr written since the given offset.
+
+        See read_stdout().
+
+        :raises RuntimeError: if cached_output is false.
+        """
+        if not self.__cached_output:
+            raise RuntimeError(
+                'cached output must be true to be able to read stderr,'
+                f" proc '{self.__process_description.name}'")
+        return self.__stderr_buffer.read(offset)
+
+    def get_pending_stdout(self) -> Text:
+        """
+        Get the last line of cached stdout, if not complete yet.
+
+        :returns: the line, empty if the last line of stdout is complete
+        :raises RuntimeError: if cached_output is false.
+        """
+        if not self.__cached_output:
+            raise RuntimeError(
+                'cached output must be true to be able to get pending stdout,'
+                f" proc '{self.__process_description.name}'")
+        return self.__stdout_splitter.pending_text()
+
+    def get_pending_stderr(self) -> Text:
+        """
+        Get the last line of cached stderr, if not complete yet.
+
+        See get_pending_stdout().
+
+        :raises RuntimeError: if cached_output is false.
+        """
+        if not self.__cached_output:
+            raise RuntimeError(
+                'cached output must be true to be able to get pending stderr,'
+                f" proc '{self.__process_description.name}'")
+        return self.__stderr_splitter.pending_text()
 
     @property
     def return_code(self):
@@ -709,3 +1420,23 @@ class ExecuteLocal(Action):
         if self._subprocess_transport is None:
             return None
         return self._subprocess_transport.get_returncode()
+
+
+def _get_launch_configuration_number(
+    context: LaunchContext,
+    name: Text,
+    data_type: Union[Type[int], Type[float]]
+) -> Optional[Union[int, float]]:
+    """Get the value of a launch configuration as a positive number, or None if not set."""
+    if name not in context.launch_configurations:
+        return None
+    value = context.launch_configurations[name]
+    try:
+        number = data_type(value)
+    except ValueError:
+        number = None
+    if number is None or number <= 0:
+        raise ValueError(
+            "launch configuration '{}' expected to be a positive {} but got '{}'".format(
+                name, data_type.__name__, value))
+    return number
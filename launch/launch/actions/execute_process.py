@@ -229,11 +229,62 @@ class ExecuteProcess(ExecuteLocal):
             process, which is useful for debugging when substitutions are
             involved.
         :param: cached_output if `True`, both stdout and stderr will be cached.
-            Use get_stdout() and get_stderr() to read the buffered output.
+            Use get_stdout() and get_stderr() to read the buffered output, or
+            read_stdout() and read_stderr() to read it incrementally.
+        :param: cached_output_size_limit maximum number of characters of stdout,
+            and of stderr, to cache, discarding the oldest output first.
+            Defaults to None, i.e. to caching all the output.
+        :param: direct_output if True, output that is only configured to go to the
+            process own log files ('own_log') is written to those files without going
+            through launch, unless any other event handler matches the process output
+            events when it starts.
+            See :class:`launch.actions.ExecuteLocal` for details.
+        :param: direct_output_timestamps if True, each line of output that is written
+            directly to log files is prefixed with the time it was read at.
+        :param: output_rate_limit maximum number of lines of output, of stdout and
+            stderr combined, logged per second on average, lines beyond it are dropped.
+            Defaults to None, i.e. to no limit.
+        :param: output_rate_burst maximum number of lines of output logged at once,
+            when output_rate_limit is set. Defaults to one second worth of lines.
+        :param: collapse_repeated_output if True, identical consecutive lines of
+            output are logged once, followed by a 'last message repeated N times'
+            line.
+        :param: output_filter_summary_period minimum time in seconds between two
+            reports of the number of lines dropped or collapsed, while output is
+            produced. Those numbers are also reported when the process exits.
         :param: on_exit list of actions to execute upon process exit.
         :param: respawn if 'True', relaunch the process that abnormally died.
             Defaults to 'False'.
         :param: respawn_delay a delay time to relaunch the died process if respawn is 'True'.
+        :param: respawn_backoff factor the respawn delay is multiplied by for each
+            consecutive respawn of a process that ran for less than respawn_restart_window.
+            Defaults to 1.0, i.e. to a fixed respawn delay. Requires a positive
+            respawn_delay if greater than 1.0.
+        :param: respawn_max_delay maximum respawn delay, before jitter is applied.
+        :param: respawn_jitter fraction of the respawn delay by which each delay is
+            randomly shortened or lengthened, between 0.0 (default) and 1.0.
+        :param: respawn_max_restarts maximum number of respawns within
+            respawn_restart_window, beyond which the process is no longer respawned.
+            See :class:`launch.actions.ExecuteLocal` for details.
+        :param: respawn_restart_window time window in seconds over which respawns are
+            counted, and that a process must run for to reset the respawn backoff.
+        :param: ready_pattern regular expression matching a line of output that signals
+            the process is ready, until which the process is considered starting by the
+            launch-wide start scheduler.
+            See :class:`launch.actions.ExecuteLocal` for details.
+        :param: cpu_affinity CPUs the process may run on, only supported on Linux.
+        :param: cpu_affinity_round_robin if True, the process runs on a single CPU of
+            cpu_affinity, the next one for each process given the same CPUs.
+        :param: nice nice value of the process, between -20 and 19.
+        :param: rlimits resource limits of the process, by resource name, e.g.
+            {'nofile': 1024}, each limit being either a soft limit or a tuple of soft
+            and hard limits.
+            CPU affinity, nice value and resource limits are applied by launch right
+            after the process started, instead of through a launch-prefix.
+        :param: stdin_file path of a file the process reads as its standard input.
+        :param: stdin_from action of another process whose standard output is the
+            standard input of the process, through a pipe that launch does not read.
+            See :class:`launch.actions.ExecuteLocal` for details.
         """
         executable = Executable(cmd=cmd, prefix=prefix, name=name, cwd=cwd, env=env,
                                 additional_env=additional_env)
@@ -356,6 +407,142 @@ class ExecuteProcess(ExecuteLocal):
                     )
                 kwargs['respawn_delay'] = respawn_delay
 
+        if 'respawn_backoff' not in ignore:
+            respawn_backoff = entity.get_attr('respawn_backoff', data_type=float, optional=True)
+            if respawn_backoff is not None:
+                if respawn_backoff < 1.0:
+                    raise ValueError(
+                        'Attribute respawn_backoff of Entity node expected to be '
+                        'a value greater than or equal to 1 but got `{}`'.format(respawn_backoff)
+                    )
+                if respawn_backoff > 1.0 and not kwargs.get('respawn_delay'):
+                    raise ValueError(
+                        'Attribute respawn_backoff of Entity node greater than 1 requires '
+                        'a positive respawn_delay but got `{}`'.format(kwargs.get('respawn_delay'))
+                    )
+                kwargs['respawn_backoff'] = respawn_backoff
+
+        if 'respawn_max_delay' not in ignore:
+            respawn_max_delay = entity.get_attr(
+                'respawn_max_delay', data_type=float, optional=True)
+            if respawn_max_delay is not None:
+                if respawn_max_delay < 0.0:
+                    raise ValueError(
+                        'Attribute respawn_max_delay of Entity node expected to be '
+                        'a non-negative value but got `{}`'.format(respawn_max_delay)
+                    )
+                kwargs['respawn_max_delay'] = respawn_max_delay
+
+        if 'respawn_jitter' not in ignore:
+            respawn_jitter = entity.get_attr('respawn_jitter', data_type=float, optional=True)
+            if respawn_jitter is not None:
+                if not 0.0 <= respawn_jitter <= 1.0:
+                    raise ValueError(
+                        'Attribute respawn_jitter of Entity node expected to be '
+                        'a value between 0 and 1 but got `{}`'.format(respawn_jitter)
+                    )
+                kwargs['respawn_jitter'] = respawn_jitter
+
+        if 'respawn_max_restarts' not in ignore:
+            respawn_max_restarts = entity.get_attr(
+                'respawn_max_restarts', data_type=int, optional=True)
+            if respawn_max_restarts is not None:
+                if respawn_max_restarts < 0:
+                    raise ValueError(
+                        'Attribute respawn_max_restarts of Entity node expected to be '
+                        'a non-negative value but got `{}`'.format(respawn_max_restarts)
+                    )
+                kwargs['respawn_max_restarts'] = respawn_max_restarts
+
+        if 'respawn_restart_window' not in ignore:
+            respawn_restart_window = entity.get_attr(
+                'respawn_restart_window', data_type=float, optional=True)
+            if respawn_restart_window is not None:
+                if respawn_restart_window <= 0.0:
+                    raise ValueError(
+                        'Attribute respawn_restart_window of Entity node expected to be '
+                        'a positive value but got `{}`'.format(respawn_restart_window)
+                    )
+                kwargs['respawn_restart_window'] = respawn_restart_window
+
+        if 'output_rate_limit' not in ignore:
+            output_rate_limit = entity.get_attr(
+                'output_rate_limit', data_type=float, optional=True)
+            if output_rate_limit is not None:
+                if output_rate_limit <= 0.0:
+                    raise ValueError(
+                        'Attribute output_rate_limit of Entity node expected to be '
+                        'a positive value but got `{}`'.format(output_rate_limit)
+                    )
+                kwargs['output_rate_limit'] = output_rate_limit
+
+        if 'output_rate_burst' not in ignore:
+            output_rate_burst = entity.get_attr(
+                'output_rate_burst', data_type=int, optional=True)
+            if output_rate_burst is not None:
+                if output_rate_burst < 1:
+                    raise ValueError(
+                        'Attribute output_rate_burst of Entity node expected to be '
+                        'a positive value but got `{}`'.format(output_rate_burst)
+                    )
+                kwargs['output_rate_burst'] = output_rate_burst
+
+        if 'collapse_repeated_output' not in ignore:
+            collapse_repeated_output = entity.get_attr(
+                'collapse_repeated_output', data_type=bool, optional=True)
+            if collapse_repeated_output is not None:
+                kwargs['collapse_repeated_output'] = collapse_repeated_output
+
+        if 'ready_pattern' not in ignore:
+            ready_pattern = entity.get_attr('ready_pattern', optional=True)
+            if ready_pattern is not None:
+                kwargs['ready_pattern'] = ready_pattern
+
+        if 'cpu_affinity' not in ignore:
+            cpu_affinity = entity.get_attr('cpu_affinity', data_type=List[int], optional=True)
+            if cpu_affinity is not None:
+                if not cpu_affinity or any(cpu < 0 for cpu in cpu_affinity):
+                    raise ValueError(
+                        'Attribute cpu_affinity of Entity node expected to be '
+                        'a non-empty list of CPU numbers but got `{}`'.format(cpu_affinity)
+                    )
+                kwargs['cpu_affinity'] = cpu_affinity
+
+        if 'cpu_affinity_round_robin' not in ignore:
+            cpu_affinity_round_robin = entity.get_attr(
+                'cpu_affinity_round_robin', data_type=bool, optional=True)
+            if cpu_affinity_round_robin is not None:
+                kwargs['cpu_affinity_round_robin'] = cpu_affinity_round_robin
+
+        if 'nice' not in ignore:
+            nice = entity.get_attr('nice', data_type=int, optional=True)
+            if nice is not None:
+                if not -20 <= nice <= 19:
+                    raise ValueError(
+                        'Attribute nice of Entity node expected to be '
+                        'a value between -20 and 19 but got `{}`'.format(nice)
+                    )
+                kwargs['nice'] = nice
+
+        if 'rlimits' not in ignore:
+            rlimits = {}
+            for rlimit in ('as', 'nofile', 'core'):
+                limit = entity.get_attr('rlimit_' + rlimit, data_type=int, optional=True)
+                if limit is not None:
+                    if limit < 0:
+                        raise ValueError(
+                            'Attribute rlimit_{} of Entity node expected to be '
+                            'a non-negative value but got `{}`'.format(rlimit, limit)
+                        )
+                    rlimits[rlimit] = limit
+            if rlimits:
+                kwargs['rlimits'] = rlimits
+
+        if 'stdin_file' not in ignore:
+            stdin_file = entity.get_attr('stdin_file', optional=True)
+            if stdin_file is not None:
+                kwargs['stdin_file'] = parser.parse_substitution(stdin_file)
+
         if 'shell' not in ignore:
             shell = entity.get_attr('shell', data_type=bool, optional=True)
             if shell is not None:
@@ -107,7 +107,8 @@ class OpaqueCoroutine(Action):
             self.__coroutine(*args, **self.__kwargs)
         )
         context.register_event_handler(
-            OnShutdown(on_shutdown=self.__on_shutdown)
+            OnShutdown(on_shutdown=self.__on_shutdown),
+            owner=self,
         )
         return None
 
@@ -181,6 +181,7 @@ class TimerAction(Action):
         if not hasattr(context, '_TimerAction__event_handler_has_been_installed'):
             context.register_event_handler(EventHandler(
                 matcher=lambda event: is_a_subclass(event, TimerEvent),
+                event_types=(TimerEvent,),
                 entities=OpaqueFunction(
                     function=lambda context: (
                         cast(TimerEvent, context.locals.event).timer_action.handle(context)
@@ -199,8 +200,10 @@ class TimerAction(Action):
             context.register_event_handler(
                 EventHandler(
                     matcher=lambda event: is_a_subclass(event, Shutdown),
+                    event_types=(Shutdown,),
                     entities=OpaqueFunction(function=lambda context: self.cancel())
-                )
+                ),
+                owner=self,
             )
 
         return None
@@ -0,0 +1,177 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the ChildWatcher class."""
+
+import asyncio
+import os
+import signal
+import subprocess
+import threading
+from typing import Callable
+from typing import Dict  # noqa: F401
+from typing import Optional
+from typing import Text
+from typing import Tuple  # noqa: F401
+
+ExitCallback = Callable[[int], None]
+
+
+class ChildWatcher:
+    """
+    Watch child processes for their exit, from an asyncio event loop.
+
+    Child processes are reaped once they exit, and a callback is called with
+    their return code from the event loop, in one of these modes:
+
+    - 'pidfd': a pidfd is opened for each process, and is watched by the event
+      loop, which is notified as soon as the process exits, on Linux 5.3 or newer;
+    - 'sigchld': all processes are polled from the event loop whenever it
+      receives SIGCHLD, which requires the event loop to run in the main thread;
+    - 'thread': a thread waits for each process, as a last resort.
+
+    The first two modes use no thread at all, regardless of the number of
+    processes being watched.
+    """
+
+    MODES = ('pidfd', 'sigchld', 'thread')
+
+    def __init__(self, mode: Optional[Text] = None) -> None:
+        """
+        Create a ChildWatcher.
+
+        :param: mode the mode to watch processes in, None (default) results in the
+            first supported one, once the first process is watched
+        """
+        if mode is not None and mode not in self.MODES:
+            raise ValueError("'mode' must be one of {}, got '{}'".format(self.MODES, mode))
+        self.__requested_mode = mode
+        self.__mode = None  # type: Optional[Text]
+        self.__loop = None  # type: Optional[asyncio.AbstractEventLoop]
+        # Processes being watched, with their callback and pidfd, if any, by pid.
+        self.__children = \
+            {}  # type: Dict[int, Tuple[subprocess.Popen, ExitCallback, Optional[int]]]
+
+    @property
+    def mode(self) -> Optional[Text]:
+        """Getter for the mode processes are watched in, None until the first one is."""
+        return self.__mode
+
+    @property
+    def watched_count(self) -> int:
+        """Getter for the number of processes being watched."""
+        return len(self.__children)
+
+    def add_child(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        popen: subprocess.Popen,
+        callback: ExitCallback
+    ) -> None:
+        """
+        Watch a child process, from the given event loop.
+
+        :param: loop the event loop to watch the process from, and to call the
+            callback from, the same for all processes
+        :param: popen the process
+        :param: callback function called with the return code of the process
+        """
+        if self.__mode is None:
+            self.__mode = self.__select_mode(loop)
+            self.__loop = loop
+        elif loop is not self.__loop:
+            raise RuntimeError('processes must all be watched from the same event loop')
+        returncode = popen.poll()
+        if returncode is not None:
+            loop.call_soon(callback, returncode)
+            return
+        if self.__mode == 'thread':
+            threading.Thread(
+                target=_wait, args=(loop, popen, callback),
+                name='launch_process_waiter_{}'.format(popen.pid), daemon=True
+            ).start()
+            return
+        pidfd = None
+        if self.__mode == 'pidfd':
+            try:
+                pidfd = os.pidfd_open(popen.pid)
+            except ProcessLookupError:
+                # Reaped by someone else in the meantime, e.g. by Popen.send_signal().
+                loop.call_soon(callback, popen.poll())
+                return
+            loop.add_reader(pidfd, self.__on_pidfd_readable, popen.pid)
+        self.__children[popen.pid] = (popen, callback, pidfd)
+
+    def close(self) -> None:
+        """Stop watching processes, which are no longer reaped."""
+        loop = self.__loop
+        for _, _, pidfd in self.__children.values():
+            if pidfd is not None:
+                loop.remove_reader(pidfd)
+                os.close(pidfd)
+        self.__children.clear()
+        if self.__mode == 'sigchld' and not loop.is_closed():
+            loop.remove_signal_handler(signal.SIGCHLD)
+        self.__mode = None
+        self.__loop = None
+
+    def __select_mode(self, loop: asyncio.AbstractEventLoop) -> Text:
+        mode = self.__requested_mode
+        if mode in (None, 'pidfd') and hasattr(os, 'pidfd_open'):
+            try:
+                os.close(os.pidfd_open(os.getpid()))
+                return 'pidfd'
+            except OSError:
+                # Not supported by the kernel.
+                pass
+        if mode in (None, 'sigchld') and hasattr(signal, 'SIGCHLD'):
+            try:
+                loop.add_signal_handler(signal.SIGCHLD, self.__on_sigchld)
+                return 'sigchld'
+            except (RuntimeError, ValueError):
+                # Not the main thread.
+                pass
+        if mode not in (None, 'thread'):
+            raise RuntimeError("child watcher mode '{}' is not supported here".format(mode))
+        return 'thread'
+
+    def __on_pidfd_readable(self, pid: int) -> None:
+        popen, callback, pidfd = self.__children[pid]
+        returncode = popen.poll()
+        if returncode is None:
+            return
+        del self.__children[pid]
+        self.__loop.remove_reader(pidfd)
+        os.close(pidfd)
+        callback(returncode)
+
+    def __on_sigchld(self) -> None:
+        for pid, (popen, callback, _) in list(self.__children.items()):
+            returncode = popen.poll()
+            if returncode is not None:
+                del self.__children[pid]
+                callback(returncode)
+
+
+def _wait(
+    loop: asyncio.AbstractEventLoop,
+    popen: subprocess.Popen,
+    callback: ExitCallback
+) -> None:
+    returncode = popen.wait()
+    try:
+        loop.call_soon_threadsafe(callback, returncode)
+    except RuntimeError:
+        # The event loop is closed.
+        pass
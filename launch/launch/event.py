@@ -19,3 +19,8 @@ class Event:
     """Event that can be emitted during runtime of a launched system."""
 
     name = 'launch.Event'
+
+    # Control events are processed ahead of all other queued events, and I/O events
+    # in order with the other events, see launch.event_queue.EventQueue.
+    is_control_event = False
+    is_io_event = False
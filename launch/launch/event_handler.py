@@ -15,16 +15,19 @@
 """Module for EventHandler class."""
 
 from typing import Callable
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Text
 from typing import Tuple
+from typing import Type
 from typing import TYPE_CHECKING
 
 from .event import Event
 from .some_actions_type import SomeActionsType
 
 if TYPE_CHECKING:
+    from .action import Action  # noqa: F401
     from .launch_context import LaunchContext  # noqa: F401
 
 
@@ -38,7 +41,14 @@ class BaseEventHandler:
     `launch.substitutions.LocalSubstitution('event.name')`.
     """
 
-    def __init__(self, *, matcher: Callable[[Event], bool], handle_once: bool = False):
+    def __init__(
+        self,
+        *,
+        matcher: Callable[[Event], bool],
+        handle_once: bool = False,
+        event_types: Optional[Iterable[Type[Event]]] = None,
+        target_action: Optional['Action'] = None
+    ):
         """
         Create a BaseEventHandler.
 
@@ -46,15 +56,36 @@ class BaseEventHandler:
             the event should be handled by this event handler, False otherwise.
         :param: handle_once is a flag that, if True, unregisters this EventHandler
             after being handled once.
+        :param: event_types is an optional iterable of event classes, promising
+            that the matcher only returns True for instances of those classes
+            (or their subclasses), so that the handler is skipped for any other
+            event without calling the matcher.
+        :param: target_action is an optional action, promising that the matcher
+            only returns True for events whose `action` is that very action, or
+            for events targeted at processes that may be that action's process,
+            see :class:`launch.process_table.ProcessTable`.
+            Only taken into account if event_types is also given.
         """
         self.__matcher = matcher
         self.__handle_once = handle_once
+        self.__event_types = tuple(event_types) if event_types is not None else None
+        self.__target_action = target_action
 
     @property
     def handle_once(self):
         """Getter for handle_once flag."""
         return self.__handle_once
 
+    @property
+    def event_types(self) -> Optional[Tuple[Type[Event], ...]]:
+        """Getter for the event types this handler is restricted to, or None if unrestricted."""
+        return self.__event_types
+
+    @property
+    def target_action(self) -> Optional['Action']:
+        """Getter for the action this handler is restricted to, or None if unrestricted."""
+        return self.__target_action
+
     @property
     def handler_description(self):
         """
@@ -107,7 +138,8 @@ class EventHandler(BaseEventHandler):
         *,
         matcher: Callable[[Event], bool],
         entities: Optional[SomeActionsType] = None,
-        handle_once: bool = False
+        handle_once: bool = False,
+        **kwargs
     ) -> None:
         """
         Create an EventHandler.
@@ -118,8 +150,10 @@ class EventHandler(BaseEventHandler):
             returned by handle() unconditionally if matcher returns True.
         :param: handle_once is a flag that, if True, unregisters this EventHandler
             after being handled once.
+
+        See :py:class:`BaseEventHandler` for other keyword arguments.
         """
-        super().__init__(matcher=matcher, handle_once=handle_once)
+        super().__init__(matcher=matcher, handle_once=handle_once, **kwargs)
 
         self.__entities = entities
 
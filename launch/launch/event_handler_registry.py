@@ -0,0 +1,215 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the EventHandlerRegistry class."""
+
+from typing import Any  # noqa: F401
+from typing import Dict  # noqa: F401
+from typing import Hashable  # noqa: F401
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional  # noqa: F401
+from typing import Set  # noqa: F401
+from typing import Tuple  # noqa: F401
+
+from .event import Event
+from .event_handler import BaseEventHandler
+
+
+class EventHandlerRegistry:
+    """
+    Ordered collection of event handlers, indexed by the events they can handle.
+
+    Handlers that declare which event types they handle (see
+    :py:attr:`BaseEventHandler.event_types`) are indexed by those types and,
+    if they also declare a target action (see
+    :py:attr:`BaseEventHandler.target_action`), by the identity of that action,
+    which is either the action of an event or one of the actions it targets.
+    Looking up the candidate handlers for an event then walks the event's
+    class hierarchy, instead of calling every registered handler's matcher.
+    Handlers with opaque matchers are kept aside and are always candidates.
+
+    Registration order is preserved, i.e. candidates are returned in the same
+    order a linear scan over all registered handlers would have produced.
+
+    Handlers may be registered on behalf of an owner, e.g. the action that
+    registered them, so that they can all be removed at once when the owner
+    no longer needs them.
+
+    Some deque-like methods are provided, so that the registry can be used in
+    place of the :py:class:`collections.deque` it replaces.
+    """
+
+    def __init__(self) -> None:
+        """Create an EventHandlerRegistry."""
+        # Registrations are ordered by a sequence number, decreasing for
+        # prepended handlers and increasing for appended ones.
+        self.__head_sequence_number = 0
+        self.__tail_sequence_number = 0
+        self.__handlers = {}  # type: Dict[int, BaseEventHandler]
+        self.__sequence_numbers_by_handler = {}  # type: Dict[int, List[int]]
+        self.__buckets_by_sequence_number = \
+            {}  # type: Dict[int, List[Tuple[Dict[Any, Dict[int, BaseEventHandler]], Hashable]]]
+        self.__by_event_type = {}  # type: Dict[type, Dict[int, BaseEventHandler]]
+        self.__by_event_type_and_action = \
+            {}  # type: Dict[Tuple[type, int], Dict[int, BaseEventHandler]]
+        self.__unindexed = {}  # type: Dict[int, BaseEventHandler]
+        self.__owner_ids_by_sequence_number = {}  # type: Dict[int, int]
+        self.__owned_by_owner_id = {}  # type: Dict[int, Tuple[Any, Set[int]]]
+
+    def __len__(self) -> int:
+        return len(self.__handlers)
+
+    def __iter__(self) -> Iterator[BaseEventHandler]:
+        handlers = self.__handlers
+        return iter([handlers[n] for n in sorted(handlers)])
+
+    def __getitem__(self, index: int) -> BaseEventHandler:
+        return list(self)[index]
+
+    def __contains__(self, event_handler: BaseEventHandler) -> bool:
+        return id(event_handler) in self.__sequence_numbers_by_handler
+
+    def __add(
+        self, event_handler: BaseEventHandler, sequence_number: int, owner: Any
+    ) -> None:
+        self.__handlers[sequence_number] = event_handler
+        if owner is not None:
+            self.__owner_ids_by_sequence_number[sequence_number] = id(owner)
+            self.__owned_by_owner_id.setdefault(id(owner), (owner, set()))[1].add(
+                sequence_number)
+        self.__sequence_numbers_by_handler.setdefault(id(event_handler), []).append(
+            sequence_number)
+        buckets = []
+        event_types = getattr(event_handler, 'event_types', None)
+        if event_types is None:
+            self.__unindexed[sequence_number] = event_handler
+            buckets.append((None, None))
+        else:
+            target_action = getattr(event_handler, 'target_action', None)
+            for event_type in event_types:
+                if target_action is None:
+                    index, key = self.__by_event_type, event_type
+                else:
+                    index, key = self.__by_event_type_and_action, (event_type, id(target_action))
+                index.setdefault(key, {})[sequence_number] = event_handler
+                buckets.append((index, key))
+        self.__buckets_by_sequence_number[sequence_number] = buckets
+
+    def append(self, event_handler: BaseEventHandler, owner: Any = None) -> None:
+        """Register an event handler after all previously registered ones."""
+        self.__tail_sequence_number += 1
+        self.__add(event_handler, self.__tail_sequence_number, owner)
+
+    def appendleft(self, event_handler: BaseEventHandler, owner: Any = None) -> None:
+        """Register an event handler before all previously registered ones."""
+        self.__head_sequence_number -= 1
+        self.__add(event_handler, self.__head_sequence_number, owner)
+
+    def remove(self, event_handler: BaseEventHandler) -> None:
+        """
+        Unregister the first occurrence of an event handler.
+
+        :raises ValueError: if the event handler is not registered.
+        """
+        sequence_numbers = self.__sequence_numbers_by_handler.get(id(event_handler))
+        if not sequence_numbers:
+            raise ValueError('event handler is not registered: {}'.format(event_handler))
+        self.__remove(min(sequence_numbers))
+
+    def remove_owned_by(self, owner: Any) -> int:
+        """Unregister all event handlers registered on behalf of the given owner."""
+        owned = self.__owned_by_owner_id.get(id(owner))
+        if owned is None:
+            return 0
+        sequence_numbers = sorted(owned[1])
+        for sequence_number in sequence_numbers:
+            self.__remove(sequence_number)
+        return len(sequence_numbers)
+
+    def count_owned_by(self, owner: Any) -> int:
+        """Return the number of event handlers registered on behalf of the given owner."""
+        owned = self.__owned_by_owner_id.get(id(owner))
+        return 0 if owned is None else len(owned[1])
+
+    def counts_by_owner(self) -> Dict[Any, int]:
+        """Return the number of registered event handlers of each owner, for debugging."""
+        return {
+            owner: len(sequence_numbers)
+            for owner, sequence_numbers in self.__owned_by_owner_id.values()
+        }
+
+    def __remove(self, sequence_number: int) -> None:
+        event_handler = self.__handlers.pop(sequence_number)
+        sequence_numbers = self.__sequence_numbers_by_handler[id(event_handler)]
+        sequence_numbers.remove(sequence_number)
+        if not sequence_numbers:
+            del self.__sequence_numbers_by_handler[id(event_handler)]
+        owner_id = self.__owner_ids_by_sequence_number.pop(sequence_number, None)
+        if owner_id is not None:
+            owned_sequence_numbers = self.__owned_by_owner_id[owner_id][1]
+            owned_sequence_numbers.discard(sequence_number)
+            if not owned_sequence_numbers:
+                del self.__owned_by_owner_id[owner_id]
+        for index, key in self.__buckets_by_sequence_number.pop(sequence_number):
+            if index is None:
+                del self.__unindexed[sequence_number]
+                continue
+            bucket = index[key]
+            del bucket[sequence_number]
+            if not bucket:
+                del index[key]
+
+    def candidates(
+        self, event: Event, target_actions: Optional[Iterable[Any]] = None
+    ) -> List[BaseEventHandler]:
+        """
+        Return the event handlers that may match the given event, in registration order.
+
+        Callers must still check :py:meth:`BaseEventHandler.matches` on each candidate.
+
+        :param: event the event
+        :param: target_actions the actions the event is targeted at, if any, besides
+            its own action, e.g. the processes a SignalProcess event may be for
+        """
+        buckets = []
+        if self.__unindexed:
+            buckets.append(self.__unindexed)
+        by_event_type = self.__by_event_type
+        by_event_type_and_action = self.__by_event_type_and_action
+        action_ids = []  # type: List[int]
+        if by_event_type_and_action:
+            action = getattr(event, 'action', None)
+            if action is not None:
+                action_ids.append(id(action))
+            if target_actions is not None:
+                action_ids.extend(id(target_action) for target_action in target_actions)
+        for event_type in type(event).__mro__:
+            bucket = by_event_type.get(event_type)
+            if bucket:
+                buckets.append(bucket)
+            for action_id in action_ids:
+                bucket = by_event_type_and_action.get((event_type, action_id))
+                if bucket:
+                    buckets.append(bucket)
+        if not buckets:
+            return []
+        if len(buckets) == 1:
+            merged = buckets[0]
+        else:
+            merged = {}
+            for bucket in buckets:
+                merged.update(bucket)
+        return [merged[n] for n in sorted(merged)]
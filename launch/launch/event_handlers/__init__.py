@@ -20,6 +20,7 @@ from .on_include_launch_description import OnIncludeLaunchDescription
 from .on_process_exit import OnProcessExit
 from .on_process_io import OnProcessIO
 from .on_process_start import OnProcessStart
+from .on_process_stats import OnProcessStats
 from .on_shutdown import OnShutdown
 
 __all__ = [
@@ -29,5 +30,6 @@ __all__ = [
     'OnProcessExit',
     'OnProcessIO',
     'OnProcessStart',
+    'OnProcessStats',
     'OnShutdown',
 ]
@@ -81,7 +81,15 @@ class OnActionEventBase(BaseEventHandler):
                 return event.action is action_matcher
             assert action_matcher is None
             return True
-        super().__init__(matcher=event_matcher, **kwargs)
+        target_action = None
+        if not callable(action_matcher) and isinstance(action_matcher, target_action_cls):
+            target_action = action_matcher
+        super().__init__(
+            matcher=event_matcher,
+            event_types=(target_event_cls,),
+            target_action=target_action,
+            **kwargs
+        )
         self.__actions_on_event: List[LaunchDescriptionEntity] = []
         # TODO(wjwwood) check that it is not only callable, but also a callable that matches
         # the correct signature for a handler in this case
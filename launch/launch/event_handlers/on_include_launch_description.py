@@ -29,6 +29,7 @@ class OnIncludeLaunchDescription(EventHandler):
         from ..actions import OpaqueFunction
         super().__init__(
             matcher=lambda event: is_a_subclass(event, IncludeLaunchDescription),
+            event_types=(IncludeLaunchDescription,),
             entities=OpaqueFunction(
                 function=lambda context: [context.locals.event.launch_description]
             ),
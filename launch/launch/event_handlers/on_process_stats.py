@@ -0,0 +1,69 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for OnProcessStats class."""
+
+from typing import Callable
+from typing import cast
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Union
+
+from .on_action_event_base import OnActionEventBase
+from ..event import Event
+from ..events.process import ProcessStats
+from ..launch_context import LaunchContext
+from ..some_actions_type import SomeActionsType
+
+if TYPE_CHECKING:
+    from ..actions import Action  # noqa: F401
+    from ..actions import ExecuteProcess  # noqa: F401
+
+
+class OnProcessStats(OnActionEventBase):
+    """
+    Convenience class for handling a process stats event.
+
+    It may be configured to only handle the stats of a specific action,
+    or to handle the stats of all processes.
+    """
+
+    def __init__(
+        self,
+        *,
+        target_action:
+            Optional[Union[Callable[['ExecuteProcess'], bool], 'ExecuteProcess']] = None,
+        on_stats:
+            Union[
+                SomeActionsType,
+                Callable[[ProcessStats, LaunchContext], Optional[SomeActionsType]]],
+        **kwargs
+    ) -> None:
+        """Create an OnProcessStats event handler."""
+        from ..actions import ExecuteProcess  # noqa: F811
+        target_action = cast(
+            Optional[Union[Callable[['Action'], bool], 'Action']],
+            target_action)
+        on_stats = cast(
+            Union[
+                SomeActionsType,
+                Callable[[Event, LaunchContext], Optional[SomeActionsType]]],
+            on_stats)
+        super().__init__(
+            action_matcher=target_action,
+            on_event=on_stats,
+            target_event_cls=ProcessStats,
+            target_action_cls=ExecuteProcess,
+            **kwargs,
+        )
@@ -0,0 +1,85 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the EventQueue class."""
+
+import asyncio
+import collections
+import itertools
+from typing import Deque  # noqa: F401
+from typing import Iterator
+from typing import Tuple  # noqa: F401
+
+from .event import Event
+
+
+class _EventLanes:
+    """Container of queued events, with a lane for control events and one for I/O events."""
+
+    def __init__(self) -> None:
+        self.control_events = collections.deque()  # type: Deque[Event]
+        # Other events with the order they were queued in, I/O events in their own lane.
+        self.events = collections.deque()  # type: Deque[Tuple[int, Event]]
+        self.io_events = collections.deque()  # type: Deque[Tuple[int, Event]]
+        self.__order = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.control_events) + len(self.events) + len(self.io_events)
+
+    def __iter__(self) -> Iterator[Event]:
+        yield from self.control_events
+        events = list(self.events)
+        io_events = list(self.io_events)
+        i = j = 0
+        while i < len(events) or j < len(io_events):
+            if j == len(io_events) or (i < len(events) and events[i][0] < io_events[j][0]):
+                yield events[i][1]
+                i += 1
+            else:
+                yield io_events[j][1]
+                j += 1
+
+    def append(self, event: Event) -> None:
+        if getattr(event, 'is_control_event', False):
+            self.control_events.append(event)
+            return
+        entry = (next(self.__order), event)
+        if getattr(event, 'is_io_event', False):
+            self.io_events.append(entry)
+        else:
+            self.events.append(entry)
+
+    def popleft(self) -> Event:
+        if self.control_events:
+            return self.control_events.popleft()
+        if not self.io_events or (self.events and self.events[0][0] < self.io_events[0][0]):
+            return self.events.popleft()[1]
+        return self.io_events.popleft()[1]
+
+
+class EventQueue(asyncio.Queue):
+    """
+    Queue of events pending processing, with a priority lane for control events.
+
+    Events whose class sets :py:attr:`launch.Event.is_control_event`, like
+    :py:class:`launch.events.Shutdown` or
+    :py:class:`launch.events.process.SignalProcess`, are dequeued ahead of
+    all the other events, in the order they were queued, so that they are not
+    delayed by an output storm, i.e. a backlog of process output and input,
+    even when other events were queued in between.
+    Other events are dequeued in the order they were queued.
+    """
+
+    def _init(self, maxsize):
+        self._queue = _EventLanes()
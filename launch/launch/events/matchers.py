@@ -17,8 +17,9 @@
 from typing import Callable
 
 from ..action import Action
+from ..process_table import ProcessMatcher
 
 
 def matches_action(target_action: Action) -> Callable[[Action], bool]:
     """Return a matcher which matches based on an exact given ExecuteProcess action."""
-    return lambda action: action == target_action
+    return ProcessMatcher(lambda action: action == target_action, 'action', target_action)
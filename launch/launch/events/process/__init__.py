@@ -19,7 +19,9 @@ from .process_io import ProcessIO
 from .process_matchers import matches_executable
 from .process_matchers import matches_name
 from .process_matchers import matches_pid
+from .process_respawn_limit_reached import ProcessRespawnLimitReached
 from .process_started import ProcessStarted
+from .process_stats import ProcessStats
 from .process_stderr import ProcessStderr
 from .process_stdin import ProcessStdin
 from .process_stdout import ProcessStdout
@@ -34,7 +36,9 @@ __all__ = [
     'matches_pid',
     'ProcessExited',
     'ProcessIO',
+    'ProcessRespawnLimitReached',
     'ProcessStarted',
+    'ProcessStats',
     'ProcessStderr',
     'ProcessStdin',
     'ProcessStdout',
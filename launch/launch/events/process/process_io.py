@@ -21,6 +21,7 @@ class ProcessIO(RunningProcessEvent):
     """Event emitted when a process generates output on stdout or stderr, or if stdin is used."""
 
     name = 'launch.events.process.ProcessIO'
+    is_io_event = True
 
     def __init__(self, *, text: bytes, fd: int, **kwargs) -> None:
         """
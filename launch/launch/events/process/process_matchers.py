@@ -18,6 +18,8 @@ from typing import Callable
 from typing import Text
 from typing import TYPE_CHECKING
 
+from ...process_table import ProcessMatcher
+
 if TYPE_CHECKING:
     from ...actions import ExecuteProcess  # noqa: F401
 
@@ -30,7 +32,7 @@ def matches_pid(pid: int) -> Callable[['ExecuteProcess'], bool]:
             return False
         return action.process_details['pid'] == pid
 
-    return matcher
+    return ProcessMatcher(matcher, 'pid', pid)
 
 
 def matches_name(name: Text) -> Callable[['ExecuteProcess'], bool]:
@@ -41,7 +43,7 @@ def matches_name(name: Text) -> Callable[['ExecuteProcess'], bool]:
             return False
         return action.process_details['name'] == name
 
-    return matcher
+    return ProcessMatcher(matcher, 'name', name)
 
 
 def matches_executable(executable: Text) -> Callable[['ExecuteProcess'], bool]:
@@ -58,4 +60,4 @@ def matches_executable(executable: Text) -> Callable[['ExecuteProcess'], bool]:
             return False
         return action.process_details['cmd'][0].endswith(executable)
 
-    return matcher
+    return ProcessMatcher(matcher, 'executable', executable)
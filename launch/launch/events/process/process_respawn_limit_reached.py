@@ -0,0 +1,54 @@
+# Copyright 2018 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for ProcessRespawnLimitReached event."""
+
+from .running_process_event import RunningProcessEvent
+
+
+class ProcessRespawnLimitReached(RunningProcessEvent):
+    """Event emitted when a process that keeps exiting is no longer respawned."""
+
+    name = 'launch.events.process.ProcessRespawnLimitReached'
+
+    def __init__(
+        self,
+        *,
+        respawn_count: int,
+        restart_window: float,
+        **kwargs
+    ) -> None:
+        """
+        Create a ProcessRespawnLimitReached event.
+
+        Unmatched keyword arguments are passed to RunningProcessEvent, see it
+        for details on those arguments.
+
+        :param: respawn_count is the number of times the process was respawned
+        :param: restart_window is the time window in seconds in which the process
+            was respawned too many times
+        """
+        super().__init__(**kwargs)
+        self.__respawn_count = respawn_count
+        self.__restart_window = restart_window
+
+    @property
+    def respawn_count(self) -> int:
+        """Getter for respawn_count."""
+        return self.__respawn_count
+
+    @property
+    def restart_window(self) -> float:
+        """Getter for restart_window."""
+        return self.__restart_window
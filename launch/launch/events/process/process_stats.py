@@ -0,0 +1,91 @@
+# Copyright 2018 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for ProcessStats event."""
+
+from typing import Optional
+
+from .running_process_event import RunningProcessEvent
+
+
+class ProcessStats(RunningProcessEvent):
+    """Event emitted periodically with the resource usage of a running process."""
+
+    name = 'launch.events.process.ProcessStats'
+
+    def __init__(
+        self,
+        *,
+        cpu_percent: float,
+        rss: int,
+        vms: int,
+        num_threads: int,
+        read_bytes: Optional[int],
+        write_bytes: Optional[int],
+        **kwargs
+    ) -> None:
+        """
+        Create a ProcessStats event.
+
+        Unmatched keyword arguments are passed to RunningProcessEvent, see it
+        for details on those arguments.
+
+        :param: cpu_percent is the CPU time used by the process since the previous
+            sample, as a percentage of the time elapsed, which exceeds 100 when the
+            process uses more than one CPU
+        :param: rss is the resident set size of the process, in bytes
+        :param: vms is the virtual memory size of the process, in bytes
+        :param: num_threads is the number of threads of the process
+        :param: read_bytes is the number of bytes the process read from storage,
+            or None if not available
+        :param: write_bytes is the number of bytes the process wrote to storage,
+            or None if not available
+        """
+        super().__init__(**kwargs)
+        self.__cpu_percent = cpu_percent
+        self.__rss = rss
+        self.__vms = vms
+        self.__num_threads = num_threads
+        self.__read_bytes = read_bytes
+        self.__write_bytes = write_bytes
+
+    @property
+    def cpu_percent(self) -> float:
+        """Getter for cpu_percent."""
+        return self.__cpu_percent
+
+    @property
+    def rss(self) -> int:
+        """Getter for rss."""
+        return self.__rss
+
+    @property
+    def vms(self) -> int:
+        """Getter for vms."""
+        return self.__vms
+
+    @property
+    def num_threads(self) -> int:
+        """Getter for num_threads."""
+        return self.__num_threads
+
+    @property
+    def read_bytes(self) -> Optional[int]:
+        """Getter for read_bytes."""
+        return self.__read_bytes
+
+    @property
+    def write_bytes(self) -> Optional[int]:
+        """Getter for write_bytes."""
+        return self.__write_bytes
@@ -39,6 +39,11 @@ class ProcessTargetedEvent(Event):
         - :func:`launch.events.process.matches_name()`
         - :func:`launch.events.process.matches_executable()`
 
+        Standard matchers are looked up in the process table of the launch,
+        see :class:`launch.process_table.ProcessTable`, so that only the
+        processes they may match are checked, while other predicates are
+        checked against every process.
+
         :param: process_matcher is a predicate which can determine if an
             ExecuteProcess action matches this event or not
         """
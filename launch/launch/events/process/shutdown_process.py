@@ -35,6 +35,7 @@ class ShutdownProcess(ProcessTargetedEvent):
     """
 
     name = 'launch.events.process.ShutdownProcess'
+    is_control_event = True
 
     def __init__(self, *, process_matcher: Callable[['ExecuteProcess'], bool]) -> None:
         """Create a ShutdownProcess event."""
@@ -31,6 +31,7 @@ class SignalProcess(ProcessTargetedEvent):
     """Event emitted when a signal should be sent to a process."""
 
     name = 'launch.events.process.SignalProcess'
+    is_control_event = True
 
     def __init__(
         self, *,
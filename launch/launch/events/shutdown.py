@@ -23,6 +23,7 @@ class Shutdown(Event):
     """Event that is emitted on shutdown of a launched system."""
 
     name = 'launch.events.Shutdown'
+    is_control_event = True
 
     def __init__(self, *, reason: Text = 'reason not given', due_to_sigint: bool = False) -> None:
         """Create a Shutdown event."""
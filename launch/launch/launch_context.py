@@ -16,10 +16,15 @@
 
 import asyncio
 import collections
+import types
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import FrozenSet  # noqa: F401
 from typing import Iterable
-from typing import List  # noqa: F401
+from typing import List
+from typing import Mapping
+from typing import MutableMapping
 from typing import Optional
 from typing import Text
 
@@ -27,7 +32,39 @@ import launch.logging
 
 from .event import Event
 from .event_handler import BaseEventHandler
+from .event_handler_registry import EventHandlerRegistry
+from .event_queue import EventQueue
+from .process_groups import ProcessGroups
+from .process_spawner import ProcessSpawner
+from .process_stats_sampler import ProcessStatsSampler
+from .process_table import ProcessTable
+from .scoped_launch_configurations import ScopedLaunchConfigurations
+from .shutdown_supervisor import ShutdownSupervisor
+from .start_scheduler import StartScheduler
 from .substitution import Substitution
+from .tracer import _combine_tracers
+from .tracer import Tracer
+
+
+class _LocalsView:
+    """Read-only, attribute based access to the context locals."""
+
+    def __init__(self, locals_mapping: Mapping[Text, Any]) -> None:
+        self.__dict__['_LocalsView__mapping'] = locals_mapping
+
+    def __getattr__(self, key):
+        mapping = self.__mapping
+        if key not in mapping:
+            raise AttributeError(
+                "context.locals does not contain attribute '{}', it contains: [{}]".format(
+                    key,
+                    ', '.join(mapping.keys())
+                )
+            )
+        return mapping[key]
+
+    def __setattr__(self, key, value):
+        raise AttributeError("can't set attribute '{}', locals are read-only".format(key))
 
 
 class LaunchContext:
@@ -37,7 +74,16 @@ class LaunchContext:
         self,
         *,
         argv: Optional[Iterable[Text]] = None,
-        noninteractive: bool = False
+        noninteractive: bool = False,
+        event_queue_high_water_mark: Optional[int] = None,
+        event_queue_low_water_mark: Optional[int] = None,
+        max_concurrent_spawns: Optional[int] = None,
+        inherit_fds: bool = False,
+        max_concurrent_starts: Optional[int] = None,
+        start_ready_timeout: Optional[float] = None,
+        process_stats_period: Optional[float] = None,
+        process_group_teardown: bool = False,
+        parent_death_signal: bool = False
     ) -> None:
         """
         Create a LaunchContext.
@@ -45,25 +91,78 @@ class LaunchContext:
         :param: argv stored in the context for access by the entities, None results in []
         :param: noninteractive if True (not default), this service will assume it has
             no terminal associated e.g. it is being executed from a non interactive script
+        :param: event_queue_high_water_mark number of queued events from which producers
+            that support flow control (e.g. process output) should pause, None (default)
+            results in an unbounded event queue
+        :param: event_queue_low_water_mark number of queued events at or below which paused
+            producers are resumed, None (default) results in half the high water mark
+        :param: max_concurrent_spawns maximum number of processes being started at once,
+            None (default) results in as many as the default number of worker threads
+        :param: inherit_fds if True (not default), processes inherit the inheritable file
+            descriptors of the launch process, see ProcessSpawner
+        :param: max_concurrent_starts maximum number of processes starting at once,
+            None (default) results in no limit
+        :param: start_ready_timeout maximum time in seconds a process waiting to be
+            ready is considered starting, None (default) results in no limit
+        :param: process_stats_period time in seconds between two samples of the resource
+            usage of the running processes, None (default) results in no sampling
+        :param: process_group_teardown if True (not default), processes are started in
+            their own process group, which is killed as a whole on teardown
+        :param: parent_death_signal if True (not default), processes started in their
+            own process group are also sent SIGKILL if the launch process dies, see
+            ProcessGroups
         """
         self.__argv = argv if argv is not None else []
         self.__noninteractive = noninteractive
 
-        self._event_queue = asyncio.Queue()  # type: asyncio.Queue
-        self._event_handlers = collections.deque()  # type: collections.deque
+        if event_queue_high_water_mark is not None:
+            if event_queue_high_water_mark < 1:
+                raise ValueError(
+                    "'event_queue_high_water_mark' must be a positive integer, got '{}'"
+                    .format(event_queue_high_water_mark))
+            if event_queue_low_water_mark is None:
+                event_queue_low_water_mark = event_queue_high_water_mark // 2
+            if not 0 <= event_queue_low_water_mark < event_queue_high_water_mark:
+                raise ValueError(
+                    "'event_queue_low_water_mark' must be non-negative and lower than"
+                    " 'event_queue_high_water_mark', got '{}'".format(event_queue_low_water_mark))
+        self.__event_queue_high_water_mark = event_queue_high_water_mark
+        self.__event_queue_low_water_mark = event_queue_low_water_mark
+        self.__resume_callbacks = []  # type: List[Callable[[], None]]
+
+        self._event_queue = EventQueue()  # type: EventQueue
+        self._event_handlers = EventHandlerRegistry()  # type: EventHandlerRegistry
         self._completion_futures = []  # type: List[asyncio.Future]
-
+        self._process_spawner = \
+            ProcessSpawner(max_concurrent_spawns, inherit_fds=inherit_fds)  # type: ProcessSpawner
+        self._start_scheduler = \
+            StartScheduler(max_concurrent_starts, start_ready_timeout)  # type: StartScheduler
+        self._process_stats_sampler = \
+            ProcessStatsSampler(process_stats_period)  # type: ProcessStatsSampler
+        self._shutdown_supervisor = ShutdownSupervisor()  # type: ShutdownSupervisor
+        self._process_groups = ProcessGroups(
+            process_group_teardown,
+            parent_death_signal=parent_death_signal)  # type: ProcessGroups
+        self.__process_table = ProcessTable()
+        # Number of processes given a CPU of each set of CPUs, distributed round robin.
+        self._cpu_affinity_round_robin_counts = {}  # type: Dict[FrozenSet[int], int]
+
+        # Locals are a chain of scopes, innermost first and globals last, so that pushing and
+        # popping a scope does not copy anything and the read-only views below stay valid.
         self.__globals = {}  # type: Dict[Text, Any]
-        self.__locals_stack = []  # type: List[Dict[Text, Any]]
-        self.__locals = {}  # type: Dict[Text, Any]
-        self.__combined_locals_cache = None  # type: Optional[Dict[Text, Any]]
+        self.__locals_chain = collections.ChainMap({}, self.__globals)
+        self.__locals_as_mapping = types.MappingProxyType(self.__locals_chain)
+        self.__locals_view = _LocalsView(self.__locals_chain)
 
-        self.__launch_configurations_stack = []  # type: List[Dict[Text, Text]]
-        self.__launch_configurations = {}  # type: Dict[Text, Text]
+        self.__launch_configurations = ScopedLaunchConfigurations()
 
         self.__is_shutdown = False
         self.__asyncio_loop = None  # type: Optional[asyncio.AbstractEventLoop]
 
+        # Hot paths only check this against None, so tracing costs nothing unless attached.
+        self.__tracers = []  # type: List[Tracer]
+        self._tracer = None  # type: Optional[Tracer]
+
         self.__logger = launch.logging.get_logger(__name__)
 
     @property
@@ -97,13 +196,13 @@ class LaunchContext:
         self._completion_futures.append(completion_future)
 
     def _push_locals(self):
-        self.__locals_stack.append(dict(self.__locals))
+        self.__locals_chain.maps.insert(0, {})
 
     def _pop_locals(self):
-        if not self.__locals_stack:
+        # The last two scopes are the outermost locals and the globals.
+        if len(self.__locals_chain.maps) <= 2:
             raise RuntimeError('locals stack unexpectedly empty')
-        self.__locals = self.__locals_stack.pop()
-        self._clear_combined_locals_cache()
+        del self.__locals_chain.maps[0]
 
     def extend_globals(self, extensions: Dict[Text, Any]) -> None:
         """
@@ -113,93 +212,137 @@ class LaunchContext:
         overlapping keys provided by extend_locals().
         """
         self.__globals.update(extensions)
-        self._clear_combined_locals_cache()
 
     def extend_locals(self, extensions: Dict[Text, Any]) -> None:
         """Extend the context.locals object with new members until popped."""
-        self.__locals.update(extensions)
-        self._clear_combined_locals_cache()
-
-    def _clear_combined_locals_cache(self):
-        self.__combined_locals_cache = None
-
-    def _get_combined_locals(self):
-        if self.__combined_locals_cache is None:
-            self.__combined_locals_cache = dict(self.__globals)
-            self.__combined_locals_cache.update(self.__locals)
-        return self.__combined_locals_cache
+        self.__locals_chain.maps[0].update(extensions)
 
     def get_locals_as_dict(self) -> Dict[Text, Any]:
         """Access the context locals as a dictionary."""
-        return self._get_combined_locals()
+        return dict(self.__locals_chain)
+
+    def _get_locals_mapping(self) -> Mapping[Text, Any]:
+        """Access the context locals as a read-only mapping, reflecting later changes."""
+        return self.__locals_as_mapping
 
     @property  # noqa: A003
     def locals(self):  # noqa: A003
         """Getter for the locals."""
-        class AttributeDict:
-
-            def __init__(self, dict_in):
-                self.__dict__['__dict'] = dict_in
-
-            def __getattr__(self, key):
-                _dict = self.__dict__['__dict']
-                if key not in _dict:
-                    raise AttributeError(
-                        "context.locals does not contain attribute '{}', it contains: [{}]".format(
-                            key,
-                            ', '.join(_dict.keys())
-                        )
-                    )
-                return _dict[key]
-
-            def __setattr__(self, key, value):
-                raise AttributeError("can't set attribute '{}', locals are read-only".format(key))
-
-        return AttributeDict(self._get_combined_locals())
+        return self.__locals_view
 
     def _push_launch_configurations(self):
-        self.__launch_configurations_stack.append(dict(self.__launch_configurations))
+        self.__launch_configurations.push()
 
     def _pop_launch_configurations(self):
-        if not self.__launch_configurations_stack:
-            raise RuntimeError('launch_configurations stack unexpectedly empty')
-        self.__launch_configurations = self.__launch_configurations_stack.pop()
+        self.__launch_configurations.pop()
 
     @property
-    def launch_configurations(self) -> Dict[Text, Text]:
+    def launch_configurations(self) -> MutableMapping[Text, Text]:
         """Getter for launch_configurations dictionary."""
         return self.__launch_configurations
 
+    @property
+    def process_table(self) -> ProcessTable:
+        """Getter for the table of the processes of the launch."""
+        return self.__process_table
+
+    def _get_event_handler_candidates(self, event: Event) -> List[BaseEventHandler]:
+        """Get the event handlers that may handle an event, see EventHandlerRegistry."""
+        return self._event_handlers.candidates(
+            event, self.__process_table.find_targets(event))
+
     def would_handle_event(self, event: Event) -> bool:
         """Check whether an event would be handled or not."""
-        return any(handler.matches(event) for handler in self._event_handlers)
+        return any(handler.matches(event) for handler in self._get_event_handler_candidates(event))
 
-    def register_event_handler(self, event_handler: BaseEventHandler, append=False) -> None:
+    def register_event_handler(
+        self,
+        event_handler: BaseEventHandler,
+        append=False,
+        *,
+        owner: Optional[Any] = None
+    ) -> None:
         """
         Register a event handler.
 
         :param append: if 'true', the new event handler will be executed after the previously
             registered ones. If not, it will prepend the old handlers.
+        :param owner: if given, the action on behalf of which the event handler is registered.
+            The event handler is then unregistered automatically once that action completes,
+            i.e. once the execution complete event for it has been processed.
         """
         if append:
-            self._event_handlers.append(event_handler)
+            self._event_handlers.append(event_handler, owner)
         else:
-            self._event_handlers.appendleft(event_handler)
+            self._event_handlers.appendleft(event_handler, owner)
 
     def unregister_event_handler(self, event_handler: BaseEventHandler) -> None:
         """Unregister an event handler."""
         self._event_handlers.remove(event_handler)
 
+    def _unregister_event_handlers_owned_by(self, owner: Any) -> int:
+        """Unregister all event handlers registered on behalf of the given owner."""
+        return self._event_handlers.remove_owned_by(owner)
+
+    def _has_event_handlers_owned_by(self, owner: Any) -> bool:
+        return self._event_handlers.count_owned_by(owner) > 0
+
+    def get_event_handler_counts_by_owner(self) -> Dict[Any, int]:
+        """Return the number of live event handlers registered on behalf of each owner."""
+        return self._event_handlers.counts_by_owner()
+
+    def add_tracer(self, tracer: Tracer) -> None:
+        """
+        Attach a tracer, to be called back on event loop activity.
+
+        Tracers are called in the order they were added.
+        """
+        self.__tracers.append(tracer)
+        self._tracer = _combine_tracers(self.__tracers)
+
+    def remove_tracer(self, tracer: Tracer) -> None:
+        """
+        Detach a tracer.
+
+        :raises ValueError: if the tracer is not attached.
+        """
+        self.__tracers.remove(tracer)
+        self._tracer = _combine_tracers(self.__tracers)
+
     def emit_event_sync(self, event: Event) -> None:
         """Emit an event synchronously."""
-        self.__logger.debug("emitting event synchronously: '{}'".format(event.name))
+        tracer = self._tracer
+        if tracer is not None:
+            tracer.on_event_emitted(event, synchronous=True)
         self._event_queue.put_nowait(event)
 
     async def emit_event(self, event: Event) -> None:
         """Emit an event."""
-        self.__logger.debug("emitting event: '{}'".format(event.name))
+        tracer = self._tracer
+        if tracer is not None:
+            tracer.on_event_emitted(event, synchronous=False)
         await self._event_queue.put(event)
 
+    def _is_event_queue_congested(self) -> bool:
+        """Return True if producers that support flow control should pause."""
+        high_water_mark = self.__event_queue_high_water_mark
+        return high_water_mark is not None and self._event_queue.qsize() >= high_water_mark
+
+    def _add_resume_callback(self, callback: Callable[[], None]) -> None:
+        """Add a callback to be called once the event queue drains down to the low water mark."""
+        self.__resume_callbacks.append(callback)
+
+    def _on_events_dequeued(self) -> None:
+        """Resume paused producers if the event queue drained down to the low water mark."""
+        if (
+            self.__resume_callbacks and
+            self._event_queue.qsize() <= self.__event_queue_low_water_mark
+        ):
+            resume_callbacks = self.__resume_callbacks
+            self.__resume_callbacks = []
+            for callback in resume_callbacks:
+                callback()
+
     def perform_substitution(self, substitution: Substitution) -> Text:
         """Perform substitution on given Substitution."""
         return substitution.perform(self)
@@ -23,12 +23,11 @@ import signal
 import threading
 import traceback
 from typing import Coroutine
+from typing import Dict  # noqa: F401
 from typing import Iterable
 from typing import List  # noqa: F401
 from typing import Optional
-from typing import Set  # noqa: F401
 from typing import Text
-from typing import Tuple  # noqa: F401
 
 import launch.logging
 
@@ -37,12 +36,15 @@ import osrf_pycommon.process_utils
 from .event import Event
 from .event_handlers import OnIncludeLaunchDescription
 from .event_handlers import OnShutdown
+from .event_queue import EventQueue
+from .events import ExecutionComplete
 from .events import IncludeLaunchDescription
 from .events import Shutdown
 from .launch_context import LaunchContext
 from .launch_description import LaunchDescription
 from .launch_description_entity import LaunchDescriptionEntity
 from .some_actions_type import SomeActionsType
+from .tracer import LoggingTracer
 from .utilities import AsyncSafeSignalManager
 from .utilities import visit_all_entities_and_collect_futures
 
@@ -55,7 +57,17 @@ class LaunchService:
         *,
         argv: Optional[Iterable[Text]] = None,
         noninteractive: bool = False,
-        debug: bool = False
+        debug: bool = False,
+        max_events_per_tick: int = 100,
+        event_queue_high_water_mark: Optional[int] = None,
+        event_queue_low_water_mark: Optional[int] = None,
+        max_concurrent_spawns: Optional[int] = None,
+        inherit_fds: bool = False,
+        max_concurrent_starts: Optional[int] = None,
+        start_ready_timeout: Optional[float] = None,
+        process_stats_period: Optional[float] = None,
+        process_group_teardown: bool = False,
+        parent_death_signal: bool = False
     ) -> None:
         """
         Create a LaunchService.
@@ -64,7 +76,46 @@ class LaunchService:
         :param: noninteractive if True (not default), this service will assume it has
             no terminal associated e.g. it is being executed from a non interactive script
         :param: debug if True (not default), asyncio the logger are seutp for debug
+        :param: max_events_per_tick maximum number of already queued events to process
+            each time the run loop wakes up, before checking on pending futures again,
+            1 results in processing a single event per wake up
+        :param: event_queue_high_water_mark number of queued events from which process
+            output reading is paused, None (default) results in an unbounded event queue
+        :param: event_queue_low_water_mark number of queued events at or below which
+            process output reading is resumed, None (default) results in half the high
+            water mark
+        :param: max_concurrent_spawns maximum number of processes being started at once,
+            from separate threads, None (default) results in as many as the default number
+            of worker threads of concurrent.futures.ThreadPoolExecutor
+        :param: inherit_fds if True (not default), file descriptors other than the standard
+            ones are not closed in new processes, so that they can be started with
+            posix_spawn(), which leaks to them any inheritable file descriptor of the
+            launch process, e.g. sockets opened by native libraries without O_CLOEXEC
+        :param: max_concurrent_starts maximum number of processes starting at once, a
+            process being starting until it is running or, if it has a ready pattern,
+            until it is ready, None (default) results in no limit, overridden by the
+            'max_concurrent_starts' launch configuration
+        :param: start_ready_timeout maximum time in seconds a process waiting to be
+            ready is considered starting, None (default) results in no limit, overridden
+            by the 'start_ready_timeout' launch configuration
+        :param: process_stats_period time in seconds between two samples of the resource
+            usage of the running processes, emitted as ProcessStats events, None (default)
+            results in no sampling, only supported where /proc is available
+        :param: process_group_teardown if True (not default), each process is started in
+            its own process group, signals are sent to whole groups, and what is left of
+            them is killed on teardown, including when launch is interrupted with SIGTERM,
+            with the launch process being a child subreaper on Linux, so that no process
+            is left behind, see launch.process_groups.ProcessGroups, only on POSIX systems
+        :param: parent_death_signal if True (not default) and process_group_teardown is
+            True, processes are also sent SIGKILL if the launch process dies, even with
+            SIGKILL, only on Linux, which requires running Python code in each new
+            process before it executes its program, and so starting it with fork()
         """
+        if max_events_per_tick < 1:
+            raise ValueError(
+                "'max_events_per_tick' must be a positive integer, got '{}'".format(
+                    max_events_per_tick))
+        self.__max_events_per_tick = max_events_per_tick
         # Setup logging and debugging.
         launch.logging.launch_config.level = logging.DEBUG if debug else logging.INFO
         self.__debug = debug
@@ -74,13 +125,32 @@ class LaunchService:
         self.__logger = launch.logging.get_logger('launch')
 
         # Setup context and register a built-in event handler for bootstrapping.
-        self.__context = LaunchContext(argv=self.__argv, noninteractive=noninteractive)
+        self.__context = LaunchContext(
+            argv=self.__argv,
+            noninteractive=noninteractive,
+            event_queue_high_water_mark=event_queue_high_water_mark,
+            event_queue_low_water_mark=event_queue_low_water_mark,
+            max_concurrent_spawns=max_concurrent_spawns,
+            inherit_fds=inherit_fds,
+            max_concurrent_starts=max_concurrent_starts,
+            start_ready_timeout=start_ready_timeout,
+            process_stats_period=process_stats_period,
+            process_group_teardown=process_group_teardown,
+            parent_death_signal=parent_death_signal,
+        )
         self.__context.register_event_handler(OnIncludeLaunchDescription())
         self.__context.register_event_handler(OnShutdown(on_shutdown=self.__on_shutdown))
+        if debug:
+            self.__context.add_tracer(LoggingTracer())
 
         # Setup storage for state.
-        self._entity_future_pairs = \
-            []  # type: List[Tuple[LaunchDescriptionEntity, asyncio.Future]]
+        # Futures of on-going entities (actions) and context completion futures are tracked
+        # with done callbacks, so that checking for idleness does not require walking them.
+        # Outstanding futures are mapped to the entity they belong to, if any, for tracing.
+        self.__outstanding_futures = \
+            {}  # type: Dict[asyncio.Future, Optional[LaunchDescriptionEntity]]
+        self.__completed_futures = []  # type: List[asyncio.Future]
+        self.__any_future_completed = None  # type: Optional[asyncio.Future]
 
         # Used to allow asynchronous use of self.__loop_from_run_thread without
         # it being set to None by run() as it exits.
@@ -125,30 +195,37 @@ class LaunchService:
         """
         self.emit_event(IncludeLaunchDescription(launch_description))
 
-    def _prune_and_count_entity_future_pairs(self):
-        needs_prune = False
-        for pair in self._entity_future_pairs:
-            if pair[1].done():
-                needs_prune = True
-        if needs_prune:
-            self._entity_future_pairs = \
-                [pair for pair in self._entity_future_pairs if not pair[1].done()]
-        return len(self._entity_future_pairs)
-
-    def _prune_and_count_context_completion_futures(self):
-        needs_prune = False
-        for future in self.__context._completion_futures:
-            if future.done():
-                needs_prune = True
-        if needs_prune:
-            self.__context._completion_futures = \
-                [f for f in self.__context._completion_futures if not f.done()]
-        return len(self.__context._completion_futures)
+    def _track_future(
+        self,
+        future: asyncio.Future,
+        entity: Optional[LaunchDescriptionEntity] = None
+    ) -> None:
+        """Track a future as outstanding work, until it is done."""
+        if future in self.__outstanding_futures:
+            return
+        self.__outstanding_futures[future] = entity
+        future.add_done_callback(self.__on_tracked_future_done)
+
+    def __on_tracked_future_done(self, future: asyncio.Future) -> None:
+        entity = self.__outstanding_futures.pop(future, None)
+        tracer = self.__context._tracer
+        if tracer is not None:
+            tracer.on_future_completed(future, entity)
+        self.__completed_futures.append(future)
+        any_future_completed = self.__any_future_completed
+        if any_future_completed is not None and not any_future_completed.done():
+            any_future_completed.set_result(None)
+
+    def _track_context_completion_futures(self) -> None:
+        completion_futures = self.__context._completion_futures
+        if completion_futures:
+            for future in completion_futures:
+                self._track_future(future)
+            completion_futures.clear()
 
     def _is_idle(self):
-        number_of_entity_future_pairs = self._prune_and_count_entity_future_pairs()
-        number_of_entity_future_pairs += self._prune_and_count_context_completion_futures()
-        return number_of_entity_future_pairs == 0 and self.__context._event_queue.empty()
+        self._track_context_completion_futures()
+        return not self.__outstanding_futures and self.__context._event_queue.empty()
 
     @contextlib.contextmanager
     def _prepare_run_loop(self):
@@ -167,13 +244,17 @@ class LaunchService:
                 # Set the asyncio loop for the context.
                 self.__context._set_asyncio_loop(this_loop)
                 # Recreate the event queue to ensure the same event loop is being used.
-                new_queue = asyncio.Queue()
+                new_queue = EventQueue()
                 while True:
                     try:
                         new_queue.put_nowait(self.__context._event_queue.get_nowait())
                     except asyncio.QueueEmpty:
                         break
                 self.__context._event_queue = new_queue
+                self.__context._process_groups.install()
+                process_table = self.__context.process_table
+                self.__context._process_groups.start_reaping_orphans(
+                    this_loop, lambda pid: process_table.get_by_pid(pid) is not None)
 
                 self.__loop_from_run_thread = this_loop
 
@@ -205,9 +286,13 @@ class LaunchService:
                 signame = signal.Signals(signum).name
                 self.__logger.error(
                     'user interrupted with ctrl-\\ ({}), terminating...'.format(signame))
-                # TODO(wjwwood): try to terminate running subprocesses before exiting.
-                self.__logger.error('using {} can result in orphaned processes'.format(signame))
-                self.__logger.error('make sure no processes launched are still running')
+                if self.__context._process_groups.enabled:
+                    self.__logger.error('killing the process groups of all processes')
+                else:
+                    # TODO(wjwwood): try to terminate running subprocesses before exiting.
+                    self.__logger.error(
+                        'using {} can result in orphaned processes'.format(signame))
+                    self.__logger.error('make sure no processes launched are still running')
                 this_loop.call_soon(this_task.cancel)
 
             with AsyncSafeSignalManager(this_loop) as manager:
@@ -222,19 +307,35 @@ class LaunchService:
             # No matter what happens, unset the loop.
             with self.__loop_from_run_thread_lock:
                 self.__context._set_asyncio_loop(None)
+                # Before the threads which started processes exit, since processes with a
+                # parent-death signal are sent SIGKILL then.
+                self.__context._process_groups.close()
+                self.__context._process_spawner.shutdown()
+                self.__context._process_stats_sampler.close()
                 self.__loop_from_run_thread = None
                 self.__shutting_down = False
 
-    async def _process_one_event(self) -> None:
-        next_event = await self.__context._event_queue.get()
+    async def _process_events(self) -> None:
+        # Wait for an event, then drain the ones that are already queued in the same
+        # wake up, up to a budget so that pending futures get a chance to be checked.
+        context = self.__context
+        event_queue = context._event_queue
+        next_event = await event_queue.get()
+        context._on_events_dequeued()
         await self.__process_event(next_event)
+        budget = self.__max_events_per_tick - 1
+        while budget > 0 and not event_queue.empty():
+            next_event = event_queue.get_nowait()
+            context._on_events_dequeued()
+            await self.__process_event(next_event)
+            budget -= 1
 
     async def __process_event(self, event: Event) -> None:
-        self.__logger.debug("processing event: '{}'".format(event))
-        for event_handler in tuple(self.__context._event_handlers):
+        tracer = self.__context._tracer
+        for event_handler in self.__context._get_event_handler_candidates(event):
             if event_handler.matches(event):
-                self.__logger.debug(
-                    "processing event: '{}' ✓ '{}'".format(event, event_handler))
+                if tracer is not None:
+                    tracer.on_event_handler_matched(event, event_handler)
                 self.__context._push_locals()
                 entities = event_handler.handle(event, self.__context)
                 entities = \
@@ -246,15 +347,16 @@ class LaunchService:
                             "expected a LaunchDescriptionEntity from event_handler, got '{}'"
                             .format(entity)
                         )
-                    self._entity_future_pairs.extend(
-                        visit_all_entities_and_collect_futures(entity, self.__context))
+                    for sub_entity, future in visit_all_entities_and_collect_futures(
+                        entity, self.__context
+                    ):
+                        self._track_future(future, sub_entity)
                 self.__context._pop_locals()
-            else:
-                pass
-                # Keep this commented for now, since it's very chatty.
-                # self.__logger.debug(
-                #     'launch.LaunchService',
-                #     "processing event: '{}' x '{}'".format(event, event_handler))
+        if isinstance(event, ExecutionComplete):
+            # The action is done, so are the event handlers registered on its behalf,
+            # and so is its process, if any.
+            self.__context._unregister_event_handlers_owned_by(event.action)
+            self.__context.process_table.discard(event.action)
 
     async def run_async(self, *, shutdown_when_idle=True) -> int:
         """
@@ -283,12 +385,13 @@ class LaunchService:
                 return loop.default_exception_handler(context)
             this_loop.set_exception_handler(_on_exception)
 
-            process_one_event_task = None
+            process_events_task = None
+            self.__any_future_completed = None
             while True:
                 try:
                     # Check if we're idle, i.e. no on-going entities (actions) or events in
                     # the queue
-                    is_idle = self._is_idle()  # self._entity_future_pairs is pruned here
+                    is_idle = self._is_idle()
                     if not self.__shutting_down and shutdown_when_idle and is_idle:
                         ret = await self._shutdown(reason='idle', due_to_sigint=False)
                         assert ret is None, ret
@@ -297,32 +400,34 @@ class LaunchService:
                     # Stop running if we're shutting down and there's no more work
                     if self.__shutting_down and is_idle:
                         if (
-                            process_one_event_task is not None and
-                            not process_one_event_task.done()
+                            process_events_task is not None and
+                            not process_events_task.done()
                         ):
-                            process_one_event_task.cancel()
+                            process_events_task.cancel()
                         break
 
-                    # Collect futures to wait on
-                    # We only need to wait on futures if there are no events to wait on
-                    entity_futures = []
-                    if self.__context._event_queue.empty():
-                        entity_futures = [pair[1] for pair in self._entity_future_pairs]
-                        entity_futures.extend(self.__context._completion_futures)
-
-                    # If the current task is done, create a new task to process any events
+                    # If the current task is done, create a new task to process the events
                     # in the queue
-                    if process_one_event_task is None or process_one_event_task.done():
-                        process_one_event_task = this_loop.create_task(self._process_one_event())
+                    if process_events_task is None or process_events_task.done():
+                        process_events_task = this_loop.create_task(self._process_events())
 
-                    # Add the process event task to the list of awaitables
-                    entity_futures.append(process_one_event_task)
+                    # Wait on events and on any outstanding future to complete, unless some
+                    # already did since the last iteration
+                    if not self.__completed_futures:
+                        if (
+                            self.__any_future_completed is None or
+                            self.__any_future_completed.done()
+                        ):
+                            self.__any_future_completed = this_loop.create_future()
+                        await asyncio.wait(
+                            (self.__any_future_completed, process_events_task),
+                            return_when=asyncio.FIRST_COMPLETED
+                        )
+                    completed_tasks = self.__completed_futures
+                    self.__completed_futures = []
+                    if process_events_task.done():
+                        completed_tasks.append(process_events_task)
 
-                    # Wait on events and futures
-                    completed_tasks, _ = await asyncio.wait(
-                        entity_futures,
-                        return_when=asyncio.FIRST_COMPLETED
-                    )
                     # Propagate exception from completed tasks
                     completed_tasks_exceptions = [task.exception() for task in completed_tasks]
                     completed_tasks_exceptions = list(filter(None, completed_tasks_exceptions))
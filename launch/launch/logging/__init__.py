@@ -23,9 +23,11 @@ import logging.handlers
 import os
 import socket
 import sys
+import time
 
 from typing import Iterable
 from typing import List
+import weakref
 
 from . import handlers
 
@@ -35,7 +37,9 @@ from ..substitutions import TextSubstitution
 
 __all__ = [
     'get_logger',
+    'get_output_line_writer',
     'get_output_loggers',
+    'get_own_log_only_output_files',
     'handlers',
     'launch_config',
     'reset',
@@ -65,6 +69,17 @@ def _get_logging_directory():
     return os.path.normpath(os.path.expanduser(log_dir))
 
 
+# Format and style of the formatters created by launch, see _make_formatter().
+_formatter_formats = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+
+
+def _make_formatter(fmt, style):
+    """Create a logging.Formatter, keeping track of its format for get_output_line_writer()."""
+    formatter = logging.Formatter(fmt, style=style)
+    _formatter_formats[formatter] = (fmt, style)
+    return formatter
+
+
 def _make_unique_log_dir(*, base_path):
     """
     Make a unique directory for logging.
@@ -200,9 +215,7 @@ class LaunchConfig:
                     )
             if screen_style is None:
                 screen_style = '{'
-            self.screen_formatter = logging.Formatter(
-                screen_format, style=screen_style
-            )
+            self.screen_formatter = _make_formatter(screen_format, screen_style)
             if self.screen_handler is not None:
                 self.screen_handler.setFormatter(self.screen_formatter)
         else:
@@ -244,9 +257,7 @@ class LaunchConfig:
                     )
             if log_style is None:
                 log_style = '{'
-            self.file_formatter = logging.Formatter(
-                log_format, style=log_style
-            )
+            self.file_formatter = _make_formatter(log_format, log_style)
             for handler in self.file_handlers.values():
                 handler.setFormatter(self.file_formatter)
         else:
@@ -427,9 +438,7 @@ def get_output_loggers(process_name, output_config):
             screen_handler = launch_config.get_screen_handler()
             # Add screen handler if necessary.
             if screen_handler not in logger.handlers:
-                screen_handler.setFormatterFor(
-                    logger, logging.Formatter('{msg}', style='{')
-                )
+                screen_handler.setFormatterFor(logger, _make_formatter('{msg}', '{'))
                 logger.addHandler(screen_handler)
 
         # If a 'log' output is configured for this source or for
@@ -439,7 +448,7 @@ def get_output_loggers(process_name, output_config):
             # Add launch main log file handler if necessary.
             if launch_log_file_handler not in logger.handlers:
                 launch_log_file_handler.setFormatterFor(
-                    logger, logging.Formatter('{created:.7f} {msg}', style='{')
+                    logger, _make_formatter('{created:.7f} {msg}', '{')
                 )
                 logger.addHandler(launch_log_file_handler)
 
@@ -449,7 +458,7 @@ def get_output_loggers(process_name, output_config):
             own_log_file_handler = launch_config.get_log_file_handler(
                 '{}-{}.log'.format(process_name, source)
             )
-            own_log_file_handler.setFormatter(logging.Formatter(fmt=None))
+            own_log_file_handler.setFormatter(_make_formatter(None, '%'))
             # Add own log file handler if necessary.
             if own_log_file_handler not in logger.handlers:
                 logger.addHandler(own_log_file_handler)
@@ -457,7 +466,7 @@ def get_output_loggers(process_name, output_config):
         # this logger should output to a combined log file.
         if 'own_log' in output_config['both']:
             combined_log_file_handler = launch_config.get_log_file_handler(process_name + '.log')
-            combined_log_file_handler.setFormatter(logging.Formatter('{msg}', style='{'))
+            combined_log_file_handler.setFormatter(_make_formatter('{msg}', '{'))
             # Add combined log file handler if necessary.
             if combined_log_file_handler not in logger.handlers:
                 logger.addHandler(combined_log_file_handler)
@@ -468,6 +477,137 @@ def get_output_loggers(process_name, output_config):
     )
 
 
+def get_own_log_only_output_files(process_name, output_config):
+    """
+    Get the log files of the process output sources that are only logged to their own log files.
+
+    See `get_output_loggers()` documentation for further reference on the
+    output_config and on log file names.
+    Output sources that are logged to the screen or to the launch main log
+    file, in addition or not to their own log files, are not included.
+
+    :param process_name: the process-like action whose outputs want to be logged.
+    :param output_config: configuration for the output loggers.
+    :returns: a dictionary mapping 'stdout' and/or 'stderr' to the names of the
+        log files, within the log directory, their output is to be written to.
+    """
+    output_config = _normalize_output_configuration(output_config)
+    own_log_files = {}
+    for source in ('stdout', 'stderr'):
+        destinations = output_config['both'] | output_config[source]
+        if destinations != {'own_log'}:
+            continue
+        file_names = []
+        if 'own_log' in output_config[source]:
+            file_names.append('{}-{}.log'.format(process_name, source))
+        if 'own_log' in output_config['both']:
+            file_names.append(process_name + '.log')
+        own_log_files[source] = file_names
+    return own_log_files
+
+
+# Emit methods of the handlers whose stream get_output_line_writer() may write to.
+_stream_handler_emits = (
+    logging.StreamHandler.emit,
+    logging.FileHandler.emit,
+    logging.handlers.WatchedFileHandler.emit,
+)
+
+
+def _get_message_formatter(handler, logger_name):
+    """Get a function formatting messages as the handler would, if launch made its formatter."""
+    formatter = None
+    if hasattr(handler, 'getFormatterFor'):
+        formatter = handler.getFormatterFor(logger_name)
+    if formatter is None:
+        formatter = handler.formatter
+    if formatter is None:
+        return None
+    fmt = _formatter_formats.get(formatter)
+    if fmt in ((None, '%'), ('%(message)s', '%'), ('{msg}', '{')):
+        return lambda msg: msg
+    if fmt == ('{created:.7f} {msg}', '{'):
+        return lambda msg: '{:.7f} {}'.format(time.time(), msg)
+    return None
+
+
+def _get_stream_handler_writer(handler, logger, format_message):
+    """Get a function writing a message to the stream of the handler, as it would."""
+    watched = isinstance(handler, logging.handlers.WatchedFileHandler)
+    terminator = handler.terminator
+
+    def write(msg):
+        handler.acquire()
+        try:
+            if watched:
+                handler.reopenIfNeeded()
+            stream = handler.stream
+            if stream is None:
+                # File handlers may open their file lazily, let them.
+                handler.handle(logger.makeRecord(
+                    logger.name, logging.INFO, '(unknown file)', 0, msg, None, None))
+                return
+            stream.write(format_message(msg) + terminator)
+            handler.flush()
+        except Exception:
+            handler.handleError(logging.makeLogRecord({'msg': msg}))
+        finally:
+            handler.release()
+    return write
+
+
+def get_output_line_writer(logger):
+    """
+    Get a function logging lines of process output with the given output logger.
+
+    If the lines would only be handled by launch screen and log file handlers,
+    with the formatters set by `get_output_loggers()` or by launch_config, and
+    these only log the message and possibly a timestamp, the returned function
+    writes them to the streams of those handlers directly, skipping the creation
+    of a `logging.LogRecord` for each line.
+    Otherwise, it is the `info` method of the logger.
+    The handlers are inspected once, when calling this function, so it should
+    be called again if handlers are added or removed later on.
+
+    :param logger: the output logger, as returned by `get_output_loggers()`.
+    :returns: a function taking a line, already formatted, and logging it.
+    """
+    if logger.disabled or logger.filters or not logger.isEnabledFor(logging.INFO):
+        return logger.info
+    known_handlers = list(launch_config.file_handlers.values())
+    if launch_config.screen_handler is not None:
+        known_handlers.append(launch_config.screen_handler)
+    writers = []
+    current_logger = logger
+    while current_logger is not None:
+        for handler in current_logger.handlers:
+            if handler.level > logging.INFO:
+                continue
+            if (
+                handler.filters or
+                type(handler).emit not in _stream_handler_emits or
+                all(handler is not known_handler for known_handler in known_handlers)
+            ):
+                return logger.info
+            format_message = _get_message_formatter(handler, logger.name)
+            if format_message is None:
+                return logger.info
+            writers.append(_get_stream_handler_writer(handler, logger, format_message))
+        if not current_logger.propagate:
+            break
+        current_logger = current_logger.parent
+    if not writers:
+        # Let logging decide what to do with it.
+        return logger.info
+    if len(writers) == 1:
+        return writers[0]
+
+    def write_all(msg):
+        for write in writers:
+            write(msg)
+    return write_all
+
+
 # Track all loggers to support module resets
 class LaunchLogger(logging.getLoggerClass()):
     all_loggers: List[logging.Logger] = []
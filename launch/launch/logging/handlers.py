@@ -31,6 +31,11 @@ def with_per_logger_formatting(cls):
             logger_name = logger if isinstance(logger, str) else logger.name
             self._formatters[logger_name] = formatter
 
+        def getFormatterFor(self, logger):
+            """Get the formatter for a given logger instance or logger name, if any."""
+            logger_name = logger if isinstance(logger, str) else logger.name
+            return self._formatters.get(logger_name)
+
         def unsetFormatterFor(self, logger):
             """Unset formatter for a given logger instance or logger name, if any."""
             logger_name = logger if isinstance(logger, str) else logger.name
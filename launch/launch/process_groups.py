@@ -0,0 +1,401 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the ProcessGroups class."""
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import platform
+import signal
+import time
+from typing import Callable
+from typing import Dict  # noqa: F401
+from typing import List
+from typing import Optional
+from typing import Set  # noqa: F401
+
+import launch.logging
+
+# See prctl(2).
+_PR_SET_PDEATHSIG = 1
+_PR_SET_CHILD_SUBREAPER = 36
+
+
+def _load_prctl() -> Optional[Callable[..., int]]:
+    """Get the prctl() function of the C library, on Linux only."""
+    if platform.system() != 'Linux':
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        prctl = libc.prctl
+    except (OSError, AttributeError):
+        return None
+    prctl.restype = ctypes.c_int
+    prctl.argtypes = [ctypes.c_int, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong]
+    return prctl
+
+
+_prctl = _load_prctl()
+
+
+class ProcessGroups:
+    """
+    Process groups of the processes of a launch, killed as a whole on teardown.
+
+    When enabled, each process is started in its own process group, by
+    :class:`launch.process_spawner.ProcessSpawner` with `new_process_group`,
+    and signals meant for a process are sent to its whole group, so that they
+    also reach the processes it started, e.g. from a shell or wrapper script.
+    Processes can also be sent SIGKILL if the launch process dies, see
+    :meth:`get_preexec_fn`, but only if `parent_death_signal` is True.
+    Whatever is left of a group once its process exited is shut down like the
+    process was, if it was being shut down, and otherwise is killed when
+    launch is done, see :meth:`close`.
+    Groups are forgotten as soon as no process is left in them, see
+    :meth:`reap` and :meth:`release`, since their id may then be reused.
+
+    On Linux, the launch process also becomes a child subreaper while groups
+    are used, see :meth:`install`, so that the processes left behind by the
+    processes of the launch are reparented to it rather than to init, and can
+    be waited for until they are really gone.
+    Processes which leave their group, e.g. with setsid(), are not tracked,
+    and so are not signaled nor killed, but are reaped once they exit, along
+    with any other process reparented to the launch process, see
+    :meth:`start_reaping_orphans`.
+
+    Only POSIX systems are supported, and the subreaper and the parent-death
+    signal only on Linux.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        poll_period: float = 0.1,
+        *,
+        parent_death_signal: bool = False
+    ) -> None:
+        """
+        Create a ProcessGroups.
+
+        :param: enabled whether processes are started in their own process group,
+            False (default) results in processes being started in the process group
+            of the launch process
+        :param: poll_period time in seconds between two checks of whether processes
+            are left in a group whose process exited
+        :param: parent_death_signal if True (not default) and enabled, processes are
+            sent SIGKILL if the launch process dies, on Linux only, see get_preexec_fn()
+        """
+        if poll_period <= 0.0:
+            raise ValueError("'poll_period' must be positive, got '{}'".format(poll_period))
+        self.__enabled = enabled and hasattr(os, 'killpg')
+        self.__poll_period = poll_period
+        self.__parent_death_signal = self.__enabled and parent_death_signal and _prctl is not None
+        self.__subreaper = False
+        # Process groups which may still have processes in them, by process group id.
+        self.__groups = {}  # type: Dict[int, None]
+        # Timers checking on the groups whose process exited, see release().
+        self.__release_timers = {}  # type: Dict[int, asyncio.TimerHandle]
+        self.__is_known_child = None  # type: Optional[Callable[[int], bool]]
+        self.__orphan_timer = None  # type: Optional[asyncio.TimerHandle]
+        # Unknown zombie children found by the last check, see reap_orphans().
+        self.__orphan_candidates = set()  # type: Set[int]
+
+    @property
+    def enabled(self) -> bool:
+        """Getter for whether processes are started in their own process group."""
+        return self.__enabled
+
+    @property
+    def poll_period(self) -> float:
+        """Getter for poll_period."""
+        return self.__poll_period
+
+    @property
+    def parent_death_signal(self) -> bool:
+        """Getter for whether processes are sent SIGKILL if the launch process dies."""
+        return self.__parent_death_signal
+
+    @property
+    def subreaper(self) -> bool:
+        """Getter for whether the launch process is a child subreaper."""
+        return self.__subreaper
+
+    def __len__(self) -> int:
+        return len(self.__groups)
+
+    def __contains__(self, pgid: int) -> bool:
+        return pgid in self.__groups
+
+    def install(self) -> None:
+        """Make the launch process a child subreaper, if enabled and supported."""
+        if not self.__enabled or self.__subreaper or _prctl is None:
+            return
+        if _prctl(_PR_SET_CHILD_SUBREAPER, 1, 0, 0, 0) != 0:
+            launch.logging.get_logger('launch').warning(
+                'failed to become a child subreaper: {}'.format(
+                    os.strerror(ctypes.get_errno())))
+            return
+        self.__subreaper = True
+
+    def get_preexec_fn(
+        self,
+        preexec_fn: Optional[Callable[[], None]] = None
+    ) -> Optional[Callable[[], None]]:
+        """
+        Get the function to call in a process before it executes its program.
+
+        If `parent_death_signal` is True, the function has the process sent SIGKILL
+        when the thread which started it exits, which is only once launch is done
+        for the threads of :class:`launch.process_spawner.ProcessSpawner`.
+        This can only be done from the process itself, and so from Python code
+        between fork() and exec(), which :class:`subprocess.Popen` documents as
+        unsafe in the presence of threads, and which prevents it from using
+        vfork() or posix_spawn(), hence being opt-in.
+        The function only calls prctl(), through a function loaded beforehand.
+
+        :param: preexec_fn function to call afterwards, if any
+        :returns: the function, or preexec_fn if `parent_death_signal` is False
+        """
+        if not self.__parent_death_signal:
+            return preexec_fn
+        return _PreexecFn(os.getpid(), preexec_fn)
+
+    def add(self, pgid: int) -> None:
+        """Add the process group of a process started in a new process group."""
+        self.__groups[pgid] = None
+
+    def signal(self, pgid: int, signum: int) -> None:
+        """
+        Send a signal to all the processes of a process group.
+
+        :raises ProcessLookupError: if there is no process left in the group
+        """
+        os.killpg(pgid, signum)
+
+    def reap(self, pgid: int) -> int:
+        """
+        Reap the processes of a process group which exited, without waiting.
+
+        The process which the group was created for must have been reaped already,
+        since it would be reaped from here otherwise.
+        The group is forgotten if no process is left in it.
+
+        :returns: the number of processes reaped
+        """
+        count = 0
+        while True:
+            try:
+                result = os.waitid(os.P_PGID, pgid, os.WEXITED | os.WNOHANG)
+            except ChildProcessError:
+                break
+            if result is None:
+                break
+            count += 1
+        try:
+            os.killpg(pgid, 0)
+        except ProcessLookupError:
+            self.__groups.pop(pgid, None)
+        except PermissionError:
+            # Only processes of other users are left.
+            pass
+        return count
+
+    def release(self, loop: asyncio.AbstractEventLoop, pgid: int) -> None:
+        """
+        Forget a process group whose process exited, once no process is left in it.
+
+        Whatever is left of the group keeps running, and is checked on every
+        `poll_period` seconds from the given event loop, until it is gone or
+        killed by :meth:`close`.
+        """
+        self.__release_timers.pop(pgid, None)
+        self.reap(pgid)
+        if pgid in self.__groups:
+            self.__release_timers[pgid] = loop.call_later(
+                self.__poll_period, self.release, loop, pgid)
+
+    def start_reaping_orphans(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        is_known_child: Callable[[int], bool]
+    ) -> None:
+        """
+        Reap the processes reparented to the launch process, while it is a child subreaper.
+
+        Processes are reparented to the launch process when their parent exits,
+        whether or not they are in a tracked process group, and are left as
+        zombies once they exit unless reaped, which is checked on every
+        `poll_period` seconds from the given event loop, see :meth:`reap_orphans`,
+        until :meth:`close`.
+
+        :param: loop the event loop to check from
+        :param: is_known_child function returning whether a child process with the
+            given pid is reaped by someone else, e.g. is a process of the launch
+        """
+        if not self.__subreaper:
+            return
+        self.__is_known_child = is_known_child
+        if self.__orphan_timer is None:
+            self.__orphan_timer = loop.call_later(
+                self.__poll_period, self.__reap_orphans_periodically, loop)
+
+    def reap_orphans(self, is_known_child: Callable[[int], bool], *, wait: bool = True) -> int:
+        """
+        Reap the exited child processes which nothing else reaps, without waiting.
+
+        Children are found through /proc, only if there is any exited child.
+        Since the children known to be reaped by someone else may not be known as
+        such as soon as they exit, e.g. before their pid is known, unknown children
+        are only reaped if they had already exited on the previous call.
+        Other child processes of the launch process, e.g. started by custom actions,
+        are reaped as well if they are not reaped in the meantime.
+
+        :param: is_known_child function returning whether a child process with the
+            given pid is reaped by someone else
+        :param: wait if False, unknown children are reaped right away
+        :returns: the number of processes reaped
+        """
+        try:
+            if os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOHANG | os.WNOWAIT) is None:
+                self.__orphan_candidates.clear()
+                return 0
+        except ChildProcessError:
+            self.__orphan_candidates.clear()
+            return 0
+        count = 0
+        candidates = set()
+        for pid in _get_zombie_children():
+            if is_known_child(pid):
+                continue
+            if wait and pid not in self.__orphan_candidates:
+                candidates.add(pid)
+                continue
+            try:
+                if os.waitpid(pid, os.WNOHANG)[0] == pid:
+                    count += 1
+            except ChildProcessError:
+                # Reaped by someone else in the meantime.
+                pass
+        self.__orphan_candidates = candidates
+        return count
+
+    def __reap_orphans_periodically(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.reap_orphans(self.__is_known_child)
+        self.__orphan_timer = loop.call_later(
+            self.__poll_period, self.__reap_orphans_periodically, loop)
+
+    def kill(self, pgid: int, timeout: float = 1.0) -> bool:
+        """
+        Kill what is left of a process group, and reap it.
+
+        The process which the group was created for is reaped too, if it was not
+        reaped already, in which case its return code is lost.
+
+        :param: pgid the process group id
+        :param: timeout time in seconds to wait for the processes of the group to be
+            gone, i.e. to be reaped if they are children of the launch process
+        :returns: True if no process is left in the group
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            gone = self.__kill_and_reap(pgid)
+            if gone is not False:
+                return bool(gone)
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.001)
+
+    def close(self, timeout: float = 1.0) -> None:
+        """
+        Kill what is left of all process groups, and stop being a child subreaper.
+
+        :param: timeout time in seconds to wait for the processes of all the groups
+            to be gone, after which the groups left are forgotten
+        """
+        for timer in self.__release_timers.values():
+            timer.cancel()
+        self.__release_timers.clear()
+        if self.__orphan_timer is not None:
+            self.__orphan_timer.cancel()
+            self.__orphan_timer = None
+        deadline = time.monotonic() + timeout
+        remaining = list(self.__groups)
+        while remaining:
+            left = []
+            for pgid in remaining:
+                gone = self.__kill_and_reap(pgid)
+                if gone is None or (not gone and time.monotonic() >= deadline):
+                    launch.logging.get_logger('launch').warning(
+                        'processes of process group {} could not be killed'.format(pgid))
+                    self.__groups.pop(pgid, None)
+                elif not gone:
+                    left.append(pgid)
+            remaining = left
+            if remaining:
+                time.sleep(0.001)
+        if self.__subreaper:
+            if self.__is_known_child is not None:
+                self.reap_orphans(self.__is_known_child, wait=False)
+                self.__is_known_child = None
+            _prctl(_PR_SET_CHILD_SUBREAPER, 0, 0, 0, 0)
+            self.__subreaper = False
+
+    def __kill_and_reap(self, pgid: int) -> Optional[bool]:
+        """Send SIGKILL to a process group, and return whether it is gone, None if it cannot be."""
+        try:
+            os.killpg(pgid, signal.SIGKILL)
+        except ProcessLookupError:
+            self.__groups.pop(pgid, None)
+            return True
+        except PermissionError:
+            # Only processes of other users are left.
+            return None
+        self.reap(pgid)
+        return pgid not in self.__groups
+
+
+def _get_zombie_children() -> List[int]:
+    """Get the pids of the child processes of the launch process which exited."""
+    parent_pid = os.getpid()
+    zombies = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open('/proc/{}/stat'.format(entry), 'r') as f:
+                # The name of the program, between parentheses, may contain spaces.
+                fields = f.read().rsplit(')', 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        if fields[0] == 'Z' and int(fields[1]) == parent_pid:
+            zombies.append(int(entry))
+    return zombies
+
+
+class _PreexecFn:
+    """Function called in a process before it executes its program, see get_preexec_fn()."""
+
+    def __init__(self, parent_pid: int, then: Optional[Callable[[], None]]) -> None:
+        self.parent_pid = parent_pid
+        self.then = then
+
+    def __call__(self) -> None:
+        _prctl(_PR_SET_PDEATHSIG, signal.SIGKILL, 0, 0, 0)
+        if os.getppid() != self.parent_pid:
+            # The launch process died already.
+            os.kill(os.getpid(), signal.SIGKILL)
+        if self.then is not None:
+            self.then()
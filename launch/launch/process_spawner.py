@@ -0,0 +1,372 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the ProcessSpawner class."""
+
+import asyncio
+import concurrent.futures
+import functools
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+from typing import Any  # noqa: F401
+from typing import Callable
+from typing import Dict  # noqa: F401
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Set  # noqa: F401
+from typing import Text
+from typing import Tuple
+from typing import Union
+
+from .child_watcher import ChildWatcher
+
+
+class ProcessSpawner:
+    """
+    Start processes from a pool of threads, several of them at once.
+
+    Starting a process blocks the calling thread until the new process has
+    executed its program, so processes are started from worker threads
+    instead of the asyncio event loop, up to `max_concurrent_spawns` at once.
+    Processes are started with :class:`subprocess.Popen`, which uses
+    vfork() or posix_spawn() instead of fork() whenever possible, so that
+    starting a process does not copy the page tables of, and cause
+    copy-on-write page faults in, a large launch process.
+    File descriptors other than the standard ones are closed in the new
+    processes, like with :meth:`asyncio.loop.subprocess_exec`, unless
+    `inherit_fds` is True, which allows posix_spawn() to be used, programs
+    also being looked up in the PATH here for it.
+    Processes then inherit the inheritable file descriptors of the launch
+    process: those opened by Python are not, but those opened by native
+    libraries, e.g. sockets, may be.
+
+    The spawned processes are bound to the asyncio event loop through
+    :class:`asyncio.SubprocessTransport` and :class:`asyncio.SubprocessProtocol`,
+    like processes started with :meth:`asyncio.loop.subprocess_exec`, and are
+    reaped by a :class:`launch.child_watcher.ChildWatcher`, without a thread
+    per process where supported.
+    Only POSIX systems are supported.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_spawns: Optional[int] = None,
+        child_watcher_mode: Optional[Text] = None,
+        *,
+        inherit_fds: bool = False
+    ) -> None:
+        """
+        Create a ProcessSpawner.
+
+        :param: max_concurrent_spawns maximum number of processes being started at
+            once, None (default) results in the default number of workers of
+            :class:`concurrent.futures.ThreadPoolExecutor`
+        :param: child_watcher_mode mode of the ChildWatcher reaping the processes,
+            None (default) results in the first supported one
+        :param: inherit_fds if True (not default), file descriptors other than the
+            standard ones are not closed in the new processes
+        """
+        if max_concurrent_spawns is not None and max_concurrent_spawns < 1:
+            raise ValueError(
+                "'max_concurrent_spawns' must be a positive integer, got '{}'".format(
+                    max_concurrent_spawns))
+        self.__max_concurrent_spawns = max_concurrent_spawns
+        self.__inherit_fds = inherit_fds
+        self.__executor = None  # type: Optional[concurrent.futures.ThreadPoolExecutor]
+        self.__lock = threading.Lock()
+        self.__child_watcher = ChildWatcher(child_watcher_mode)
+
+    @property
+    def max_concurrent_spawns(self) -> Optional[int]:
+        """Getter for max_concurrent_spawns."""
+        return self.__max_concurrent_spawns
+
+    @property
+    def inherit_fds(self) -> bool:
+        """Getter for inherit_fds."""
+        return self.__inherit_fds
+
+    @property
+    def child_watcher(self) -> ChildWatcher:
+        """Getter for the ChildWatcher reaping the processes."""
+        return self.__child_watcher
+
+    async def spawn(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        protocol_factory: Callable[[], asyncio.SubprocessProtocol],
+        cmd: List[Text],
+        *,
+        shell: bool = False,
+        cwd: Optional[Text] = None,
+        env: Optional[Mapping[Text, Text]] = None,
+        stdin: Union[int, None] = subprocess.PIPE,
+        stdout: Union[int, None] = subprocess.PIPE,
+        stderr: Union[int, None] = subprocess.PIPE,
+        new_process_group: bool = False,
+        preexec_fn: Optional[Callable[[], None]] = None
+    ) -> Tuple[asyncio.SubprocessTransport, asyncio.SubprocessProtocol]:
+        """
+        Start a process, and connect it to a new protocol.
+
+        Standard input, output and error are pipes by default, which are written
+        to and read from the given event loop.
+
+        :param: loop the event loop to connect the process to
+        :param: protocol_factory function returning the protocol to connect to
+        :param: cmd the command to execute, joined with spaces if shell is True
+        :param: shell if True, the command is executed through the shell
+        :param: cwd working directory of the process, None to inherit it
+        :param: env environment variables of the process, None to inherit them
+        :param: stdin either subprocess.PIPE, or a file descriptor to read input from
+        :param: stdout either subprocess.PIPE, or a file descriptor to write output to
+        :param: stderr either subprocess.PIPE, or a file descriptor to write output to
+        :param: new_process_group if True (not default), the process is started in a new
+            process group, with the process_group argument of subprocess.Popen, or before
+            Python 3.11 in a new session with start_new_session, neither of which prevent
+            processes from being started with posix_spawn() or vfork()
+        :param: preexec_fn function called in the new process before it executes the
+            program, which prevents processes from being started with posix_spawn() or
+            vfork(), None (default) results in no function being called
+        :returns: the transport and protocol of the process
+        """
+        future = loop.run_in_executor(
+            self.__get_executor(),
+            functools.partial(_spawn, cmd, shell=shell, cwd=cwd, env=env, stdin=stdin,
+                              stdout=stdout, stderr=stderr,
+                              new_process_group=new_process_group, preexec_fn=preexec_fn,
+                              inherit_fds=self.__inherit_fds))
+        try:
+            popen = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The process may still be started, do not leave it behind.
+            future.add_done_callback(functools.partial(self.__kill_spawned_process, loop))
+            raise
+        exited = loop.create_future()
+        self.__child_watcher.add_child(loop, popen, functools.partial(_set_exited, exited))
+        transport = _SpawnedProcessTransport(loop, protocol_factory(), popen, exited)
+        try:
+            await transport._connect()
+        except BaseException:
+            transport.close()
+            raise
+        return transport, transport.get_protocol()
+
+    def shutdown(self) -> None:
+        """Stop the worker threads, once they are done starting processes, and reaping."""
+        with self.__lock:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self.__child_watcher.close()
+
+    def __kill_spawned_process(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        future: asyncio.Future
+    ) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        popen = future.result()
+        popen.kill()
+        for pipe in (popen.stdin, popen.stdout, popen.stderr):
+            if pipe is not None:
+                pipe.close()
+        self.__child_watcher.add_child(loop, popen, lambda returncode: None)
+
+    def __get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.__max_concurrent_spawns,
+                    thread_name_prefix='launch_process_spawner')
+            return self.__executor
+
+
+def _spawn(
+    cmd: List[Text],
+    *,
+    shell: bool,
+    cwd: Optional[Text],
+    env: Optional[Mapping[Text, Text]],
+    stdin: Union[int, None],
+    stdout: Union[int, None],
+    stderr: Union[int, None],
+    new_process_group: bool,
+    preexec_fn: Optional[Callable[[], None]],
+    inherit_fds: bool
+) -> subprocess.Popen:
+    """Start a process."""
+    kwargs = {}  # type: Dict[Text, Any]
+    if new_process_group:
+        if sys.version_info >= (3, 11):
+            kwargs['process_group'] = 0
+        else:
+            kwargs['start_new_session'] = True
+    executable = None
+    if shell:
+        args = ' '.join(cmd)  # type: Union[Text, List[Text]]
+    else:
+        args = cmd
+        # posix_spawn() is only used by subprocess for programs given with a path.
+        if inherit_fds and os.path.dirname(cmd[0]) == '':
+            executable = shutil.which(cmd[0], path=os.pathsep.join(os.get_exec_path(env)))
+    popen = subprocess.Popen(
+        args, executable=executable, shell=shell, cwd=cwd, env=env,
+        stdin=stdin, stdout=stdout, stderr=stderr, close_fds=not inherit_fds,
+        preexec_fn=preexec_fn, **kwargs)
+    return popen
+
+
+def _set_exited(exited: asyncio.Future, returncode: int) -> None:
+    if not exited.done():
+        exited.set_result(returncode)
+
+
+class _PipeProtocol(asyncio.Protocol):
+    """Protocol forwarding what happens to a pipe of a process to its transport."""
+
+    def __init__(self, transport: '_SpawnedProcessTransport', fd: int) -> None:
+        self.__transport = transport
+        self.__fd = fd
+
+    def data_received(self, data: bytes) -> None:
+        self.__transport._pipe_data_received(self.__fd, data)
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.__transport._pipe_connection_lost(self.__fd, exc)
+
+    def pause_writing(self) -> None:
+        self.__transport._pause_writing()
+
+    def resume_writing(self) -> None:
+        self.__transport._resume_writing()
+
+
+class _SpawnedProcessTransport(asyncio.SubprocessTransport):
+    """Transport for a process started by a ProcessSpawner."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        protocol: asyncio.SubprocessProtocol,
+        popen: subprocess.Popen,
+        exited: asyncio.Future
+    ) -> None:
+        super().__init__()
+        self.__loop = loop
+        self.__protocol = protocol
+        self.__popen = popen
+        self.__exited = exited
+        self.__pid = popen.pid
+        self.__returncode = None  # type: Optional[int]
+        self.__pipes = {}  # type: Dict[int, asyncio.BaseTransport]
+        self.__open_pipes = set()  # type: Set[int]
+        self.__closed = False
+        self.__finished = False
+        # Calls to the protocol until it is connected.
+        self.__pending_calls = []  # type: Optional[List[Tuple[Callable[..., None], Tuple]]]
+
+    async def _connect(self) -> None:
+        loop = self.__loop
+        popen = self.__popen
+        for fd, pipe in ((0, popen.stdin), (1, popen.stdout), (2, popen.stderr)):
+            if pipe is None:
+                continue
+            connect_pipe = loop.connect_write_pipe if fd == 0 else loop.connect_read_pipe
+            transport, _ = await connect_pipe(functools.partial(_PipeProtocol, self, fd), pipe)
+            self.__pipes[fd] = transport
+            self.__open_pipes.add(fd)
+        self.__protocol.connection_made(self)
+        pending_calls, self.__pending_calls = self.__pending_calls, None
+        for callback, args in pending_calls:
+            callback(*args)
+        self.__exited.add_done_callback(self.__process_exited)
+
+    def __call(self, callback: Callable[..., None], *args: Any) -> None:
+        if self.__pending_calls is not None:
+            self.__pending_calls.append((callback, args))
+        else:
+            callback(*args)
+
+    def _pipe_data_received(self, fd: int, data: bytes) -> None:
+        self.__call(self.__protocol.pipe_data_received, fd, data)
+
+    def _pipe_connection_lost(self, fd: int, exc: Optional[Exception]) -> None:
+        self.__call(self.__protocol.pipe_connection_lost, fd, exc)
+        self.__open_pipes.discard(fd)
+        self.__call(self.__try_finish)
+
+    def _pause_writing(self) -> None:
+        self.__call(self.__protocol.pause_writing)
+
+    def _resume_writing(self) -> None:
+        self.__call(self.__protocol.resume_writing)
+
+    def __process_exited(self, exited: asyncio.Future) -> None:
+        if exited.cancelled():
+            return
+        self.__returncode = exited.result()
+        self.__protocol.process_exited()
+        self.__try_finish()
+
+    def __try_finish(self) -> None:
+        if self.__finished or self.__returncode is None or self.__open_pipes:
+            return
+        self.__finished = True
+        self.__protocol.connection_lost(None)
+
+    def get_protocol(self) -> asyncio.SubprocessProtocol:
+        return self.__protocol
+
+    def is_closing(self) -> bool:
+        return self.__closed
+
+    def close(self) -> None:
+        if self.__closed:
+            return
+        self.__closed = True
+        for pipe in self.__pipes.values():
+            pipe.close()
+        # Like asyncio subprocess transports, kill the process if it is still running.
+        if self.__returncode is None and self.__popen.poll() is None:
+            try:
+                self.__popen.kill()
+            except ProcessLookupError:
+                pass
+
+    def get_pid(self) -> int:
+        return self.__pid
+
+    def get_returncode(self) -> Optional[int]:
+        return self.__returncode
+
+    def get_pipe_transport(self, fd: int) -> Optional[asyncio.BaseTransport]:
+        return self.__pipes.get(fd)
+
+    def send_signal(self, signum: int) -> None:
+        if self.__returncode is not None:
+            raise ProcessLookupError()
+        self.__popen.send_signal(signum)
+
+    def terminate(self) -> None:
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self) -> None:
+        self.send_signal(signal.SIGKILL)
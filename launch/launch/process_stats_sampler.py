@@ -0,0 +1,181 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the ProcessStatsSampler class."""
+
+import asyncio
+import os
+import re
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Text
+from typing import Tuple
+
+
+StatsCallback = Callable[[Dict[Text, Any]], None]
+
+_IO_BYTES_PATTERN = re.compile(rb'^read_bytes: (\d+)\nwrite_bytes: (\d+)$', re.MULTILINE)
+
+
+class ProcessStatsSampler:
+    """
+    Periodically sample the resource usage of processes, from /proc.
+
+    All the processes being sampled are sampled in a single pass, every period,
+    reading /proc/<pid>/stat and /proc/<pid>/io through file descriptors kept
+    open for as long as each process is sampled, so that each sample of a
+    process takes two read system calls.
+    The samples are passed to a callback given for each process, as a
+    dictionary with the keyword arguments of
+    :class:`launch.events.process.ProcessStats` that describe resource usage.
+
+    Sampling is only supported where /proc is available, e.g. on Linux,
+    and processes are silently not sampled elsewhere.
+    """
+
+    def __init__(self, period: Optional[float] = None) -> None:
+        """
+        Create a ProcessStatsSampler.
+
+        :param: period time in seconds between two samples of the processes, None
+            (default) results in sampling being disabled
+        """
+        if period is not None and period <= 0.0:
+            raise ValueError("'period' must be positive, got '{}'".format(period))
+        self.__period = period
+        self.__supported = os.path.isfile('/proc/self/stat')
+        if self.__supported:
+            self.__clock_ticks = os.sysconf('SC_CLK_TCK')
+            self.__page_size = os.sysconf('SC_PAGE_SIZE')
+        self.__processes = {}  # type: Dict[int, _SampledProcess]
+        self.__timer = None  # type: Optional[asyncio.TimerHandle]
+
+    @property
+    def period(self) -> Optional[float]:
+        """Getter for period."""
+        return self.__period
+
+    @property
+    def enabled(self) -> bool:
+        """Getter for whether processes are sampled."""
+        return self.__period is not None and self.__supported
+
+    def add(self, pid: int, callback: StatsCallback) -> None:
+        """
+        Start sampling a process, from the running asyncio event loop.
+
+        :param: pid the process id of the process
+        :param: callback function called with each sample of the process
+        """
+        if not self.enabled or pid in self.__processes:
+            return
+        try:
+            process = _SampledProcess(pid, callback)
+        except OSError:
+            # The process exited already.
+            return
+        try:
+            process.cpu_ticks = self.__read_stat(process)[0]
+        except (OSError, ValueError, IndexError):
+            process.close()
+            return
+        process.sampled_at = time.monotonic()
+        self.__processes[pid] = process
+        if self.__timer is None:
+            self.__timer = asyncio.get_running_loop().call_later(self.__period, self.__sample)
+
+    def remove(self, pid: int) -> None:
+        """Stop sampling a process, if it is being sampled."""
+        process = self.__processes.pop(pid, None)
+        if process is not None:
+            process.close()
+        if not self.__processes and self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+
+    def close(self) -> None:
+        """Stop sampling all processes."""
+        for pid in list(self.__processes):
+            self.remove(pid)
+
+    def __sample(self) -> None:
+        self.__timer = asyncio.get_running_loop().call_later(self.__period, self.__sample)
+        for pid, process in list(self.__processes.items()):
+            try:
+                cpu_ticks, num_threads, vms, rss_pages = self.__read_stat(process)
+                read_bytes, write_bytes = self.__read_io(process)
+            except (OSError, ValueError, IndexError):
+                # The process exited, and is about to be removed.
+                continue
+            now = time.monotonic()
+            elapsed = now - process.sampled_at
+            cpu_percent = 0.0
+            if elapsed > 0.0:
+                cpu_percent = \
+                    (cpu_ticks - process.cpu_ticks) / self.__clock_ticks / elapsed * 100.0
+            process.cpu_ticks = cpu_ticks
+            process.sampled_at = now
+            process.callback({
+                'cpu_percent': cpu_percent,
+                'rss': rss_pages * self.__page_size,
+                'vms': vms,
+                'num_threads': num_threads,
+                'read_bytes': read_bytes,
+                'write_bytes': write_bytes,
+            })
+
+    @staticmethod
+    def __read_stat(process: '_SampledProcess') -> Tuple[int, int, int, int]:
+        data = os.pread(process.stat_fd, 4096, 0)
+        # The command name, in parentheses, may contain spaces.
+        fields = data[data.rindex(b')') + 2:].split(None, 22)
+        # Fields are numbered from 3 (state) on, see proc(5).
+        utime, stime = int(fields[11]), int(fields[12])
+        return utime + stime, int(fields[17]), int(fields[20]), int(fields[21])
+
+    @staticmethod
+    def __read_io(process: '_SampledProcess') -> Tuple[Optional[int], Optional[int]]:
+        if process.io_fd is None:
+            return None, None
+        match = _IO_BYTES_PATTERN.search(os.pread(process.io_fd, 4096, 0))
+        if match is None:
+            return None, None
+        return int(match.group(1)), int(match.group(2))
+
+
+class _SampledProcess:
+    """Process being sampled, with its open /proc files and its previous sample."""
+
+    def __init__(self, pid: int, callback: StatsCallback) -> None:
+        self.callback = callback
+        self.stat_fd = os.open('/proc/{}/stat'.format(pid), os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            self.io_fd = os.open(
+                '/proc/{}/io'.format(pid), os.O_RDONLY | os.O_CLOEXEC)  # type: Optional[int]
+        except PermissionError:
+            # I/O counters are not available, e.g. for setuid programs.
+            self.io_fd = None
+        except OSError:
+            os.close(self.stat_fd)
+            raise
+        self.cpu_ticks = 0
+        self.sampled_at = 0.0
+
+    def close(self) -> None:
+        os.close(self.stat_fd)
+        if self.io_fd is not None:
+            os.close(self.io_fd)
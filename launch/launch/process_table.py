@@ -0,0 +1,201 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the ProcessTable and ProcessMatcher classes."""
+
+import os
+from typing import Any
+from typing import Callable
+from typing import Dict  # noqa: F401
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Text
+from typing import Tuple  # noqa: F401
+
+
+class ProcessMatcher:
+    """
+    Predicate matching the actions of processes, which a ProcessTable can look up.
+
+    Matchers are called with an action, like any process matcher, and also
+    name the index of a ProcessTable and the key under which the actions they
+    may match are found, so that the matching actions are looked up instead of
+    calling the matcher with every action.
+    """
+
+    INDEXES = ('action', 'pid', 'name', 'executable')
+
+    def __init__(self, predicate: Callable[[Any], bool], index: Text, key: Any) -> None:
+        """
+        Create a ProcessMatcher.
+
+        :param: predicate function returning True for the actions that match
+        :param: index the index to look up actions in, one of INDEXES
+        :param: key the key to look up actions with, in that index
+        """
+        if index not in self.INDEXES:
+            raise ValueError("'index' must be one of {}, got '{}'".format(self.INDEXES, index))
+        self.__predicate = predicate
+        self.__index = index
+        self.__key = key
+
+    @property
+    def index(self) -> Text:
+        """Getter for index."""
+        return self.__index
+
+    @property
+    def key(self) -> Any:
+        """Getter for key."""
+        return self.__key
+
+    def __call__(self, action: Any) -> bool:
+        return self.__predicate(action)
+
+
+class ProcessTable:
+    """
+    Table of the process actions of a launch, indexed by action, pid, name and executable.
+
+    Actions are in the table from the time they are executed until their
+    execution is complete, and their pid is known while their process runs.
+    Executables are indexed by basename, e.g. 'ls' for '/usr/bin/ls'.
+
+    The launch service uses the table to deliver events targeted at processes,
+    like :class:`launch.events.process.SignalProcess`, to the actions matched
+    by ProcessMatchers only, see :meth:`find`.
+    The table may also be queried by external tools.
+    """
+
+    def __init__(self) -> None:
+        """Create a ProcessTable."""
+        # Name, executable and pid of each action, by action id.
+        self.__entries = {}  # type: Dict[int, Tuple[Any, Text, Text, Optional[int]]]
+        self.__by_pid = {}  # type: Dict[int, Any]
+        self.__by_name = {}  # type: Dict[Text, Dict[int, Any]]
+        self.__by_executable = {}  # type: Dict[Text, Dict[int, Any]]
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter([entry[0] for entry in self.__entries.values()])
+
+    def __contains__(self, action: Any) -> bool:
+        return id(action) in self.__entries
+
+    def add(self, action: Any, *, name: Text, executable: Text) -> None:
+        """
+        Add the action of a process to the table.
+
+        :param: action the action of the process
+        :param: name the name of the process
+        :param: executable the executable of the process, i.e. the first item of its cmd
+        """
+        self.discard(action)
+        self.__entries[id(action)] = (action, name, executable, None)
+        self.__by_name.setdefault(name, {})[id(action)] = action
+        self.__by_executable.setdefault(os.path.basename(executable), {})[id(action)] = action
+
+    def set_pid(self, action: Any, pid: Optional[int]) -> None:
+        """Set the pid of the process of an action in the table, None once it exited."""
+        entry = self.__entries.get(id(action))
+        if entry is None:
+            return
+        action, name, executable, previous_pid = entry
+        if previous_pid is not None and self.__by_pid.get(previous_pid) is action:
+            del self.__by_pid[previous_pid]
+        if pid is not None:
+            self.__by_pid[pid] = action
+        self.__entries[id(action)] = (action, name, executable, pid)
+
+    def discard(self, action: Any) -> None:
+        """Remove the action of a process from the table, if it is in it."""
+        entry = self.__entries.pop(id(action), None)
+        if entry is None:
+            return
+        _, name, executable, pid = entry
+        if pid is not None and self.__by_pid.get(pid) is action:
+            del self.__by_pid[pid]
+        for index, key in (
+            (self.__by_name, name), (self.__by_executable, os.path.basename(executable))
+        ):
+            actions = index[key]
+            del actions[id(action)]
+            if not actions:
+                del index[key]
+
+    def get_by_pid(self, pid: int) -> Optional[Any]:
+        """Return the action of the running process with the given pid, if any."""
+        return self.__by_pid.get(pid)
+
+    def find_by_name(self, name: Text) -> List[Any]:
+        """Return the actions of the processes with the given name."""
+        return list(self.__by_name.get(name, {}).values())
+
+    def find_by_executable(self, executable: Text) -> List[Any]:
+        """
+        Return the actions of the processes whose executable ends with the given one.
+
+        Like :func:`launch.events.process.matches_executable`, 'ls' matches both
+        'ls' and '/usr/bin/ls'.
+        Only the executables with a matching basename are compared.
+        """
+        basename = os.path.basename(executable)
+        if basename != executable:
+            # Only executables with that very basename may end with a path.
+            candidates = self.__by_executable.get(basename, {}).values()
+        else:
+            candidates = [
+                action
+                for key, actions in self.__by_executable.items() if key.endswith(basename)
+                for action in actions.values()
+            ]
+        entries = self.__entries
+        return [
+            action for action in candidates if entries[id(action)][2].endswith(executable)
+        ]
+
+    def find(self, process_matcher: Callable[[Any], bool]) -> List[Any]:
+        """
+        Return the actions that the given process matcher may match.
+
+        Actions are looked up if the matcher is a ProcessMatcher, and all the
+        actions in the table are returned otherwise.
+        Callers must still call the matcher with each of the returned actions.
+        """
+        if not isinstance(process_matcher, ProcessMatcher):
+            return list(self)
+        index, key = process_matcher.index, process_matcher.key
+        if index == 'action':
+            return [key] if key in self else []
+        if index == 'pid':
+            action = self.get_by_pid(key)
+            return [action] if action is not None else []
+        if index == 'name':
+            return self.find_by_name(key)
+        return self.find_by_executable(key)
+
+    def find_targets(self, event: Any) -> Optional[List[Any]]:
+        """
+        Return the actions an event targeted at processes may be for.
+
+        :returns: the actions, or None if the event is not targeted at processes,
+            i.e. if it has no `process_matcher`
+        """
+        process_matcher = getattr(event, 'process_matcher', None)
+        if process_matcher is None:
+            return None
+        return self.find(process_matcher)
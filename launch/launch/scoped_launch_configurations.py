@@ -0,0 +1,122 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the ScopedLaunchConfigurations class."""
+
+import collections.abc
+from typing import Dict
+from typing import Iterator
+from typing import List  # noqa: F401
+from typing import Text
+
+# Marks a launch configuration as deleted in a scope, hiding it in outer scopes.
+_DELETED = object()
+
+
+class ScopedLaunchConfigurations(collections.abc.MutableMapping):
+    """
+    Launch configurations dictionary, layered in scopes.
+
+    Pushing a scope is constant time and does not copy any launch configuration.
+    Changes (setting, deleting or clearing launch configurations) only affect
+    the innermost scope, and they are all discarded when it is popped.
+    Looking up a launch configuration walks the scopes from the innermost one
+    outwards, so it takes time proportional to the scope depth.
+    """
+
+    def __init__(self) -> None:
+        """Create a ScopedLaunchConfigurations with a single, empty, scope."""
+        # Scopes are ordered from the outermost to the innermost one.
+        self.__scopes = [{}]  # type: List[Dict[Text, object]]
+        # Whether each scope was cleared, i.e. hides all outer scopes.
+        self.__cleared = [False]  # type: List[bool]
+
+    def push(self) -> None:
+        """Push a new, innermost, scope."""
+        self.__scopes.append({})
+        self.__cleared.append(False)
+
+    def pop(self) -> None:
+        """
+        Pop the innermost scope, discarding any change made within it.
+
+        :raises RuntimeError: if there is no scope left to pop.
+        """
+        if len(self.__scopes) == 1:
+            raise RuntimeError('launch_configurations stack unexpectedly empty')
+        self.__scopes.pop()
+        self.__cleared.pop()
+
+    @property
+    def depth(self) -> int:
+        """Getter for the number of pushed scopes."""
+        return len(self.__scopes) - 1
+
+    def __getitem__(self, key: Text) -> Text:
+        scopes = self.__scopes
+        cleared = self.__cleared
+        for index in range(len(scopes) - 1, -1, -1):
+            value = scopes[index].get(key, _DELETED)
+            if value is not _DELETED:
+                return value
+            if key in scopes[index] or cleared[index]:
+                break
+        raise KeyError(key)
+
+    def __setitem__(self, key: Text, value: Text) -> None:
+        self.__scopes[-1][key] = value
+
+    def __delitem__(self, key: Text) -> None:
+        if key not in self:
+            raise KeyError(key)
+        if len(self.__scopes) == 1:
+            del self.__scopes[-1][key]
+        else:
+            self.__scopes[-1][key] = _DELETED
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __flatten(self) -> Dict[Text, Text]:
+        flattened = {}  # type: Dict[Text, object]
+        start = 0
+        for index in range(len(self.__scopes) - 1, -1, -1):
+            if self.__cleared[index]:
+                start = index
+                break
+        for scope in self.__scopes[start:]:
+            flattened.update(scope)
+        return {key: value for key, value in flattened.items() if value is not _DELETED}
+
+    def __iter__(self) -> Iterator[Text]:
+        return iter(self.__flatten())
+
+    def __len__(self) -> int:
+        return len(self.__flatten())
+
+    def __repr__(self) -> Text:
+        return repr(self.__flatten())
+
+    def clear(self) -> None:
+        """Remove all launch configurations, in the innermost scope only."""
+        self.__scopes[-1] = {}
+        self.__cleared[-1] = True
+
+    def copy(self) -> Dict[Text, Text]:
+        """Return a flat dictionary with the launch configurations currently in scope."""
+        return self.__flatten()
@@ -0,0 +1,160 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the ShutdownSupervisor class."""
+
+import asyncio
+import math
+from typing import Callable
+from typing import Dict  # noqa: F401
+from typing import Optional
+from typing import Text
+
+import launch.logging
+
+EscalateCallback = Callable[[Text, float], None]
+
+
+class ShutdownEscalation:
+    """Escalation of the shutdown of a single process, see ShutdownSupervisor."""
+
+    def __init__(
+        self,
+        supervisor: 'ShutdownSupervisor',
+        loop: asyncio.AbstractEventLoop,
+        escalate: EscalateCallback,
+        sigterm_timeout: float,
+        sigkill_timeout: float
+    ) -> None:
+        """Create a ShutdownEscalation, see ShutdownSupervisor.supervise()."""
+        self._supervisor = supervisor
+        self._loop = loop
+        self._escalate = escalate
+        self._sigterm_timeout = sigterm_timeout
+        self._sigkill_timeout = sigkill_timeout
+        # Signal to send next, if any, and when.
+        self._next_signal = 'SIGTERM'  # type: Optional[Text]
+        self._tick = None  # type: Optional[int]
+
+    @property
+    def next_signal(self) -> Optional[Text]:
+        """Getter for the name of the signal to escalate to next, None once done."""
+        return self._next_signal
+
+    def cancel(self) -> None:
+        """Stop escalating, e.g. once the process exited."""
+        self._supervisor._cancel(self)
+
+
+class ShutdownSupervisor:
+    """
+    Escalate the shutdown of all the processes that do not terminate in time.
+
+    Processes being shut down are sent SIGTERM if they did not terminate
+    `sigterm_timeout` seconds after being asked to, and SIGKILL if they still
+    did not terminate `sigkill_timeout` seconds after that.
+    Deadlines are rounded up to a multiple of `deadline_resolution`, so that
+    processes shut down at about the same time share deadlines, and are
+    escalated together with a single timer per deadline.
+    """
+
+    def __init__(self, deadline_resolution: float = 0.05) -> None:
+        """
+        Create a ShutdownSupervisor.
+
+        :param: deadline_resolution time in seconds that deadlines are rounded up to
+            a multiple of, i.e. the maximum delay added to the timeouts
+        """
+        if deadline_resolution <= 0.0:
+            raise ValueError(
+                "'deadline_resolution' must be positive, got '{}'".format(deadline_resolution))
+        self.__deadline_resolution = deadline_resolution
+        # Processes to escalate, by deadline, in the order they were shut down.
+        self.__batches = {}  # type: Dict[int, Dict[ShutdownEscalation, None]]
+        self.__timers = {}  # type: Dict[int, asyncio.TimerHandle]
+
+    @property
+    def deadline_resolution(self) -> float:
+        """Getter for deadline_resolution."""
+        return self.__deadline_resolution
+
+    @property
+    def pending_count(self) -> int:
+        """Getter for the number of processes which may still be escalated."""
+        return sum(len(batch) for batch in self.__batches.values())
+
+    @property
+    def timer_count(self) -> int:
+        """Getter for the number of timers pending, one per distinct deadline."""
+        return len(self.__timers)
+
+    def supervise(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        escalate: EscalateCallback,
+        sigterm_timeout: float,
+        sigkill_timeout: float
+    ) -> ShutdownEscalation:
+        """
+        Start escalating the shutdown of a process, from the given event loop.
+
+        :param: loop the event loop to escalate from
+        :param: escalate function called with the name of the signal to send to the
+            process, 'SIGTERM' or 'SIGKILL', and the timeout that expired
+        :param: sigterm_timeout time in seconds until escalating to SIGTERM
+        :param: sigkill_timeout time in seconds until escalating to SIGKILL, after SIGTERM
+        :returns: the escalation, to cancel once the process exited
+        """
+        escalation = ShutdownEscalation(self, loop, escalate, sigterm_timeout, sigkill_timeout)
+        self.__schedule(escalation, sigterm_timeout)
+        return escalation
+
+    def _cancel(self, escalation: ShutdownEscalation) -> None:
+        escalation._next_signal = None
+        tick, escalation._tick = escalation._tick, None
+        if tick is None:
+            return
+        batch = self.__batches[tick]
+        del batch[escalation]
+        if not batch:
+            del self.__batches[tick]
+            self.__timers.pop(tick).cancel()
+
+    def __schedule(self, escalation: ShutdownEscalation, timeout: float) -> None:
+        loop = escalation._loop
+        tick = math.ceil((loop.time() + timeout) / self.__deadline_resolution)
+        escalation._tick = tick
+        if tick not in self.__batches:
+            self.__batches[tick] = {}
+            self.__timers[tick] = loop.call_at(
+                tick * self.__deadline_resolution, self.__escalate, tick)
+        self.__batches[tick][escalation] = None
+
+    def __escalate(self, tick: int) -> None:
+        del self.__timers[tick]
+        for escalation in self.__batches.pop(tick):
+            escalation._tick = None
+            signal_name = escalation._next_signal
+            if signal_name == 'SIGTERM':
+                timeout = escalation._sigterm_timeout
+                escalation._next_signal = 'SIGKILL'
+                self.__schedule(escalation, escalation._sigkill_timeout)
+            else:
+                timeout = escalation._sigkill_timeout
+                escalation._next_signal = None
+            try:
+                escalation._escalate(signal_name, timeout)
+            except Exception:
+                launch.logging.get_logger('launch').exception(
+                    "failed to escalate shutdown to '{}'".format(signal_name))
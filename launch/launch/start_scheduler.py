@@ -0,0 +1,152 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the StartScheduler class."""
+
+import asyncio
+import collections
+from typing import Deque  # noqa: F401
+from typing import Optional
+from typing import Tuple  # noqa: F401
+
+
+class StartSlot:
+    """Permission for a process to be starting, given by a StartScheduler."""
+
+    def __init__(self, release_callback) -> None:
+        """Create a StartSlot, calling release_callback when it is first released."""
+        self.__release_callback = release_callback
+
+    @property
+    def released(self) -> bool:
+        """Getter for released."""
+        return self.__release_callback is None
+
+    def release(self) -> None:
+        """Release the slot, admitting the next process waiting to start, if any."""
+        release_callback, self.__release_callback = self.__release_callback, None
+        if release_callback is not None:
+            release_callback()
+
+
+class StartScheduler:
+    """
+    Limit the number of processes starting at once, launch-wide.
+
+    Processes wait for a StartSlot before starting, and are starting until
+    the slot is released, e.g. once the process is running or once it
+    signaled that it is ready.
+    Processes waiting to start are admitted in the order they asked to start.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_starts: Optional[int] = None,
+        start_ready_timeout: Optional[float] = None
+    ) -> None:
+        """
+        Create a StartScheduler.
+
+        :param: max_concurrent_starts maximum number of processes starting at once,
+            None (default) results in no limit
+        :param: start_ready_timeout maximum time in seconds a process waiting to be
+            ready is considered starting, None (default) results in no limit
+        """
+        self.__check_max_concurrent_starts(max_concurrent_starts)
+        if start_ready_timeout is not None and start_ready_timeout <= 0.0:
+            raise ValueError(
+                "'start_ready_timeout' must be positive, got '{}'".format(start_ready_timeout))
+        self.__max_concurrent_starts = max_concurrent_starts
+        self.__start_ready_timeout = start_ready_timeout
+        self.__starting_count = 0
+        # Processes waiting to start, with the limit each of them is subject to.
+        self.__waiters = \
+            collections.deque()  # type: Deque[Tuple[asyncio.Future, Optional[int]]]
+
+    @property
+    def max_concurrent_starts(self) -> Optional[int]:
+        """Getter for max_concurrent_starts."""
+        return self.__max_concurrent_starts
+
+    @property
+    def start_ready_timeout(self) -> Optional[float]:
+        """Getter for start_ready_timeout."""
+        return self.__start_ready_timeout
+
+    @property
+    def starting_count(self) -> int:
+        """Getter for the number of processes currently starting."""
+        return self.__starting_count
+
+    @property
+    def waiting_count(self) -> int:
+        """Getter for the number of processes currently waiting to start."""
+        return sum(1 for waiter, _ in self.__waiters if not waiter.cancelled())
+
+    async def acquire(self, max_concurrent_starts: Optional[int] = None) -> StartSlot:
+        """
+        Wait until the process can start, and return its StartSlot.
+
+        :param: max_concurrent_starts overrides the limit given on construction
+            for this process, None (default) results in that limit
+        """
+        if max_concurrent_starts is None:
+            max_concurrent_starts = self.__max_concurrent_starts
+        else:
+            self.__check_max_concurrent_starts(max_concurrent_starts)
+        if not self.__waiters and self.__can_start(max_concurrent_starts):
+            self.__starting_count += 1
+            return StartSlot(self.__release)
+        entry = (asyncio.get_running_loop().create_future(), max_concurrent_starts)
+        self.__waiters.append(entry)
+        try:
+            await entry[0]
+        except asyncio.CancelledError:
+            if entry[0].cancelled():
+                if entry in self.__waiters:
+                    self.__waiters.remove(entry)
+                # The next process may have been waiting behind this one only.
+                self.__admit()
+            else:
+                # Admitted, but cancelled before resuming.
+                self.__release()
+            raise
+        return StartSlot(self.__release)
+
+    def __can_start(self, max_concurrent_starts: Optional[int]) -> bool:
+        return max_concurrent_starts is None or self.__starting_count < max_concurrent_starts
+
+    def __release(self) -> None:
+        self.__starting_count -= 1
+        self.__admit()
+
+    def __admit(self) -> None:
+        while self.__waiters:
+            waiter, max_concurrent_starts = self.__waiters[0]
+            if waiter.cancelled():
+                # Cancelled, but not resumed yet to leave the queue by itself.
+                self.__waiters.popleft()
+                continue
+            if not self.__can_start(max_concurrent_starts):
+                break
+            self.__waiters.popleft()
+            self.__starting_count += 1
+            waiter.set_result(None)
+
+    @staticmethod
+    def __check_max_concurrent_starts(max_concurrent_starts: Optional[int]) -> None:
+        if max_concurrent_starts is not None and max_concurrent_starts < 1:
+            raise ValueError(
+                "'max_concurrent_starts' must be a positive integer, got '{}'".format(
+                    max_concurrent_starts))
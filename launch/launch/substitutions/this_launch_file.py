@@ -54,6 +54,6 @@ class ThisLaunchFile(Substitution):
         """
         subst_failure = SubstitutionFailure(
                 'ThisLaunchFile used outside of a launch file (in a script)')
-        if 'current_launch_file_path' not in context.get_locals_as_dict():
+        if 'current_launch_file_path' not in context._get_locals_mapping():
             raise subst_failure
         return context.locals.current_launch_file_path
@@ -52,7 +52,7 @@ class ThisLaunchFileDir(Substitution):
 
         :raises: SubstitutionFailure if not in a launch file
         """
-        if 'current_launch_file_directory' not in context.get_locals_as_dict():
+        if 'current_launch_file_directory' not in context._get_locals_mapping():
             raise SubstitutionFailure(
                 'ThisLaunchFileDir used outside of a launch file (in a script)')
         return context.locals.current_launch_file_directory
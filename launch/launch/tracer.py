@@ -0,0 +1,115 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the Tracer class."""
+
+import asyncio
+from typing import Iterable
+from typing import List  # noqa: F401
+from typing import Optional
+
+import launch.logging
+
+
+class Tracer:
+    """
+    Base class for tracers of the launch event loop.
+
+    Tracers are attached to a :class:`launch.LaunchContext` with
+    :meth:`launch.LaunchContext.add_tracer`, and are called back with the
+    objects involved rather than with formatted messages.
+    When no tracer is attached, none of the hooks cost more than a check.
+
+    All hooks do nothing by default, subclasses override the ones they need.
+    Hooks are called from the launch event loop, and must not block it.
+    """
+
+    def on_event_emitted(self, event: 'launch.Event', *, synchronous: bool) -> None:
+        """Call when an event is put in the event queue."""
+        pass
+
+    def on_event_handler_matched(
+        self,
+        event: 'launch.Event',
+        event_handler: 'launch.event_handler.BaseEventHandler'
+    ) -> None:
+        """Call when an event handler matched an event, right before it handles it."""
+        pass
+
+    def on_entity_visited(
+        self,
+        entity: 'launch.LaunchDescriptionEntity',
+        sub_entities: Optional[Iterable['launch.LaunchDescriptionEntity']]
+    ) -> None:
+        """Call when an entity was visited, with the sub-entities it returned, if any."""
+        pass
+
+    def on_future_completed(
+        self,
+        future: asyncio.Future,
+        entity: Optional['launch.LaunchDescriptionEntity']
+    ) -> None:
+        """Call when a future the launch service waits on completed."""
+        pass
+
+
+class LoggingTracer(Tracer):
+    """Tracer that logs the launch event loop activity at the debug level."""
+
+    def __init__(self, logger_name: str = 'launch') -> None:
+        """Create a LoggingTracer."""
+        self.__logger = launch.logging.get_logger(logger_name)
+
+    def on_event_emitted(self, event, *, synchronous):
+        """Log the emitted event."""
+        if synchronous:
+            self.__logger.debug("emitting event synchronously: '{}'".format(event.name))
+        else:
+            self.__logger.debug("emitting event: '{}'".format(event.name))
+
+    def on_event_handler_matched(self, event, event_handler):
+        """Log the matched event handler."""
+        self.__logger.debug("processing event: '{}' ✓ '{}'".format(event, event_handler))
+
+
+class _TracerGroup(Tracer):
+    """Tracer calling each of a group of tracers, in order."""
+
+    def __init__(self, tracers: List[Tracer]) -> None:
+        self.__tracers = list(tracers)
+
+    def on_event_emitted(self, event, *, synchronous):
+        for tracer in self.__tracers:
+            tracer.on_event_emitted(event, synchronous=synchronous)
+
+    def on_event_handler_matched(self, event, event_handler):
+        for tracer in self.__tracers:
+            tracer.on_event_handler_matched(event, event_handler)
+
+    def on_entity_visited(self, entity, sub_entities):
+        for tracer in self.__tracers:
+            tracer.on_entity_visited(entity, sub_entities)
+
+    def on_future_completed(self, future, entity):
+        for tracer in self.__tracers:
+            tracer.on_future_completed(future, entity)
+
+
+def _combine_tracers(tracers: List[Tracer]) -> Optional[Tracer]:
+    """Return a single tracer calling all given tracers, or None if there are none."""
+    if not tracers:
+        return None
+    if len(tracers) == 1:
+        return tracers[0]
+    return _TracerGroup(tracers)
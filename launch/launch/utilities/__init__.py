@@ -14,22 +14,38 @@
 
 """Package for utilties."""
 
+from .cached_output_impl import CachedOutput
 from .class_tools_impl import is_a, is_a_subclass, isclassinstance
 from .create_future_impl import create_future
 from .ensure_argument_type_impl import ensure_argument_type
+from .line_splitter_impl import LineSplitter
 from .normalize_to_list_of_substitutions_impl import normalize_to_list_of_substitutions
+from .output_filters_impl import LineRateLimiter
+from .output_filters_impl import RepeatedLineCollapser
+from .output_format_impl import compile_output_format
+from .output_pump_impl import OutputPump
 from .perform_substitutions_impl import perform_substitutions
+from .process_pipe_impl import ProcessPipe
+from .process_resources_impl import ProcessResources
 from .signal_management import AsyncSafeSignalManager
 from .visit_all_entities_and_collect_futures_impl import visit_all_entities_and_collect_futures
 
 __all__ = [
+    'CachedOutput',
+    'compile_output_format',
     'is_a',
     'is_a_subclass',
     'isclassinstance',
     'create_future',
     'ensure_argument_type',
+    'LineRateLimiter',
+    'LineSplitter',
     'perform_substitutions',
+    'ProcessPipe',
+    'ProcessResources',
     'AsyncSafeSignalManager',
     'normalize_to_list_of_substitutions',
+    'OutputPump',
+    'RepeatedLineCollapser',
     'visit_all_entities_and_collect_futures',
 ]
@@ -0,0 +1,133 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the CachedOutput class."""
+
+import collections
+from typing import Deque  # noqa: F401
+from typing import Optional
+from typing import Text
+from typing import Tuple
+
+
+class CachedOutput:
+    """
+    Store for the output of a process, optionally bounded in size.
+
+    Text is appended in chunks, and the oldest text is discarded once the
+    stored text exceeds the size limit, if any.
+    Each character written has an offset, counted from the first character
+    ever written, so readers can keep a cursor and only read what was written
+    since, with :meth:`read`.
+    """
+
+    def __init__(self, size_limit: Optional[int] = None) -> None:
+        """
+        Create a CachedOutput.
+
+        :param: size_limit maximum number of characters to keep, None (default)
+            results in keeping all of them
+        """
+        if size_limit is not None and size_limit < 1:
+            raise ValueError(
+                "'size_limit' must be a positive integer, got '{}'".format(size_limit))
+        self.__size_limit = size_limit
+        self.__chunks = collections.deque()  # type: Deque[Text]
+        # Number of leading characters of the oldest chunk that were discarded, so that
+        # discarding part of a chunk does not copy the rest of it.
+        self.__head_skip = 0
+        self.__size = 0
+        self.__start_offset = 0
+
+    @property
+    def size_limit(self) -> Optional[int]:
+        """Getter for size_limit."""
+        return self.__size_limit
+
+    @property
+    def start_offset(self) -> int:
+        """Getter for the offset of the oldest character still stored."""
+        return self.__start_offset
+
+    @property
+    def end_offset(self) -> int:
+        """Getter for the offset right after the newest character stored."""
+        return self.__start_offset + self.__size
+
+    def write(self, text: Text) -> None:
+        """Append text, discarding the oldest text if the size limit is exceeded."""
+        if not text:
+            return
+        self.__chunks.append(text)
+        self.__size += len(text)
+        if self.__size_limit is None:
+            return
+        excess = self.__size - self.__size_limit
+        while excess > 0:
+            oldest_size = len(self.__chunks[0]) - self.__head_skip
+            if oldest_size <= excess:
+                self.__chunks.popleft()
+                self.__head_skip = 0
+                discarded = oldest_size
+            else:
+                self.__head_skip += excess
+                discarded = excess
+            self.__size -= discarded
+            self.__start_offset += discarded
+            excess -= discarded
+
+    def read(self, offset: int = 0) -> Tuple[Text, int]:
+        """
+        Return the text written since the given offset, and the offset to read from next.
+
+        Only the chunks written since the given offset are copied.
+        If the text at the given offset was already discarded, the text is
+        returned from the oldest character still stored.
+        """
+        end_offset = self.end_offset
+        if offset >= end_offset:
+            return '', end_offset
+        offset = max(offset, self.__start_offset)
+        # Walk the chunks back from the newest one, until the offset is reached.
+        chunks = []
+        chunk_offset = end_offset
+        for chunk in reversed(self.__chunks):
+            chunk_offset -= len(chunk)
+            if chunk_offset <= offset:
+                # The oldest chunk starts before the start offset, if partially discarded.
+                chunks.append(chunk[offset - chunk_offset:])
+                break
+            chunks.append(chunk)
+        chunks.reverse()
+        return ''.join(chunks), end_offset
+
+    def getvalue(self) -> Text:
+        """Return all the text stored."""
+        if not self.__chunks:
+            return ''
+        if len(self.__chunks) > 1 or self.__head_skip:
+            # Coalesce chunks, so that calling this again does not join them again.
+            self.__chunks[0] = self.__chunks[0][self.__head_skip:]
+            self.__head_skip = 0
+            text = ''.join(self.__chunks)
+            self.__chunks.clear()
+            self.__chunks.append(text)
+        return self.__chunks[0]
+
+    def clear(self) -> None:
+        """Discard all the text stored, offsets keep increasing."""
+        self.__start_offset = self.end_offset
+        self.__chunks.clear()
+        self.__head_skip = 0
+        self.__size = 0
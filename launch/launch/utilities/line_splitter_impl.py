@@ -0,0 +1,78 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the LineSplitter class."""
+
+import codecs
+import os
+from typing import List
+from typing import Text
+
+
+class LineSplitter:
+    """
+    Incrementally split a stream of bytes into decoded lines.
+
+    Chunks of bytes are fed as they are read, e.g. from a process output pipe,
+    and only complete lines are returned, without their line terminator.
+    Bytes after the last line terminator are kept until more bytes complete
+    the line, so each byte is only copied once into the pending tail and
+    decoded once, and multibyte characters split across chunks are decoded
+    correctly.
+    """
+
+    def __init__(self, encoding: Text = 'utf-8', errors: Text = 'replace') -> None:
+        """
+        Create a LineSplitter.
+
+        :param: encoding the encoding of the bytes stream, which must be ASCII compatible
+        :param: errors the decoding error handling scheme, see :func:`codecs.decode`
+        """
+        self.__decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+        self.__encoding = encoding
+        self.__errors = errors
+        self.__pending = bytearray()
+        self.__strip_carriage_return = os.linesep == '\r\n'
+
+    def feed(self, data: bytes) -> List[Text]:
+        """Feed a chunk of bytes, and return the lines it completed, if any."""
+        end = data.rfind(b'\n') + 1
+        if end == 0:
+            self.__pending += data
+            return []
+        pending = self.__pending
+        if pending:
+            pending += memoryview(data)[:end]
+            text = self.__decoder.decode(pending)
+            self.__pending = bytearray(memoryview(data)[end:])
+        else:
+            text = self.__decoder.decode(memoryview(data)[:end])
+            self.__pending = bytearray(memoryview(data)[end:])
+        lines = text.split('\n')
+        # The text ends with a line terminator, so the last element is always empty.
+        del lines[-1]
+        if self.__strip_carriage_return:
+            lines = [line[:-1] if line.endswith('\r') else line for line in lines]
+        return lines
+
+    def pending_text(self) -> Text:
+        """Return the decoded text of the incomplete line, without consuming it."""
+        return bytes(self.__pending).decode(self.__encoding, errors=self.__errors)
+
+    def flush(self) -> Text:
+        """Return the decoded text of the incomplete line, if any, and reset the splitter."""
+        text = self.__decoder.decode(self.__pending, final=True)
+        self.__decoder.reset()
+        self.__pending = bytearray()
+        return text
@@ -0,0 +1,122 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the LineRateLimiter and RepeatedLineCollapser classes."""
+
+import time
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Text
+
+
+class LineRateLimiter:
+    """
+    Token bucket limiting the rate of lines of output.
+
+    The bucket holds up to `burst` tokens, and is refilled at `rate` tokens per
+    second. Each line takes a token, and lines are dropped while the bucket
+    is empty.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Create a LineRateLimiter.
+
+        :param: rate number of lines per second allowed on average
+        :param: burst number of lines allowed at once, None (default) results in
+            one second worth of lines, and at least one line
+        :param: clock function returning the current time, in seconds
+        """
+        if rate <= 0:
+            raise ValueError("'rate' must be positive, got '{}'".format(rate))
+        if burst is None:
+            burst = max(1, int(rate))
+        if burst < 1:
+            raise ValueError("'burst' must be a positive integer, got '{}'".format(burst))
+        self.__rate = rate
+        self.__burst = burst
+        self.__clock = clock
+        self.__tokens = float(burst)
+        self.__last_refill = clock()
+        self.dropped_count = 0
+
+    def allow(self, count: int) -> int:
+        """Take tokens for up to count lines, and return the number of lines allowed."""
+        now = self.__clock()
+        self.__tokens = min(
+            float(self.__burst), self.__tokens + (now - self.__last_refill) * self.__rate)
+        self.__last_refill = now
+        allowed = min(count, int(self.__tokens))
+        self.__tokens -= allowed
+        self.dropped_count += count - allowed
+        return allowed
+
+    def filter(self, lines: List[Text]) -> List[Text]:
+        """Return the lines that are allowed, dropping the latest ones if needed."""
+        allowed = self.allow(len(lines))
+        if allowed < len(lines):
+            return lines[:allowed]
+        return lines
+
+
+class RepeatedLineCollapser:
+    """
+    Collapse identical consecutive lines of output.
+
+    The first of identical consecutive lines is kept, and the following ones
+    are replaced by a single notice with their number, once a different line
+    comes or the collapser is flushed.
+    """
+
+    NOTICE_FORMAT = 'last message repeated {} times'
+
+    def __init__(self) -> None:
+        """Create a RepeatedLineCollapser."""
+        self.__last_line = None  # type: Optional[Text]
+        self.__repeat_count = 0
+        self.collapsed_count = 0
+
+    def collapse(self, lines: List[Text]) -> List[Text]:
+        """Return the given lines, with identical consecutive lines collapsed."""
+        collapsed_lines = []
+        last_line = self.__last_line
+        for line in lines:
+            if line == last_line:
+                self.__repeat_count += 1
+                self.collapsed_count += 1
+                continue
+            if self.__repeat_count:
+                collapsed_lines.append(self.__take_notice())
+            collapsed_lines.append(line)
+            last_line = line
+        self.__last_line = last_line
+        return collapsed_lines
+
+    def flush(self) -> Optional[Text]:
+        """Return the notice for the lines collapsed so far, if any, and reset the collapser."""
+        notice = self.__take_notice() if self.__repeat_count else None
+        self.__last_line = None
+        return notice
+
+    def __take_notice(self) -> Text:
+        notice = self.NOTICE_FORMAT.format(self.__repeat_count)
+        self.__repeat_count = 0
+        return notice
@@ -0,0 +1,91 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the compile_output_format() utility function."""
+
+import string
+from typing import Any
+from typing import Callable
+from typing import List  # noqa: F401
+from typing import Text
+
+
+def compile_output_format(output_format: Text, this: Any) -> Callable[[Text], Text]:
+    """
+    Compile a process output format into a function formatting output lines.
+
+    The returned function is equivalent to
+    ``lambda line: output_format.format(line=line, this=this)``, but the
+    replacement fields referring to `this` are only resolved once, here, and
+    plain ``{line}`` replacement fields are substituted without going through
+    :meth:`str.format`.
+    Output formats that cannot be compiled, e.g. because they refer to
+    something other than `line` or `this`, are formatted as usual, so that
+    errors show up when formatting lines, as they would otherwise.
+
+    :param output_format: the format, as for :meth:`str.format`, with `line`
+        and `this` in scope
+    :param this: the object `this` refers to in the format
+    :returns: a function taking a line and returning the formatted line
+    """
+    def format_as_usual(line):
+        return output_format.format(line=line, this=this)
+
+    formatter = string.Formatter()
+    # Constant parts in between plain {line} fields, and the equivalent format
+    # with only line fields left.
+    constant_parts = ['']  # type: List[Text]
+    template_parts = []  # type: List[Text]
+    only_plain_line_fields = True
+    try:
+        for literal_text, field_name, format_spec, conversion in formatter.parse(output_format):
+            constant_parts[-1] += literal_text
+            template_parts.append(_escape(literal_text))
+            if field_name is None:
+                continue
+            if format_spec and '{' in format_spec:
+                # Nested replacement fields.
+                return format_as_usual
+            root = field_name.split('.', 1)[0].split('[', 1)[0]
+            if root == 'line':
+                if field_name != 'line' or format_spec or conversion:
+                    only_plain_line_fields = False
+                constant_parts.append('')
+                template_parts.append(
+                    '{' + field_name +
+                    ('!' + conversion if conversion else '') +
+                    (':' + format_spec if format_spec else '') +
+                    '}')
+                continue
+            if root != 'this':
+                return format_as_usual
+            value, _ = formatter.get_field(field_name, (), {'this': this})
+            value = formatter.format_field(
+                formatter.convert_field(value, conversion), format_spec)
+            constant_parts[-1] += value
+            template_parts.append(_escape(value))
+    except Exception:
+        return format_as_usual
+
+    if only_plain_line_fields:
+        if len(constant_parts) == 1:
+            constant = constant_parts[0]
+            return lambda line: constant
+        return lambda line: line.join(constant_parts)
+    template = ''.join(template_parts)
+    return lambda line: template.format(line=line)
+
+
+def _escape(text: Text) -> Text:
+    return text.replace('{', '{{').replace('}', '}}')
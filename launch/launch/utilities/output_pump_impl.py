@@ -0,0 +1,131 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the OutputPump class."""
+
+import os
+import threading
+import time
+from typing import Iterable
+from typing import List  # noqa: F401
+from typing import Optional  # noqa: F401
+from typing import Text
+from typing import Tuple
+
+
+class OutputPump:
+    """
+    Copy the output read from a pipe to files, from a separate thread.
+
+    The output never goes through the asyncio event loop.
+    Only complete lines are written, each batch of them at once, so that the
+    output of pumps appending to the same files, e.g. the stdout and stderr of
+    a process, is mixed line by line only.
+    The last line is written once the pipe is closed even if it is not
+    terminated, and lines longer than the read size are written in parts.
+    Each line can optionally be prefixed with the time it was read at,
+    in seconds since the epoch, like in the launch main log file.
+    The thread stops, closing the pipe and the files, once the write end of the
+    pipe is closed by all processes, e.g. once the process writing to it exits.
+    """
+
+    def __init__(
+        self,
+        read_fd: int,
+        file_paths: Iterable[Text],
+        *,
+        timestamps: bool = False,
+        read_size: int = 65536
+    ) -> None:
+        """
+        Create an OutputPump, taking ownership of the read end of a pipe.
+
+        :param: read_fd file descriptor of the read end of the pipe
+        :param: file_paths paths to the files to append the output to
+        :param: timestamps if True, prefix each line with the time it was read at
+        :param: read_size maximum number of bytes to read from the pipe at once
+        """
+        self.__read_fd = read_fd  # type: Optional[int]
+        self.__file_paths = list(file_paths)
+        self.__timestamps = timestamps
+        self.__read_size = read_size
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+
+    def start(self) -> None:
+        """Start copying the output, from a new thread."""
+        self.__thread.start()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for the thread copying the output to stop."""
+        self.__thread.join(timeout)
+
+    def close(self) -> None:
+        """Close the pipe, if the pump was never started."""
+        if not self.__thread.is_alive() and self.__read_fd is not None:
+            os.close(self.__read_fd)
+            self.__read_fd = None
+
+    def __run(self) -> None:
+        read_fd = self.__read_fd
+        fds = []  # type: List[int]
+        try:
+            for file_path in self.__file_paths:
+                fds.append(os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644))
+            at_line_start = True
+            pending = b''
+            end_of_output = False
+            while not end_of_output:
+                data = os.read(read_fd, self.__read_size)
+                end_of_output = not data
+                if end_of_output:
+                    data, pending = pending, b''
+                else:
+                    data, pending = self.__split_complete_lines(pending + data)
+                if not data:
+                    continue
+                if self.__timestamps:
+                    data, at_line_start = self.__add_timestamps(data, at_line_start)
+                for fd in fds:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+        finally:
+            for fd in fds:
+                os.close(fd)
+            os.close(read_fd)
+            self.__read_fd = None
+
+    def __split_complete_lines(self, data: bytes) -> Tuple[bytes, bytes]:
+        """Split data into the complete lines to write, and the rest."""
+        end = data.rfind(b'\n') + 1
+        if end == 0 and len(data) >= self.__read_size:
+            # Written in parts, rather than buffering a line of any length.
+            return data, b''
+        return data[:end], data[end:]
+
+    @staticmethod
+    def __add_timestamps(data: bytes, at_line_start: bool) -> Tuple[bytes, bool]:
+        prefix = '{:.7f} '.format(time.time()).encode()
+        lines = data.split(b'\n')
+        # The last element is empty if the data ends with a line terminator.
+        ends_with_newline = not lines[-1]
+        if ends_with_newline:
+            del lines[-1]
+        prefixed = b'\n'.join(
+            line if index == 0 and not at_line_start else prefix + line
+            for index, line in enumerate(lines)
+        )
+        if ends_with_newline:
+            prefixed += b'\n'
+        return prefixed, ends_with_newline
@@ -0,0 +1,82 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the ProcessPipe class."""
+
+import os
+from typing import Optional  # noqa: F401
+
+
+class ProcessPipe:
+    """
+    Pipe connecting the standard output of processes to the standard input of others.
+
+    The output never goes through launch.
+    The pipe is created once either of its ends is first needed, and launch
+    keeps both ends open for as long as processes may still be started with
+    them, e.g. respawned, so that the reading process only reads the end of
+    its input once the end of the writing side is closed, see
+    :meth:`close_write_end`, and the writing process only fails to write once
+    the end of the reading side is closed, see :meth:`close_read_end`.
+    Both ends are not inherited by processes other than the ones started with them.
+    """
+
+    def __init__(self) -> None:
+        """Create a ProcessPipe."""
+        self.__read_fd = None  # type: Optional[int]
+        self.__write_fd = None  # type: Optional[int]
+        self.__created = False
+
+    def get_read_end(self) -> int:
+        """
+        Get the read end of the pipe, to start a process with as its standard input.
+
+        :returns: the file descriptor, still owned by the pipe
+        :raises RuntimeError: if the read end is closed
+        """
+        self.__create()
+        if self.__read_fd is None:
+            raise RuntimeError('read end of the pipe is closed')
+        return self.__read_fd
+
+    def get_write_end(self) -> int:
+        """
+        Get the write end of the pipe, to start a process with as its standard output.
+
+        :returns: the file descriptor, still owned by the pipe
+        :raises RuntimeError: if the write end is closed
+        """
+        self.__create()
+        if self.__write_fd is None:
+            raise RuntimeError('write end of the pipe is closed')
+        return self.__write_fd
+
+    def close_read_end(self) -> None:
+        """Close the read end of the pipe, once no process will be started with it."""
+        self.__created = True
+        if self.__read_fd is not None:
+            os.close(self.__read_fd)
+            self.__read_fd = None
+
+    def close_write_end(self) -> None:
+        """Close the write end of the pipe, once no process will be started with it."""
+        self.__created = True
+        if self.__write_fd is not None:
+            os.close(self.__write_fd)
+            self.__write_fd = None
+
+    def __create(self) -> None:
+        if not self.__created:
+            self.__read_fd, self.__write_fd = os.pipe()
+            self.__created = True
@@ -0,0 +1,182 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module for the ProcessResources class."""
+
+import errno
+import os
+from typing import Dict  # noqa: F401
+from typing import FrozenSet
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Text
+from typing import Tuple
+from typing import Union
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows.
+    resource = None  # type: ignore
+
+SomeResourceLimit = Union[int, Tuple[int, int]]
+
+
+class ProcessResources:
+    """
+    CPU affinity, nice value and resource limits of a process.
+
+    These are applied to a process by the launch process right after it is
+    started, see :meth:`apply`, so that it can be started with vfork() or
+    posix_spawn() rather than running Python code between fork() and exec().
+    The process runs with the resources of the launch process in the meantime.
+    Only where they cannot be applied to another process, see
+    :attr:`applies_to_other_processes`, are they applied by the process to
+    itself, after it is forked and before it executes its program.
+    Only POSIX systems are supported, and CPU affinity only on Linux.
+    """
+
+    def __init__(
+        self,
+        *,
+        cpu_affinity: Optional[Iterable[int]] = None,
+        nice: Optional[int] = None,
+        rlimits: Optional[Mapping[Text, SomeResourceLimit]] = None
+    ) -> None:
+        """
+        Create a ProcessResources.
+
+        :param: cpu_affinity CPUs the process may run on, None (default) results in
+            the CPUs of the launch process
+        :param: nice nice value of the process, between -20 and 19, None (default)
+            results in the nice value of the launch process
+        :param: rlimits resource limits of the process, by resource name, e.g. 'as',
+            'nofile' or 'core' for RLIMIT_AS, RLIMIT_NOFILE and RLIMIT_CORE.
+            Each limit is either a soft limit, or a tuple of soft and hard limits,
+            resource.RLIM_INFINITY meaning no limit
+        """
+        if cpu_affinity is not None:
+            cpu_affinity = frozenset(cpu_affinity)
+            if not cpu_affinity or any(cpu < 0 for cpu in cpu_affinity):
+                raise ValueError(
+                    "'cpu_affinity' must be a non-empty set of CPU numbers, got '{}'".format(
+                        sorted(cpu_affinity)))
+            if not hasattr(os, 'sched_setaffinity'):
+                raise ValueError("'cpu_affinity' is not supported on this platform")
+        if nice is not None:
+            if not -20 <= nice <= 19:
+                raise ValueError(
+                    "'nice' must be between -20 and 19, got '{}'".format(nice))
+            if not hasattr(os, 'setpriority'):
+                raise ValueError("'nice' is not supported on this platform")
+        self.__cpu_affinity = cpu_affinity  # type: Optional[FrozenSet[int]]
+        self.__nice = nice
+        self.__rlimits = {}  # type: Dict[int, Tuple[int, Optional[int]]]
+        for name, limit in (rlimits or {}).items():
+            self.__rlimits[_get_rlimit_resource(name)] = _normalize_rlimit(name, limit)
+
+    @property
+    def cpu_affinity(self) -> Optional[FrozenSet[int]]:
+        """Getter for cpu_affinity."""
+        return self.__cpu_affinity
+
+    @property
+    def nice(self) -> Optional[int]:
+        """Getter for nice."""
+        return self.__nice
+
+    @property
+    def applies_to_other_processes(self) -> bool:
+        """Getter for whether these resources can be applied to another process here."""
+        return not self.__rlimits or hasattr(resource, 'prlimit')
+
+    @property
+    def empty(self) -> bool:
+        """Getter for whether there is nothing to apply."""
+        return self.__cpu_affinity is None and self.__nice is None and not self.__rlimits
+
+    def with_cpu_affinity(self, cpu_affinity: Iterable[int]) -> 'ProcessResources':
+        """Return a copy of these resources, with the given CPU affinity instead."""
+        copy = ProcessResources(cpu_affinity=cpu_affinity, nice=self.__nice)
+        copy.__rlimits = self.__rlimits
+        return copy
+
+    def apply(self, pid: int = 0) -> None:
+        """
+        Apply these resources to a process.
+
+        The CPU affinity and nice value of another process are applied to each of
+        its threads, since they are per thread on Linux, in case it already started
+        some.
+        Applying them to the calling process only uses system calls, so that it is
+        safe to do from a forked child process, e.g. as the `preexec_fn` of
+        :class:`subprocess.Popen`, which should only be done if they do not
+        apply to other processes here.
+
+        :param: pid the process id of the process, 0 (default) for the calling process
+        :raises OSError: if resource limits cannot be applied to another process here
+        """
+        if pid != 0 and not self.applies_to_other_processes:
+            raise OSError(
+                errno.ENOSYS, 'resource limits cannot be applied to other processes here')
+        thread_ids = [pid] if pid == 0 else _get_thread_ids(pid)
+        for thread_id in thread_ids:
+            if self.__cpu_affinity is not None:
+                os.sched_setaffinity(thread_id, self.__cpu_affinity)
+            if self.__nice is not None:
+                os.setpriority(os.PRIO_PROCESS, thread_id, self.__nice)
+        for resource_id, (soft, hard) in self.__rlimits.items():
+            if pid == 0:
+                if hard is None:
+                    hard = resource.getrlimit(resource_id)[1]
+                resource.setrlimit(resource_id, (soft, hard))
+            else:
+                if hard is None:
+                    hard = resource.prlimit(pid, resource_id)[1]
+                resource.prlimit(pid, resource_id, (soft, hard))
+
+
+def _get_thread_ids(pid: int) -> List[int]:
+    """Get the ids of the threads of a process, only its own id where /proc is not available."""
+    try:
+        return [int(thread_id) for thread_id in os.listdir('/proc/{}/task'.format(pid))]
+    except (OSError, ValueError):
+        return [pid]
+
+
+def _get_rlimit_resource(name: Text) -> int:
+    """Get the resource.RLIMIT_* constant for a resource name, e.g. 'nofile'."""
+    if resource is None:
+        raise ValueError("'rlimits' are not supported on this platform")
+    attribute = name.upper()
+    if not attribute.startswith('RLIMIT_'):
+        attribute = 'RLIMIT_' + attribute
+    if not hasattr(resource, attribute):
+        raise ValueError("unknown resource limit '{}'".format(name))
+    return getattr(resource, attribute)
+
+
+def _normalize_rlimit(name: Text, limit: SomeResourceLimit) -> Tuple[int, Optional[int]]:
+    """Get the soft and hard limits of a resource limit, None keeping the hard limit."""
+    if isinstance(limit, tuple):
+        soft, hard = limit  # type: Tuple[int, Optional[int]]
+    else:
+        soft, hard = limit, None
+    for value in (soft, hard):
+        if value is not None and value < 0 and value != resource.RLIM_INFINITY:
+            raise ValueError(
+                "resource limit '{}' must be non-negative, got '{}'".format(name, limit))
+    return soft, hard
@@ -15,7 +15,9 @@
 """Module for the visit_all_entities_and_collect_futures() utility function."""
 
 import asyncio
+from typing import Iterator  # noqa: F401
 from typing import List
+from typing import Optional  # noqa: F401
 from typing import Tuple
 
 from ..launch_context import LaunchContext
@@ -29,18 +31,31 @@ def visit_all_entities_and_collect_futures(
     """
     Visit given entity, as well as all sub-entities, and collect any futures.
 
-    Sub-entities are visited recursively and depth-first.
+    Sub-entities are visited depth-first.
     The future is collected from each entity (unless it returns None) before
     continuing on to more sub-entities.
 
-    This function may call itself to traverse the sub-entities recursively.
+    Traversal uses an explicit stack of sub-entity iterators rather than
+    recursion, so deeply nested launch descriptions do not hit the recursion
+    limit, and all futures are appended to a single list.
     """
-    sub_entities = entity.visit(context)
-    entity_future = entity.get_asyncio_future()
-    futures_to_return = []
-    if entity_future is not None:
-        futures_to_return.append((entity, entity_future))
-    if sub_entities is not None:
-        for sub_entity in sub_entities:
-            futures_to_return += visit_all_entities_and_collect_futures(sub_entity, context)
-    return [future_pair for future_pair in futures_to_return if future_pair[1] is not None]
+    futures_to_return = []  # type: List[Tuple[LaunchDescriptionEntity, asyncio.Future]]
+    stack = []  # type: List[Iterator[LaunchDescriptionEntity]]
+    next_entity = entity  # type: Optional[LaunchDescriptionEntity]
+    tracer = context._tracer
+    while True:
+        if next_entity is not None:
+            sub_entities = next_entity.visit(context)
+            if tracer is not None:
+                tracer.on_entity_visited(next_entity, sub_entities)
+            entity_future = next_entity.get_asyncio_future()
+            if entity_future is not None:
+                futures_to_return.append((next_entity, entity_future))
+            if sub_entities is not None:
+                stack.append(iter(sub_entities))
+        if not stack:
+            break
+        next_entity = next(stack[-1], None)
+        if next_entity is None:
+            stack.pop()
+    return futures_to_return
@@ -0,0 +1,160 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the ChildWatcher class."""
+
+import asyncio
+import os
+import platform
+import signal
+import subprocess
+import sys
+import threading
+
+from launch.child_watcher import ChildWatcher
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    platform.system() == 'Windows', reason='ChildWatcher only supports POSIX systems')
+
+
+def run_until_complete(coroutine):
+    """Run a coroutine in a new event loop, leaving the event loop of the thread as is."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def supported_modes():
+    modes = ['sigchld', 'thread']
+    if hasattr(os, 'pidfd_open'):
+        try:
+            os.close(os.pidfd_open(os.getpid()))
+            modes.insert(0, 'pidfd')
+        except OSError:
+            pass
+    return modes
+
+
+def test_child_watcher_bad_mode():
+    """Test that the mode must be a known one."""
+    with pytest.raises(ValueError):
+        ChildWatcher('kqueue')
+    assert ChildWatcher().mode is None
+
+
+@pytest.mark.parametrize('mode', supported_modes())
+def test_child_watcher_return_codes(mode):
+    """Test that the return code of each process is passed to its callback."""
+    watcher = ChildWatcher(mode)
+
+    async def watch_all():
+        loop = asyncio.get_running_loop()
+        futures = []
+        for i in range(5):
+            popen = subprocess.Popen([sys.executable, '-c', 'exit({})'.format(i)])
+            future = loop.create_future()
+            watcher.add_child(loop, popen, future.set_result)
+            futures.append(future)
+        sleeper = subprocess.Popen(['sleep', '60'])
+        killed = loop.create_future()
+        watcher.add_child(loop, sleeper, killed.set_result)
+        assert watcher.mode == mode
+        assert await asyncio.wait_for(asyncio.gather(*futures), 10.0) == list(range(5))
+        assert not killed.done()
+        sleeper.send_signal(signal.SIGKILL)
+        assert await asyncio.wait_for(killed, 10.0) == -signal.SIGKILL
+        assert sleeper.returncode == -signal.SIGKILL
+
+    run_until_complete(watch_all())
+    assert watcher.watched_count == 0
+    watcher.close()
+    assert watcher.mode is None
+
+
+def test_child_watcher_exited_before_watched():
+    """Test watching a process that already exited, or was already reaped."""
+    watcher = ChildWatcher()
+
+    async def watch_exited():
+        loop = asyncio.get_running_loop()
+        exited = subprocess.Popen(['true'])
+        reaped = subprocess.Popen(['false'])
+        reaped.wait()
+        # Left a zombie, not reaped yet.
+        os.waitid(os.P_PID, exited.pid, os.WEXITED | os.WNOWAIT)
+        returncodes = []
+        watcher.add_child(loop, exited, returncodes.append)
+        watcher.add_child(loop, reaped, returncodes.append)
+        await asyncio.sleep(0)
+        assert returncodes == [0, 1]
+        assert watcher.watched_count == 0
+
+    run_until_complete(watch_exited())
+    watcher.close()
+
+
+def test_child_watcher_thread_count():
+    """Test that no thread is started per process, unless in the thread mode."""
+    watcher = ChildWatcher()
+
+    async def watch_many():
+        loop = asyncio.get_running_loop()
+        thread_count = threading.active_count()
+        popens = [subprocess.Popen(['sleep', '60']) for _ in range(20)]
+        futures = []
+        for popen in popens:
+            future = loop.create_future()
+            watcher.add_child(loop, popen, future.set_result)
+            futures.append(future)
+        assert watcher.mode in ('pidfd', 'sigchld')
+        assert watcher.watched_count == 20
+        assert threading.active_count() == thread_count
+        for popen in popens:
+            popen.kill()
+        await asyncio.wait_for(asyncio.gather(*futures), 10.0)
+        assert threading.active_count() == thread_count
+
+    run_until_complete(watch_many())
+    watcher.close()
+
+
+def test_child_watcher_unsupported_mode():
+    """Test that the sigchld mode is not supported away from the main thread."""
+    errors = []
+
+    def watch_from_thread():
+        loop = asyncio.new_event_loop()
+        try:
+            popen = subprocess.Popen(['true'])
+            with pytest.raises(RuntimeError):
+                ChildWatcher('sigchld').add_child(loop, popen, print)
+            popen.wait()
+            watcher = ChildWatcher('thread')
+            popen = subprocess.Popen(['false'])
+            future = loop.create_future()
+            watcher.add_child(loop, popen, future.set_result)
+            assert loop.run_until_complete(asyncio.wait_for(future, 10.0)) == 1
+        except BaseException as exc:
+            errors.append(exc)
+        finally:
+            loop.close()
+
+    thread = threading.Thread(target=watch_from_thread)
+    thread.start()
+    thread.join()
+    assert not errors
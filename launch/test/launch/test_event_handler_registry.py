@@ -0,0 +1,134 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the EventHandlerRegistry class."""
+
+from launch import Action
+from launch import Event
+from launch import EventHandler
+from launch.event_handler_registry import EventHandlerRegistry
+from launch.event_handlers import OnExecutionComplete
+from launch.events import ExecutionComplete
+
+import pytest
+
+
+class MockEvent(Event):
+    name = 'MockEvent'
+
+
+class MockDerivedEvent(MockEvent):
+    name = 'MockDerivedEvent'
+
+
+class OtherMockEvent(Event):
+    name = 'OtherMockEvent'
+
+
+def test_event_handler_registry_preserves_registration_order():
+    """Test that candidates are returned in registration order."""
+    registry = EventHandlerRegistry()
+    first = EventHandler(matcher=lambda event: True)
+    second = EventHandler(matcher=lambda event: True, event_types=(MockEvent,))
+    third = EventHandler(matcher=lambda event: True, event_types=(MockDerivedEvent,))
+    registry.append(second)
+    registry.appendleft(first)
+    registry.append(third)
+
+    assert len(registry) == 3
+    assert list(registry) == [first, second, third]
+    assert registry[0] is first
+    assert registry.candidates(MockDerivedEvent()) == [first, second, third]
+    assert registry.candidates(MockEvent()) == [first, second]
+    assert registry.candidates(OtherMockEvent()) == [first]
+
+
+def test_event_handler_registry_remove():
+    """Test unregistering event handlers from an EventHandlerRegistry."""
+    registry = EventHandlerRegistry()
+    handler = EventHandler(matcher=lambda event: True, event_types=(MockEvent,))
+    registry.append(handler)
+    assert handler in registry
+    registry.remove(handler)
+    assert handler not in registry
+    assert len(registry) == 0
+    assert registry.candidates(MockEvent()) == []
+    with pytest.raises(ValueError):
+        registry.remove(handler)
+
+
+def test_event_handler_registry_target_action():
+    """Test that action targeted event handlers are only candidates for their action."""
+    registry = EventHandlerRegistry()
+    action = Action()
+    other_action = Action()
+    targeted_handler = OnExecutionComplete(target_action=action, on_completion=[])
+    untargeted_handler = OnExecutionComplete(on_completion=[])
+    registry.append(targeted_handler)
+    registry.append(untargeted_handler)
+
+    assert registry.candidates(ExecutionComplete(action=action)) == [
+        targeted_handler, untargeted_handler
+    ]
+    assert registry.candidates(ExecutionComplete(action=other_action)) == [
+        untargeted_handler
+    ]
+    assert registry.candidates(MockEvent()) == []
+
+
+def test_event_handler_registry_target_actions():
+    """Test that action targeted event handlers are candidates for events targeted at them."""
+    registry = EventHandlerRegistry()
+    actions = [Action() for _ in range(3)]
+    handlers = [
+        EventHandler(matcher=lambda event: True, event_types=(MockEvent,), target_action=action)
+        for action in actions
+    ]
+    for handler in handlers:
+        registry.append(handler)
+
+    assert registry.candidates(MockEvent()) == []
+    assert registry.candidates(MockEvent(), [actions[2], actions[0]]) == [
+        handlers[0], handlers[2]
+    ]
+    assert registry.candidates(MockEvent(), actions) == handlers
+
+
+def test_event_handler_registry_owners():
+    """Test unregistering the event handlers registered on behalf of an owner."""
+    registry = EventHandlerRegistry()
+    owner = Action()
+    other_owner = Action()
+    owned_handlers = [
+        EventHandler(matcher=lambda event: True, event_types=(MockEvent,)),
+        EventHandler(matcher=lambda event: True),
+    ]
+    other_owned_handler = EventHandler(matcher=lambda event: True)
+    unowned_handler = EventHandler(matcher=lambda event: True)
+    for handler in owned_handlers:
+        registry.append(handler, owner)
+    registry.append(other_owned_handler, other_owner)
+    registry.append(unowned_handler)
+
+    assert registry.count_owned_by(owner) == 2
+    assert registry.counts_by_owner() == {owner: 2, other_owner: 1}
+
+    registry.remove(owned_handlers[0])
+    assert registry.count_owned_by(owner) == 1
+    assert registry.remove_owned_by(owner) == 1
+    assert registry.count_owned_by(owner) == 0
+    assert registry.remove_owned_by(owner) == 0
+    assert list(registry) == [other_owned_handler, unowned_handler]
+    assert registry.candidates(MockEvent()) == [other_owned_handler, unowned_handler]
+    assert registry.counts_by_owner() == {other_owner: 1}
@@ -0,0 +1,89 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the EventQueue class."""
+
+import asyncio
+import signal
+
+from launch.event import Event
+from launch.event_queue import EventQueue
+from launch.events import Shutdown
+from launch.events.process import ProcessStdout
+from launch.events.process import ShutdownProcess
+from launch.events.process import SignalProcess
+
+
+def _make_process_stdout(text):
+    return ProcessStdout(
+        action=None, name='proc', cmd=['proc'], cwd=None, env=None, pid=1, text=text)
+
+
+def test_event_queue_control_events_first():
+    """Test that control events are dequeued ahead of other events, in order within lanes."""
+    queue = EventQueue()
+    outputs = [_make_process_stdout(str(i).encode()) for i in range(3)]
+    shutdown = Shutdown()
+    signal_process = SignalProcess(
+        signal_number=signal.SIGINT, process_matcher=lambda action: True)
+    shutdown_process = ShutdownProcess(process_matcher=lambda action: True)
+
+    queue.put_nowait(outputs[0])
+    queue.put_nowait(shutdown)
+    queue.put_nowait(outputs[1])
+    queue.put_nowait(signal_process)
+    queue.put_nowait(shutdown_process)
+    queue.put_nowait(outputs[2])
+    assert queue.qsize() == 6
+
+    dequeued = []
+    while not queue.empty():
+        dequeued.append(queue.get_nowait())
+    assert dequeued == [shutdown, signal_process, shutdown_process] + outputs
+
+
+def test_event_queue_control_events_overtake_io_storm_behind_other_events():
+    """Test that control events overtake an I/O backlog, even behind other events."""
+    queue = EventQueue()
+    outputs = [_make_process_stdout(str(i).encode()) for i in range(100)]
+    other = Event()
+    shutdown_process = ShutdownProcess(process_matcher=lambda action: True)
+
+    for output in outputs[:50]:
+        queue.put_nowait(output)
+    queue.put_nowait(other)
+    for output in outputs[50:]:
+        queue.put_nowait(output)
+    queue.put_nowait(shutdown_process)
+    # Other events keep their order relative to I/O events.
+    expected = [shutdown_process] + outputs[:50] + [other] + outputs[50:]
+    assert list(queue._queue) == expected
+
+    dequeued = []
+    while not queue.empty():
+        dequeued.append(queue.get_nowait())
+    assert dequeued == expected
+
+
+def test_event_queue_get():
+    """Test awaiting events from an EventQueue."""
+    async def put_and_get():
+        queue = EventQueue()
+        getter = asyncio.ensure_future(queue.get())
+        await asyncio.sleep(0)
+        shutdown = Shutdown()
+        queue.put_nowait(shutdown)
+        assert await getter is shutdown
+
+    asyncio.get_event_loop().run_until_complete(put_and_get())
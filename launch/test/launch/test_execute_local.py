@@ -18,15 +18,19 @@
 """Tests for the ExecuteLocal Action."""
 
 import os
+import platform
 import sys
 
 from launch import LaunchDescription
 from launch import LaunchService
 from launch.actions import ExecuteLocal
 from launch.actions import OpaqueFunction
+from launch.actions import RegisterEventHandler
 from launch.actions import Shutdown
 from launch.actions import TimerAction
 from launch.descriptions import Executable
+from launch.event_handler import EventHandler
+from launch.events.process import ProcessRespawnLimitReached
 
 import pytest
 
@@ -124,3 +128,67 @@ def test_execute_process_with_respawn():
     ls.include_launch_description(generate_launch_description())
     assert 0 == ls.run()
     assert expected_called_count == on_exit_callback.called_count
+
+
+def test_execute_process_with_respawn_limit():
+    """Test that a process exiting right away is no longer respawned past the limit."""
+    limit_events = []
+    executable = ExecuteLocal(
+        process_description=Executable(cmd=[sys.executable, '-c', 'import sys; sys.exit(1)']),
+        respawn=True, respawn_delay=0.1, respawn_backoff=2.0, respawn_jitter=0.5,
+        respawn_max_restarts=2, respawn_restart_window=10.0,
+    )
+    ls = LaunchService()
+    ls.include_launch_description(LaunchDescription([
+        RegisterEventHandler(EventHandler(
+            matcher=lambda event: isinstance(event, ProcessRespawnLimitReached),
+            entities=OpaqueFunction(
+                function=lambda context: limit_events.append(context.locals.event)),
+        )),
+        executable,
+    ]))
+    assert 0 == ls.run()
+    assert len(limit_events) == 1
+    assert limit_events[0].action is executable
+    assert limit_events[0].respawn_count == 2
+    assert limit_events[0].restart_window == 10.0
+    counters = executable.respawn_counters
+    assert counters['respawn_count'] == 2
+    assert counters['respawn_limit_reached']
+    assert counters['uptime'] < 10.0
+
+
+def test_execute_process_with_respawn_backoff_without_delay():
+    """Test that backing off the respawn delay requires a respawn delay to back off."""
+    for respawn_delay in (None, 0.0):
+        with pytest.raises(ValueError):
+            ExecuteLocal(
+                process_description=Executable(cmd=['ls']),
+                respawn=True, respawn_delay=respawn_delay, respawn_backoff=2.0,
+            )
+    ExecuteLocal(process_description=Executable(cmd=['ls']), respawn=True, respawn_backoff=1.0)
+
+
+@pytest.mark.skipif(platform.system() != 'Linux', reason='requires Linux')
+def test_execute_process_with_process_resources():
+    """Test that processes get a CPU each, a nice value and resource limits."""
+    cpus = sorted(os.sched_getaffinity(0))
+    script = (
+        'import os, resource; '
+        'print(sorted(os.sched_getaffinity(0)), os.getpriority(os.PRIO_PROCESS, 0), '
+        'resource.getrlimit(resource.RLIMIT_NOFILE)[0])'
+    )
+    executables = [
+        ExecuteLocal(
+            process_description=Executable(cmd=[sys.executable, '-c', script]),
+            cpu_affinity=cpus, cpu_affinity_round_robin=True, nice=10,
+            rlimits={'nofile': 64}, cached_output=True,
+        )
+        for _ in range(2)
+    ]
+    ls = LaunchService()
+    ls.include_launch_description(LaunchDescription(executables))
+    assert 0 == ls.run()
+    for i, executable in enumerate(executables):
+        expected_cpu = cpus[i % len(cpus)]
+        assert executable.get_stdout().split() == ['[{}]'.format(expected_cpu), '10', '64']
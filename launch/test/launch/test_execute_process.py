@@ -17,8 +17,10 @@
 import asyncio
 import os
 import platform
+import shlex
 import signal
 import sys
+import time
 
 from launch import LaunchContext
 from launch import LaunchDescription
@@ -26,12 +28,17 @@ from launch import LaunchService
 from launch.actions import SetLaunchConfiguration
 from launch.actions.emit_event import EmitEvent
 from launch.actions.execute_process import ExecuteProcess
+from launch.actions.opaque_coroutine import OpaqueCoroutine
 from launch.actions.opaque_function import OpaqueFunction
 from launch.actions.register_event_handler import RegisterEventHandler
 from launch.actions.shutdown_action import Shutdown
 from launch.actions.timer_action import TimerAction
+from launch.event_handlers.on_process_io import OnProcessIO
 from launch.event_handlers.on_process_start import OnProcessStart
+from launch.event_handlers.on_process_stats import OnProcessStats
+from launch.events.process import ProcessStdin
 from launch.events.shutdown import Shutdown as ShutdownEvent
+import launch.logging
 
 import pytest
 
@@ -228,3 +235,304 @@ def test_execute_process_prefix_filter_override_in_launch_file():
     test_process.execute(lc)
     assert 'echo' in test_process.process_details['cmd'] and \
         'time' not in test_process.process_details['cmd']
+
+
+@pytest.mark.parametrize('subscribe_to_output', (False, True))
+def test_execute_process_direct_output(tmp_path, subscribe_to_output):
+    """Test that output only logged to own log files can bypass launch."""
+    launch.logging.reset()
+    launch.logging.launch_config.log_dir = str(tmp_path)
+    stdout_events = []
+    try:
+        process_action = ExecuteProcess(
+            cmd=[sys.executable, '-c', "import sys; print('foo'); print('bar', file=sys.stderr)"],
+            name='direct-output',
+            output='own_log',
+            direct_output=True,
+        )
+        entities = [process_action]
+        if subscribe_to_output:
+            entities.insert(0, RegisterEventHandler(OnProcessIO(
+                target_action=process_action,
+                on_stdout=lambda event: stdout_events.append(event),
+            )))
+        ls = LaunchService()
+        ls.include_launch_description(LaunchDescription(entities))
+        assert 0 == ls.run()
+        for handler in launch.logging.launch_config.file_handlers.values():
+            handler.flush()
+
+        name = process_action.process_details['name']
+        with open(os.path.join(str(tmp_path), name + '-stdout.log'), 'r') as f:
+            stdout_lines = f.read().splitlines()
+        with open(os.path.join(str(tmp_path), name + '-stderr.log'), 'r') as f:
+            stderr_lines = f.read().splitlines()
+        with open(os.path.join(str(tmp_path), name + '.log'), 'r') as f:
+            combined_lines = f.read().splitlines()
+    finally:
+        launch.logging.reset()
+
+    if subscribe_to_output:
+        # Output went through launch, and was formatted as usual.
+        assert b''.join(event.text for event in stdout_events).splitlines() == [b'foo']
+        assert stdout_lines == ['[{}] foo'.format(name)]
+        assert stderr_lines == ['[{}] bar'.format(name)]
+    else:
+        assert stdout_lines == ['foo']
+        assert stderr_lines == ['bar']
+    assert sorted(combined_lines) == sorted(stdout_lines + stderr_lines)
+
+
+def test_execute_process_output_filters(tmp_path):
+    """Test that repeated output is collapsed and output over the rate limit dropped."""
+    launch.logging.reset()
+    launch.logging.launch_config.log_dir = str(tmp_path)
+    try:
+        collapsing_action = ExecuteProcess(
+            cmd=[sys.executable, '-c', "print('foo\\n' * 5 + 'bar')"],
+            name='collapsing',
+            output='own_log',
+            collapse_repeated_output=True,
+        )
+        rate_limited_action = ExecuteProcess(
+            cmd=[sys.executable, '-c', 'for i in range(100): print(i)'],
+            name='rate-limited',
+            output='own_log',
+            output_rate_limit=1.0,
+            output_rate_burst=2,
+        )
+        ls = LaunchService()
+        ls.include_launch_description(LaunchDescription([
+            collapsing_action, rate_limited_action
+        ]))
+        assert 0 == ls.run()
+        for handler in launch.logging.launch_config.file_handlers.values():
+            handler.flush()
+
+        collapsing_name = collapsing_action.process_details['name']
+        with open(os.path.join(str(tmp_path), collapsing_name + '-stdout.log'), 'r') as f:
+            collapsing_lines = f.read().splitlines()
+        rate_limited_name = rate_limited_action.process_details['name']
+        with open(os.path.join(str(tmp_path), rate_limited_name + '-stdout.log'), 'r') as f:
+            rate_limited_lines = f.read().splitlines()
+    finally:
+        launch.logging.reset()
+
+    assert collapsing_lines == [
+        '[{}] foo'.format(collapsing_name),
+        '[{}] last message repeated 4 times'.format(collapsing_name),
+        '[{}] bar'.format(collapsing_name),
+    ]
+    assert rate_limited_lines[:2] == [
+        '[{}] 0'.format(rate_limited_name),
+        '[{}] 1'.format(rate_limited_name),
+    ]
+    assert len(rate_limited_lines) < 100
+
+
+def test_execute_process_staggered_start():
+    """Test that processes wait for the previous ones to be ready before starting."""
+    started_at = []
+    ls = LaunchService(max_concurrent_starts=1)
+    ls.include_launch_description(LaunchDescription([
+        RegisterEventHandler(OnProcessStart(
+            on_start=lambda event, context: started_at.append(time.monotonic()))),
+    ] + [
+        ExecuteProcess(
+            cmd=[
+                sys.executable, '-c',
+                "import time; time.sleep(0.5); print('ready', flush=True); time.sleep(0.5)",
+            ],
+            output='screen',
+            ready_pattern='^ready$',
+        )
+        for _ in range(3)
+    ]))
+    assert 0 == ls.run()
+    assert len(started_at) == 3
+    for previous, current in zip(started_at, started_at[1:]):
+        assert current - previous >= 0.5
+
+
+@pytest.mark.skipif(not os.path.isfile('/proc/self/stat'), reason='requires /proc')
+def test_execute_process_stats():
+    """Test that the resource usage of running processes is sampled when enabled."""
+    stats = []
+    ls = LaunchService(process_stats_period=0.1)
+    ls.include_launch_description(LaunchDescription([
+        RegisterEventHandler(OnProcessStats(
+            on_stats=lambda event, context: stats.append(event))),
+        ExecuteProcess(
+            cmd=[sys.executable, '-c', 'import time; time.sleep(0.5)'],
+            output='screen',
+        ),
+    ]))
+    assert 0 == ls.run()
+    assert len(stats) >= 2
+    for event in stats:
+        assert event.pid is not None
+        assert event.cpu_percent >= 0.0
+        assert event.rss > 0
+        assert event.num_threads >= 1
+
+
+@pytest.mark.skipif(platform.system() == 'Windows', reason='process groups are POSIX only')
+def test_execute_process_process_group_teardown():
+    """Test that processes left behind by processes are killed, in process group mode."""
+    grandchild_pids = []
+
+    def on_stdout(event):
+        grandchild_pids.extend(int(pid) for pid in event.text.decode().split())
+
+    def on_exit(event, ctx):
+        on_exit.returncode = event.returncode
+
+    # Leaves a grandchild behind once done, and then once shut down.
+    done_action = ExecuteProcess(
+        cmd=['sh', '-c', 'sleep 60 >/dev/null 2>&1 & echo $!'],
+        output='screen',
+    )
+    shut_down_action = ExecuteProcess(
+        cmd=['sh', '-c', 'sleep 60 >/dev/null 2>&1 & echo $!; exec sleep 60'],
+        output='screen',
+        on_exit=on_exit,
+    )
+    ls = LaunchService(process_group_teardown=True)
+    ls.include_launch_description(LaunchDescription([
+        RegisterEventHandler(OnProcessIO(on_stdout=on_stdout)),
+        done_action,
+        shut_down_action,
+        RegisterEventHandler(OnProcessStart(
+            target_action=shut_down_action,
+            on_start=[
+                TimerAction(period=0.5, actions=[
+                    # As if launch had received a SIGINT from the terminal.
+                    EmitEvent(event=ShutdownEvent(reason='none', due_to_sigint=True)),
+                ]),
+            ]
+        )),
+    ]))
+    assert 0 == ls.run()
+    # Processes in their own process group do not get the SIGINT of the terminal.
+    assert on_exit.returncode == -signal.SIGINT
+    assert len(grandchild_pids) == 2
+    for pid in grandchild_pids:
+        # Killed, and reaped by launch as their subreaper.
+        assert not os.path.exists('/proc/{}'.format(pid))
+
+
+@pytest.mark.skipif(platform.system() == 'Windows', reason='process groups are POSIX only')
+def test_execute_process_process_group_shutdown_escalation(tmp_path):
+    """Test that what is left of a process group once its process exited is still escalated."""
+    # Only exits on SIGTERM, which it records.
+    child_script = (
+        'import signal, sys, time; '
+        'signal.signal(signal.SIGINT, signal.SIG_IGN); '
+        "signal.signal(signal.SIGTERM, lambda *args: (open(sys.argv[1], 'w').write('SIGTERM'), "
+        'sys.exit(0))); '
+        "print('ready', flush=True); "
+        'time.sleep(60)'
+    )
+    signal_path = str(tmp_path / 'signal')
+    # A wrapper script which exits on SIGINT, leaving its child shutting down.
+    wrapper_action = ExecuteProcess(
+        cmd=['sh', '-c', 'trap "exit 0" INT; {} -c {} {} & wait'.format(
+            shlex.quote(sys.executable), shlex.quote(child_script), shlex.quote(signal_path))],
+        output='screen',
+        sigterm_timeout='0.5',
+    )
+    ls = LaunchService(process_group_teardown=True)
+    ls.include_launch_description(LaunchDescription([
+        RegisterEventHandler(OnProcessIO(
+            target_action=wrapper_action,
+            on_stdout=lambda event: Shutdown(reason='child ready'),
+        )),
+        wrapper_action,
+    ]))
+    assert 0 == ls.run()
+    assert wrapper_action.return_code == 0
+    # Sent SIGTERM once the timeout expired, rather than killed with the wrapper.
+    with open(signal_path, 'r') as f:
+        assert f.read() == 'SIGTERM'
+
+
+@pytest.mark.skipif(platform.system() == 'Windows', reason='uses POSIX commands')
+def test_execute_process_stdin():
+    """Test writing to the standard input of processes, with events and with backpressure."""
+    stdout = {}
+
+    def on_stdout(event):
+        stdout[event.action] = stdout.get(event.action, b'') + event.text
+        if event.action is event_process:
+            event_process.close_stdin()
+
+    data = b'x' * (1024 * 1024)
+    high_water_marks = []
+
+    async def write_data(context):
+        stdin = stream_process._subprocess_transport.get_pipe_transport(0)
+        for offset in range(0, len(data), 4096):
+            await stream_process.write_stdin(data[offset:offset + 4096])
+            high_water_marks.append(stdin.get_write_buffer_size())
+        stream_process.close_stdin()
+
+    def on_start(event, context):
+        if event.action is stream_process:
+            return OpaqueCoroutine(coroutine=write_data)
+        return EmitEvent(event=ProcessStdin(
+            text=b'hello\n', action=event.action, name=event.process_name, cmd=event.cmd,
+            cwd=event.cwd, env=event.env, pid=event.pid))
+
+    event_process = ExecuteProcess(cmd=['cat'], output='screen')
+    stream_process = ExecuteProcess(
+        cmd=[sys.executable, '-c', 'import sys; print(len(sys.stdin.buffer.read()))'],
+        output='screen',
+    )
+    ls = LaunchService()
+    ls.include_launch_description(LaunchDescription([
+        RegisterEventHandler(OnProcessIO(on_stdout=on_stdout)),
+        RegisterEventHandler(OnProcessStart(on_start=on_start)),
+        event_process,
+        stream_process,
+    ]))
+    assert 0 == ls.run()
+    assert stdout[event_process] == b'hello\n'
+    assert stdout[stream_process] == '{}\n'.format(len(data)).encode()
+    # Writes waited for the process to read what was buffered.
+    assert max(high_water_marks) <= 64 * 1024 + 4096
+    with pytest.raises(RuntimeError):
+        stream_process.close_stdin()
+
+
+@pytest.mark.skipif(platform.system() == 'Windows', reason='uses POSIX commands')
+def test_execute_process_stdin_file_and_stdin_from(tmp_path):
+    """Test connecting a file or the output of another process as standard input."""
+    stdout = {}
+
+    def on_stdout(event):
+        stdout[event.action] = stdout.get(event.action, b'') + event.text
+
+    input_file = tmp_path / 'input.txt'
+    input_file.write_bytes(b'from file\n')
+    file_reader = ExecuteProcess(cmd=['cat'], stdin_file=str(input_file), output='screen')
+    producer = ExecuteProcess(cmd=['echo', 'from producer'], output='screen')
+    consumer = ExecuteProcess(cmd=['cat'], stdin_from=producer, output='screen')
+    assert consumer.stdin_from is producer
+    with pytest.raises(ValueError):
+        ExecuteProcess(cmd=['cat'], stdin_from=producer)
+    with pytest.raises(ValueError):
+        ExecuteProcess(cmd=['cat'], stdin_file=str(input_file), stdin_from=consumer)
+
+    ls = LaunchService()
+    ls.include_launch_description(LaunchDescription([
+        RegisterEventHandler(OnProcessIO(on_stdout=on_stdout)),
+        # The consumer is started first, and still reads the end of its input.
+        consumer,
+        producer,
+        file_reader,
+    ]))
+    assert 0 == ls.run()
+    assert stdout[file_reader] == b'from file\n'
+    assert stdout[consumer] == b'from producer\n'
+    # The output of the producer does not go through launch.
+    assert producer not in stdout
@@ -83,6 +83,46 @@ def test_launch_context_locals():
         lc._pop_locals()
 
 
+def test_launch_context_locals_views():
+    """Test that LaunchContext locals views are reusable, read-only and layered on globals."""
+    lc = LaunchContext()
+    locals_view = lc.locals
+    locals_mapping = lc._get_locals_mapping()
+    assert lc.locals is locals_view
+    assert lc._get_locals_mapping() is locals_mapping
+    with pytest.raises(TypeError):
+        locals_mapping['foo'] = 1
+
+    lc.extend_globals({'foo': 1, 'bar': 1})
+    lc._push_locals()
+    lc.extend_locals({'foo': 2})
+    lc._push_locals()
+    lc.extend_locals({'baz': 3})
+    assert locals_view.foo == 2
+    assert locals_view.bar == 1
+    assert dict(locals_mapping) == {'foo': 2, 'bar': 1, 'baz': 3}
+    lc._pop_locals()
+    lc._pop_locals()
+    assert locals_view.foo == 1
+    assert dict(locals_mapping) == {'foo': 1, 'bar': 1}
+
+
+def test_launch_context_locals_as_dict():
+    """Test that LaunchContext locals as a dictionary are a snapshot."""
+    lc = LaunchContext()
+    lc.extend_globals({'foo': 1})
+    lc._push_locals()
+    lc.extend_locals({'bar': 2})
+    locals_dict = lc.get_locals_as_dict()
+    assert isinstance(locals_dict, dict)
+    assert locals_dict == {'foo': 1, 'bar': 2}
+    lc.extend_locals({'baz': 3})
+    lc._pop_locals()
+    assert locals_dict == {'foo': 1, 'bar': 2}
+    locals_dict['qux'] = 4
+    assert 'qux' not in lc.get_locals_as_dict()
+
+
 def test_launch_context_launch_configurations():
     """Test "launch configurations" feature of LaunchContext class."""
     lc = LaunchContext()
@@ -142,6 +182,39 @@ def test_launch_context_emit_events():
     assert lc._event_queue.qsize() == 2
 
 
+def test_launch_context_event_queue_flow_control():
+    """Test event queue flow control in LaunchContext class."""
+    with pytest.raises(ValueError):
+        LaunchContext(event_queue_high_water_mark=0)
+    with pytest.raises(ValueError):
+        LaunchContext(event_queue_high_water_mark=2, event_queue_low_water_mark=2)
+
+    class MockEvent:
+        name = 'MockEvent'
+
+    lc = LaunchContext()
+    lc.emit_event_sync(MockEvent())
+    assert not lc._is_event_queue_congested()
+
+    lc = LaunchContext(event_queue_high_water_mark=4)
+    resumed = []
+    for _ in range(3):
+        lc.emit_event_sync(MockEvent())
+    assert not lc._is_event_queue_congested()
+    lc.emit_event_sync(MockEvent())
+    assert lc._is_event_queue_congested()
+    lc._add_resume_callback(lambda: resumed.append(True))
+
+    lc._event_queue.get_nowait()
+    lc._on_events_dequeued()
+    assert not resumed
+    lc._event_queue.get_nowait()
+    lc._on_events_dequeued()
+    assert resumed == [True]
+    lc._on_events_dequeued()
+    assert resumed == [True]
+
+
 def test_launch_context_perform_substitution():
     """Test performing substitutions with LaunchContext class."""
     lc = LaunchContext()
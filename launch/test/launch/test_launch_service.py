@@ -14,6 +14,7 @@
 
 """Tests for the LaunchService class."""
 
+import asyncio
 import queue
 import threading
 
@@ -23,12 +24,17 @@ from launch.events import ExecutionComplete
 
 import osrf_pycommon
 
+import pytest
+
 
 def test_launch_service_constructors():
     """Test the constructors for LaunchService class."""
     LaunchService()
     LaunchService(debug=True)
     LaunchService(debug=False)
+    LaunchService(max_events_per_tick=1)
+    with pytest.raises(ValueError):
+        LaunchService(max_events_per_tick=0)
 
 
 def test_launch_service_emit_event():
@@ -102,3 +108,55 @@ def test_launch_service_emit_event():
     # Check that the shutdown events was handled.
     assert handled_events.qsize() == 1
     handled_events.get(block=False)
+
+
+@pytest.mark.parametrize('max_events_per_tick', (1, 2, 100))
+def test_launch_service_drains_queued_events(max_events_per_tick):
+    """Test that all queued events are handled, in order, regardless of the per tick budget."""
+    ls = LaunchService(max_events_per_tick=max_events_per_tick)
+
+    from launch.actions import OpaqueFunction
+    from launch.actions import RegisterEventHandler
+    from launch.event_handler import EventHandler
+
+    class MockEvent:
+        name = 'Event'
+
+        def __init__(self, index):
+            self.index = index
+
+    handled_indices = []
+    ls.include_launch_description(LaunchDescription([
+        RegisterEventHandler(EventHandler(
+            matcher=lambda event: isinstance(event, MockEvent),
+            entities=OpaqueFunction(
+                function=lambda context: handled_indices.append(context.locals.event.index),
+            ),
+        ))
+    ]))
+    for index in range(10):
+        ls.emit_event(MockEvent(index))
+
+    assert ls.run(shutdown_when_idle=True) == 0
+    assert handled_indices == list(range(10))
+
+
+def test_launch_service_tracks_outstanding_futures():
+    """Test that outstanding futures keep the LaunchService from being idle until done."""
+    ls = LaunchService()
+    loop = osrf_pycommon.process_utils.get_loop()
+    assert ls._is_idle()
+
+    entity_future = loop.create_future()
+    ls._track_future(entity_future)
+    completion_future = loop.create_future()
+    ls.context.add_completion_future(completion_future)
+    assert not ls._is_idle()
+
+    entity_future.set_result(None)
+    loop.run_until_complete(asyncio.sleep(0))
+    assert not ls._is_idle()
+
+    completion_future.set_result(None)
+    loop.run_until_complete(asyncio.sleep(0))
+    assert ls._is_idle()
@@ -335,3 +335,82 @@ def test_get_log_dir_frontend(log_dir):
     result = subst[0]
     assert isinstance(result, TextSubstitution)
     assert result.text == log_dir
+
+
+@pytest.mark.parametrize('config,expected', [
+    ('screen', {}),
+    ('log', {}),
+    ('full', {}),
+    ('own_log', {
+        'stdout': ['some-proc-stdout.log', 'some-proc.log'],
+        'stderr': ['some-proc-stderr.log', 'some-proc.log'],
+    }),
+    ({'stdout': {'screen', 'log'}, 'stderr': {'own_log'}}, {
+        'stderr': ['some-proc-stderr.log'],
+    }),
+])
+def test_get_own_log_only_output_files(config, expected):
+    assert launch.logging.get_own_log_only_output_files('some-proc', config) == expected
+
+
+@pytest.mark.parametrize('config', ['screen', 'log', 'both', 'own_log', 'full'])
+def test_get_output_line_writer(capsys, log_dir, config):
+    """Test that output line writers write the same as the output loggers."""
+    def write_output(get_writer):
+        launch.logging.reset()
+        launch.logging.launch_config.log_dir = log_dir
+        stdout_logger, stderr_logger = launch.logging.get_output_loggers('some-proc', config)
+        get_writer(stdout_logger)('foo')
+        get_writer(stderr_logger)('bar')
+        for handler in launch.logging.launch_config.file_handlers.values():
+            handler.flush()
+        capture = capsys.readouterr()
+        contents = {}
+        for path in sorted(os.listdir(log_dir)):
+            with open(os.path.join(log_dir, path), 'r') as f:
+                # Strip timestamps, if any.
+                contents[path] = re.sub(r'^[0-9]+\.[0-9]+ ', '', f.read(), flags=re.MULTILINE)
+            os.remove(os.path.join(log_dir, path))
+        return capture.out, capture.err, contents
+
+    expected = write_output(lambda logger: logger.info)
+    assert write_output(launch.logging.get_output_line_writer) == expected
+
+
+def test_get_output_line_writer_fallback(log_dir):
+    """Test that output line writers log as usual with unknown handlers."""
+    launch.logging.reset()
+    launch.logging.launch_config.log_dir = log_dir
+    stdout_logger, _ = launch.logging.get_output_loggers('some-proc', 'own_log')
+    assert launch.logging.get_output_line_writer(stdout_logger) != stdout_logger.info
+
+    handler = logging.NullHandler()
+    stdout_logger.addHandler(handler)
+    try:
+        assert launch.logging.get_output_line_writer(stdout_logger) == stdout_logger.info
+    finally:
+        stdout_logger.removeHandler(handler)
+
+    # Formatters not made by launch are not bypassed, whatever their format.
+    own_log_file_handler = launch.logging.launch_config.get_log_file_handler(
+        'some-proc-stdout.log')
+    own_log_file_handler.setFormatter(logging.Formatter('{msg}', style='{'))
+    assert launch.logging.get_output_line_writer(stdout_logger) == stdout_logger.info
+
+
+def test_get_output_line_writer_lazily_opened_file(log_dir):
+    """Test that output line writers let file handlers open their file."""
+    launch.logging.reset()
+    launch.logging.launch_config.log_dir = log_dir
+    launch.logging.launch_config.log_handler_factory = \
+        lambda path, encoding=None: launch.logging.handlers.FileHandler(
+            path, encoding=encoding, delay=True)
+    stdout_logger, _ = launch.logging.get_output_loggers('some-proc', 'own_log')
+    write = launch.logging.get_output_line_writer(stdout_logger)
+    assert write != stdout_logger.info
+    write('foo')
+    write('bar')
+    for handler in launch.logging.launch_config.file_handlers.values():
+        handler.flush()
+    with open(os.path.join(log_dir, 'some-proc-stdout.log'), 'r') as f:
+        assert f.read() == 'foo\nbar\n'
@@ -0,0 +1,206 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the ProcessGroups class."""
+
+import asyncio
+import os
+import platform
+import signal
+import subprocess
+import sys
+import time
+
+from launch.process_groups import ProcessGroups
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    platform.system() == 'Windows', reason='ProcessGroups only supports POSIX systems')
+
+
+def is_running(pid):
+    """Return whether a process is running, i.e. exists and is not a zombie."""
+    try:
+        with open('/proc/{}/stat'.format(pid)) as f:
+            return f.read().rsplit(')', 1)[1].split()[0] != 'Z'
+    except FileNotFoundError:
+        return False
+
+
+def start_with_grandchild(process_groups):
+    """Start a shell which starts a grandchild in the background, and return both pids."""
+    popen = subprocess.Popen(
+        ['sh', '-c', 'sleep 60 & echo $!; wait'],
+        stdout=subprocess.PIPE, start_new_session=True,
+        preexec_fn=process_groups.get_preexec_fn())
+    grandchild_pid = int(popen.stdout.readline())
+    popen.stdout.close()
+    process_groups.add(popen.pid)
+    return popen, grandchild_pid
+
+
+def test_process_groups_disabled():
+    """Test that processes are started in the process group of launch by default."""
+    process_groups = ProcessGroups()
+    assert not process_groups.enabled
+    assert not process_groups.parent_death_signal
+    assert process_groups.get_preexec_fn() is None
+    process_groups.install()
+    assert not process_groups.subreaper
+    process_groups.close()
+    with pytest.raises(ValueError):
+        ProcessGroups(poll_period=0.0)
+
+
+def test_process_groups_preexec_fn():
+    """Test that a parent-death signal is only set up with a function if asked for."""
+    def preexec_fn():
+        os.write(write_fd, b'called')
+
+    process_groups = ProcessGroups(enabled=True)
+    assert not process_groups.parent_death_signal
+    assert process_groups.get_preexec_fn() is None
+    assert process_groups.get_preexec_fn(preexec_fn) is preexec_fn
+
+    process_groups = ProcessGroups(enabled=True, parent_death_signal=True)
+    assert process_groups.parent_death_signal == (platform.system() == 'Linux')
+    read_fd, write_fd = os.pipe()
+    popen = subprocess.Popen(
+        ['sleep', '60'], start_new_session=True,
+        preexec_fn=process_groups.get_preexec_fn(preexec_fn))
+    try:
+        assert os.getpgid(popen.pid) == popen.pid
+        assert os.read(read_fd, 16) == b'called'
+    finally:
+        popen.kill()
+        popen.wait()
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_process_groups_signal_and_kill():
+    """Test signaling whole process groups, and killing and reaping what is left of them."""
+    process_groups = ProcessGroups(enabled=True)
+    process_groups.install()
+    try:
+        popen, grandchild_pid = start_with_grandchild(process_groups)
+        assert os.getpgid(grandchild_pid) == popen.pid
+        process_groups.signal(popen.pid, signal.SIGTERM)
+        assert popen.wait(10.0) == -signal.SIGTERM
+        assert not is_running(grandchild_pid)
+        assert popen.pid in process_groups
+
+        popen, grandchild_pid = start_with_grandchild(process_groups)
+        # The grandchild is left behind.
+        popen.kill()
+        popen.wait()
+        assert is_running(grandchild_pid)
+        assert process_groups.kill(popen.pid)
+        assert not is_running(grandchild_pid)
+        assert popen.pid not in process_groups
+        if process_groups.subreaper:
+            # Reaped by launch, not left as a zombie.
+            assert not os.path.exists('/proc/{}'.format(grandchild_pid))
+    finally:
+        process_groups.close()
+    assert not process_groups.subreaper
+    assert len(process_groups) == 0
+
+
+def test_process_groups_release():
+    """Test that groups are forgotten once no process is left in them."""
+    process_groups = ProcessGroups(enabled=True, poll_period=0.05)
+    process_groups.install()
+    popen, grandchild_pid = start_with_grandchild(process_groups)
+    popen.kill()
+    popen.wait()
+
+    async def release():
+        process_groups.release(asyncio.get_running_loop(), popen.pid)
+        await asyncio.sleep(0.2)
+        # Still running, so not forgotten.
+        assert popen.pid in process_groups
+        os.kill(grandchild_pid, signal.SIGKILL)
+        await asyncio.sleep(0.2)
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(release())
+    finally:
+        loop.close()
+    try:
+        assert popen.pid not in process_groups
+    finally:
+        process_groups.close()
+
+
+def test_process_groups_close():
+    """Test that closing kills what is left of all process groups, with no orphans."""
+    process_groups = ProcessGroups(enabled=True)
+    process_groups.install()
+    started = [start_with_grandchild(process_groups) for _ in range(5)]
+    for popen, _ in started:
+        popen.kill()
+        popen.wait()
+    assert len(process_groups) == 5
+    started_at = time.monotonic()
+    process_groups.close()
+    assert time.monotonic() - started_at < 1.0
+    assert len(process_groups) == 0
+    for _, grandchild_pid in started:
+        assert not is_running(grandchild_pid)
+
+
+ORPHAN_SCRIPT = """\
+import os
+import time
+
+pid = os.fork()
+if pid == 0:
+    os.setsid()
+    time.sleep(0.3)
+    os._exit(0)
+print(pid, flush=True)
+"""
+
+
+def test_process_groups_reap_orphans():
+    """Test that processes which left their group are reaped once reparented and exited."""
+    process_groups = ProcessGroups(enabled=True, poll_period=0.05)
+    process_groups.install()
+    if not process_groups.subreaper:
+        process_groups.close()
+        pytest.skip('requires being a child subreaper')
+    popen = subprocess.Popen(
+        [sys.executable, '-c', ORPHAN_SCRIPT], stdout=subprocess.PIPE, start_new_session=True)
+    grandchild_pid = int(popen.stdout.readline())
+    popen.stdout.close()
+    popen.wait()
+    assert os.getsid(grandchild_pid) == grandchild_pid
+
+    async def reap_orphans():
+        process_groups.start_reaping_orphans(
+            asyncio.get_running_loop(), lambda pid: pid == popen.pid)
+        deadline = time.monotonic() + 10.0
+        while os.path.exists('/proc/{}'.format(grandchild_pid)):
+            assert time.monotonic() < deadline
+            await asyncio.sleep(0.05)
+
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(reap_orphans())
+    finally:
+        loop.close()
+        process_groups.close()
@@ -0,0 +1,263 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the ProcessSpawner class."""
+
+import asyncio
+import os
+import platform
+import signal
+import sys
+import threading
+
+from launch.process_spawner import ProcessSpawner
+
+from osrf_pycommon.process_utils import AsyncSubprocessProtocol
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    platform.system() == 'Windows', reason='ProcessSpawner only supports POSIX systems')
+
+
+class MockProtocol(AsyncSubprocessProtocol):
+
+    def __init__(self):
+        super().__init__()
+        self.stdout_data = b''
+        self.stderr_data = b''
+
+    def on_stdout_received(self, data):
+        self.stdout_data += data
+
+    def on_stderr_received(self, data):
+        self.stderr_data += data
+
+
+def run_until_complete(coroutine):
+    """Run a coroutine in a new event loop, leaving the event loop of the thread as is."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def wait_for_output(transport):
+    """Wait until all the output of a process has been read."""
+    while not all(transport.get_pipe_transport(fd).is_closing() for fd in (1, 2)):
+        await asyncio.sleep(0.01)
+
+
+def test_process_spawner_bad_configuration():
+    """Test that the number of concurrent spawns must be positive."""
+    with pytest.raises(ValueError):
+        ProcessSpawner(0)
+    assert ProcessSpawner(2).max_concurrent_spawns == 2
+
+
+def test_process_spawner_spawn():
+    """Test spawning processes, reading their output and getting their return code."""
+    spawner = ProcessSpawner(2)
+
+    async def spawn_all():
+        loop = asyncio.get_running_loop()
+        spawned = await asyncio.gather(*[
+            spawner.spawn(loop, MockProtocol, [
+                sys.executable, '-c',
+                'import sys; print("out {0}"); print("err {0}", file=sys.stderr); '
+                'sys.exit({0})'.format(i)
+            ])
+            for i in range(5)
+        ])
+        for i, (transport, protocol) in enumerate(spawned):
+            assert await protocol.complete == i
+            assert transport.get_returncode() == i
+            await wait_for_output(transport)
+            transport.close()
+        shell_transport, shell_protocol = await spawner.spawn(
+            loop, MockProtocol, ['echo', '$FOO'], shell=True, env={'FOO': 'bar'})
+        assert await shell_protocol.complete == 0
+        await wait_for_output(shell_transport)
+        shell_transport.close()
+        return [protocol for _, protocol in spawned] + [shell_protocol]
+
+    try:
+        protocols = run_until_complete(spawn_all())
+    finally:
+        spawner.shutdown()
+    for i, protocol in enumerate(protocols[:-1]):
+        assert protocol.stdout_data.decode().splitlines() == ['out {}'.format(i)]
+        assert protocol.stderr_data.decode().splitlines() == ['err {}'.format(i)]
+    assert protocols[-1].stdout_data == b'bar\n'
+
+
+def test_process_spawner_signal():
+    """Test signaling a spawned process."""
+    spawner = ProcessSpawner()
+
+    async def spawn_and_terminate():
+        loop = asyncio.get_running_loop()
+        transport, protocol = await spawner.spawn(loop, MockProtocol, ['sleep', '10'])
+        assert transport.get_pid() > 0
+        assert transport.get_returncode() is None
+        transport.send_signal(signal.SIGTERM)
+        returncode = await protocol.complete
+        transport.close()
+        return returncode
+
+    try:
+        assert run_until_complete(spawn_and_terminate()) == -signal.SIGTERM
+    finally:
+        spawner.shutdown()
+
+
+def test_process_spawner_inherit_fds():
+    """Test that inheritable file descriptors are only inherited if enabled."""
+    read_fd, write_fd = os.pipe()
+    os.set_inheritable(write_fd, True)
+
+    async def spawn_with(spawner):
+        transport, protocol = await spawner.spawn(
+            asyncio.get_running_loop(), MockProtocol,
+            [sys.executable, '-c', 'import os; os.fstat({})'.format(write_fd)])
+        returncode = await protocol.complete
+        await wait_for_output(transport)
+        transport.close()
+        return returncode
+
+    try:
+        for inherit_fds, expected_returncode in ((False, 1), (True, 0)):
+            spawner = ProcessSpawner(inherit_fds=inherit_fds)
+            assert spawner.inherit_fds == inherit_fds
+            try:
+                assert run_until_complete(spawn_with(spawner)) == expected_returncode
+            finally:
+                spawner.shutdown()
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
+def test_process_spawner_new_process_group():
+    """Test spawning a process in a new process group."""
+    spawner = ProcessSpawner()
+
+    async def spawn_with(new_process_group):
+        transport, protocol = await spawner.spawn(
+            asyncio.get_running_loop(), MockProtocol,
+            [sys.executable, '-c', 'import os; print(os.getpgrp())'],
+            new_process_group=new_process_group)
+        await protocol.complete
+        await wait_for_output(transport)
+        transport.close()
+        return transport.get_pid(), int(protocol.stdout_data)
+
+    async def spawn_both():
+        return await spawn_with(True), await spawn_with(False)
+
+    try:
+        (pid, pgid), (_, other_pgid) = run_until_complete(spawn_both())
+        assert pgid == pid
+        assert other_pgid == os.getpgrp()
+    finally:
+        spawner.shutdown()
+
+
+def test_process_spawner_missing_executable():
+    """Test that spawning a missing executable raises."""
+    spawner = ProcessSpawner()
+
+    async def spawn_missing():
+        await spawner.spawn(asyncio.get_running_loop(), MockProtocol, ['launch_no_such_program'])
+
+    try:
+        with pytest.raises(FileNotFoundError):
+            run_until_complete(spawn_missing())
+    finally:
+        spawner.shutdown()
+
+
+def test_process_spawner_no_thread_per_process():
+    """Test that spawned processes are reaped without a thread per process."""
+    spawner = ProcessSpawner(1)
+
+    async def spawn_many():
+        loop = asyncio.get_running_loop()
+        # Start the worker thread first.
+        transport, protocol = await spawner.spawn(loop, MockProtocol, ['true'])
+        await protocol.complete
+        transport.close()
+        thread_count = threading.active_count()
+        spawned = [
+            await spawner.spawn(loop, MockProtocol, ['sleep', '10']) for _ in range(10)
+        ]
+        assert spawner.child_watcher.mode in ('pidfd', 'sigchld')
+        assert threading.active_count() == thread_count
+        for transport, _ in spawned:
+            transport.kill()
+        for transport, protocol in spawned:
+            assert await protocol.complete == -signal.SIGKILL
+            transport.close()
+
+    try:
+        run_until_complete(spawn_many())
+    finally:
+        spawner.shutdown()
+
+
+def test_process_spawner_stdin():
+    """Test writing to the standard input of a spawned process, with flow control."""
+    spawner = ProcessSpawner()
+
+    class FlowControlProtocol(MockProtocol):
+
+        def __init__(self):
+            super().__init__()
+            self.paused = False
+
+        def pause_writing(self):
+            self.paused = True
+
+        def resume_writing(self):
+            self.paused = False
+
+    async def spawn_and_write():
+        loop = asyncio.get_running_loop()
+        transport, protocol = await spawner.spawn(loop, FlowControlProtocol, ['sleep', '10'])
+        # Not read by the process.
+        transport.get_pipe_transport(0).write(b'x' * (1024 * 1024))
+        assert protocol.paused
+        transport.kill()
+        await protocol.complete
+        transport.close()
+
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b'from pipe\n')
+        os.close(write_fd)
+        try:
+            transport, protocol = await spawner.spawn(
+                loop, MockProtocol, ['cat'], stdin=read_fd)
+        finally:
+            os.close(read_fd)
+        assert transport.get_pipe_transport(0) is None
+        assert await protocol.complete == 0
+        await wait_for_output(transport)
+        transport.close()
+        return protocol.stdout_data
+
+    try:
+        assert run_until_complete(spawn_and_write()) == b'from pipe\n'
+    finally:
+        spawner.shutdown()
@@ -0,0 +1,95 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the ProcessStatsSampler class."""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+from launch.process_stats_sampler import ProcessStatsSampler
+
+import pytest
+
+
+requires_proc = pytest.mark.skipif(
+    not os.path.isfile('/proc/self/stat'), reason='requires /proc')
+
+
+def run_until_complete(coroutine):
+    """Run a coroutine in a new event loop, leaving the event loop of the thread as is."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_process_stats_sampler_bad_configuration():
+    """Test that the sampling period must be positive, and that sampling is opt-in."""
+    with pytest.raises(ValueError):
+        ProcessStatsSampler(0.0)
+    assert not ProcessStatsSampler().enabled
+    assert ProcessStatsSampler(0.5).period == 0.5
+
+
+@requires_proc
+def test_process_stats_sampler_sample():
+    """Test sampling a busy process and an idle one."""
+    busy = subprocess.Popen([sys.executable, '-c', 'while True: pass'])
+    idle = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(10)'])
+    samples = {busy.pid: [], idle.pid: []}
+    sampler = ProcessStatsSampler(0.1)
+
+    async def sample():
+        for pid in samples:
+            sampler.add(pid, samples[pid].append)
+        await asyncio.sleep(0.55)
+        sampler.close()
+        await asyncio.sleep(0.2)
+
+    try:
+        run_until_complete(sample())
+    finally:
+        for process in (busy, idle):
+            process.kill()
+            process.wait()
+    for pid in samples:
+        assert 4 <= len(samples[pid]) <= 5
+        for stats in samples[pid]:
+            assert stats['rss'] > 0
+            assert stats['vms'] >= stats['rss']
+            assert stats['num_threads'] >= 1
+    assert max(stats['cpu_percent'] for stats in samples[busy.pid]) > 10.0
+    assert samples[idle.pid][-1]['cpu_percent'] < 10.0
+
+
+@requires_proc
+def test_process_stats_sampler_exited_process():
+    """Test that processes which exited are skipped, and are not sampled once removed."""
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    samples = []
+    sampler = ProcessStatsSampler(0.05)
+
+    async def sample():
+        sampler.add(process.pid, samples.append)
+        await asyncio.get_running_loop().run_in_executor(None, process.wait)
+        await asyncio.sleep(0.2)
+        sampler.remove(process.pid)
+        count = len(samples)
+        await asyncio.sleep(0.2)
+        return count
+
+    assert run_until_complete(sample()) == len(samples)
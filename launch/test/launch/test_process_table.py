@@ -0,0 +1,140 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the ProcessTable class."""
+
+import asyncio
+import platform
+import signal
+
+from launch import LaunchContext
+from launch import LaunchDescription
+from launch import LaunchService
+from launch.actions import EmitEvent
+from launch.actions import ExecuteProcess
+from launch.actions import RegisterEventHandler
+from launch.actions import Shutdown
+from launch.actions import TimerAction
+from launch.event_handlers import OnProcessExit
+from launch.event_handlers import OnProcessStart
+from launch.events import matches_action
+from launch.events.process import matches_executable
+from launch.events.process import matches_name
+from launch.events.process import matches_pid
+from launch.events.process import SignalProcess
+from launch.process_table import ProcessTable
+
+import pytest
+
+
+class MockAction:
+
+    def __init__(self, name, cmd, pid=None):
+        self.process_details = {'name': name, 'cmd': cmd, 'pid': pid}
+
+
+def test_process_table():
+    """Test looking up actions by action, pid, name and executable."""
+    table = ProcessTable()
+    talker = MockAction('talker', ['/opt/bin/talker'], 10)
+    listener = MockAction('listener', ['listener'], 11)
+    other_talker = MockAction('other_talker', ['/usr/bin/talker'])
+    for action in (talker, listener, other_talker):
+        table.add(action, name=action.process_details['name'],
+                  executable=action.process_details['cmd'][0])
+    table.set_pid(talker, 10)
+    table.set_pid(listener, 11)
+
+    assert len(table) == 3
+    assert list(table) == [talker, listener, other_talker]
+    assert table.get_by_pid(10) is talker
+    assert table.find_by_name('listener') == [listener]
+    assert table.find_by_executable('talker') == [talker, other_talker]
+    assert table.find_by_executable('opt/bin/talker') == [talker]
+    assert table.find_by_executable('ener') == [listener]
+
+    assert table.find(matches_action(listener)) == [listener]
+    assert table.find(matches_pid(10)) == [talker]
+    assert table.find(matches_pid(12)) == []
+    assert table.find(matches_name('other_talker')) == [other_talker]
+    assert table.find(matches_executable('bin/talker')) == [talker, other_talker]
+    assert table.find(lambda action: True) == [talker, listener, other_talker]
+    assert table.find_targets(SignalProcess(
+        signal_number=signal.SIGINT, process_matcher=matches_name('talker'))) == [talker]
+    assert table.find_targets(object()) is None
+
+    table.set_pid(talker, None)
+    assert table.get_by_pid(10) is None
+    table.discard(talker)
+    table.discard(talker)
+    assert talker not in table
+    assert table.find_by_executable('talker') == [other_talker]
+
+
+def test_process_table_failed_execute():
+    """Test that actions which failed to execute are not left in the process table."""
+    context = LaunchContext()
+    context.launch_configurations['max_concurrent_starts'] = 'many'
+    loop = asyncio.new_event_loop()
+    context._set_asyncio_loop(loop)
+    try:
+        action = ExecuteProcess(cmd=['ls'])
+        with pytest.raises(ValueError):
+            action.visit(context)
+        assert action not in context.process_table
+        assert len(context.process_table) == 0
+        assert context.process_table.find_by_executable('ls') == []
+    finally:
+        context._set_asyncio_loop(None)
+        loop.close()
+
+
+@pytest.mark.skipif(platform.system() == 'Windows', reason='requires POSIX signals')
+def test_process_table_signal_by_name():
+    """Test that a signal targeted by name is delivered to that process only."""
+    processes = [
+        ExecuteProcess(cmd=['sleep', '60'], name='sleeper_{}'.format(i), output='screen')
+        for i in range(5)
+    ]
+    started = []
+    returncodes = {}
+
+    def on_start(event, context):
+        assert event.action in context.process_table
+        started.append(event.action)
+        if len(started) < len(processes):
+            return None
+        # Names are made unique when processes are executed, e.g. 'sleeper_2-3'.
+        name = processes[2].process_details['name']
+        assert name.startswith('sleeper_2')
+        return EmitEvent(event=SignalProcess(
+            signal_number=signal.SIGTERM, process_matcher=matches_name(name)))
+
+    def on_exit(event, context):
+        returncodes[processes.index(event.action)] = event.returncode
+        if len(returncodes) == 1:
+            return Shutdown(reason='sleeper_2 exited')
+        return None
+
+    ls = LaunchService()
+    ls.include_launch_description(LaunchDescription([
+        RegisterEventHandler(OnProcessStart(on_start=on_start)),
+        RegisterEventHandler(OnProcessExit(on_exit=on_exit)),
+        # Do not wait for the processes to exit on their own if the signal is not delivered.
+        TimerAction(period=10.0, actions=[Shutdown(reason='timed out')]),
+    ] + processes))
+    assert 0 == ls.run()
+    assert returncodes.pop(2) == -signal.SIGTERM
+    assert set(returncodes.values()) == {-signal.SIGINT}
+    assert len(ls.context.process_table) == 0
@@ -0,0 +1,66 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the ScopedLaunchConfigurations class."""
+
+from launch.scoped_launch_configurations import ScopedLaunchConfigurations
+
+import pytest
+
+
+def test_scoped_launch_configurations_dict_interface():
+    """Test that ScopedLaunchConfigurations behaves like a dictionary."""
+    configurations = ScopedLaunchConfigurations()
+    assert len(configurations) == 0
+    configurations['foo'] = 'FOO'
+    configurations.update({'bar': 'BAR'})
+    assert configurations['foo'] == 'FOO'
+    assert configurations.get('baz') is None
+    assert 'bar' in configurations.keys()
+    assert configurations == {'foo': 'FOO', 'bar': 'BAR'}
+    del configurations['foo']
+    assert 'foo' not in configurations
+    with pytest.raises(KeyError):
+        del configurations['foo']
+    assert configurations.copy() == {'bar': 'BAR'}
+
+
+def test_scoped_launch_configurations_scopes():
+    """Test that changes within a scope are discarded when it is popped."""
+    configurations = ScopedLaunchConfigurations()
+    configurations.update({'foo': 'FOO', 'bar': 'BAR'})
+
+    configurations.push()
+    assert configurations.depth == 1
+    assert configurations == {'foo': 'FOO', 'bar': 'BAR'}
+    configurations['foo'] = 'FOO2'
+    del configurations['bar']
+    configurations['baz'] = 'BAZ'
+    assert configurations == {'foo': 'FOO2', 'baz': 'BAZ'}
+
+    configurations.push()
+    configurations.clear()
+    assert len(configurations) == 0
+    assert 'foo' not in configurations
+    configurations['qux'] = 'QUX'
+    assert configurations == {'qux': 'QUX'}
+
+    configurations.pop()
+    assert configurations == {'foo': 'FOO2', 'baz': 'BAZ'}
+    configurations.pop()
+    assert configurations.depth == 0
+    assert configurations == {'foo': 'FOO', 'bar': 'BAR'}
+
+    with pytest.raises(RuntimeError):
+        configurations.pop()
@@ -0,0 +1,73 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the ShutdownSupervisor class."""
+
+import asyncio
+
+from launch.shutdown_supervisor import ShutdownSupervisor
+
+import pytest
+
+
+def run_until_complete(coroutine):
+    """Run a coroutine in a new event loop, leaving the event loop of the thread as is."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_shutdown_supervisor_bad_configuration():
+    """Test that the deadline resolution must be positive."""
+    with pytest.raises(ValueError):
+        ShutdownSupervisor(0.0)
+    assert ShutdownSupervisor(0.1).deadline_resolution == 0.1
+
+
+def test_shutdown_supervisor_escalate():
+    """Test that processes are escalated to SIGTERM then SIGKILL, in batches."""
+    supervisor = ShutdownSupervisor(0.05)
+    escalated = []
+
+    async def supervise():
+        loop = asyncio.get_running_loop()
+        escalations = [
+            supervisor.supervise(
+                loop, lambda signal_name, timeout, i=i: escalated.append(
+                    (i, signal_name, timeout, loop.time())),
+                0.1, 0.2)
+            for i in range(100)
+        ]
+        assert supervisor.pending_count == 100
+        assert supervisor.timer_count == 1
+        start = loop.time()
+        escalations[0].cancel()
+        assert escalations[0].next_signal is None
+        await asyncio.sleep(0.2)
+        assert supervisor.timer_count == 1
+        escalations[1].cancel()
+        await asyncio.sleep(0.3)
+        assert supervisor.pending_count == 0
+        assert supervisor.timer_count == 0
+        return start
+
+    start = run_until_complete(supervise())
+    sigterms = [entry for entry in escalated if entry[1] == 'SIGTERM']
+    sigkills = [entry for entry in escalated if entry[1] == 'SIGKILL']
+    assert [entry[0] for entry in sigterms] == list(range(1, 100))
+    assert [entry[0] for entry in sigkills] == list(range(2, 100))
+    assert all(entry[2] == 0.1 and entry[3] >= start + 0.1 for entry in sigterms)
+    assert all(entry[2] == 0.2 and entry[3] >= start + 0.3 for entry in sigkills)
@@ -0,0 +1,94 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the StartScheduler class."""
+
+import asyncio
+
+from launch.start_scheduler import StartScheduler
+
+import pytest
+
+
+def run_until_complete(coroutine):
+    """Run a coroutine in a new event loop, leaving the event loop of the thread as is."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_start_scheduler_bad_configuration():
+    """Test that limits must be positive."""
+    with pytest.raises(ValueError):
+        StartScheduler(0)
+    with pytest.raises(ValueError):
+        StartScheduler(start_ready_timeout=0.0)
+
+
+def test_start_scheduler_unlimited():
+    """Test that processes start right away without a limit."""
+    scheduler = StartScheduler()
+
+    async def acquire_all():
+        return [await scheduler.acquire() for _ in range(10)]
+
+    slots = run_until_complete(acquire_all())
+    assert scheduler.starting_count == 10
+    for slot in slots:
+        slot.release()
+        # Releasing more than once has no effect.
+        slot.release()
+        assert slot.released
+    assert scheduler.starting_count == 0
+
+
+def test_start_scheduler_limit():
+    """Test that processes are admitted in order, up to the limit."""
+    scheduler = StartScheduler(2)
+
+    async def run():
+        admitted = []
+
+        async def start(index, max_concurrent_starts=None):
+            slot = await scheduler.acquire(max_concurrent_starts)
+            admitted.append(index)
+            return slot
+
+        tasks = [asyncio.ensure_future(start(i)) for i in range(5)]
+        await asyncio.sleep(0)
+        assert admitted == [0, 1]
+        assert scheduler.starting_count == 2
+        assert scheduler.waiting_count == 3
+
+        # A process that is cancelled while waiting does not hold up the others.
+        tasks[2].cancel()
+        (await tasks[0]).release()
+        await asyncio.sleep(0)
+        assert admitted == [0, 1, 3]
+        assert scheduler.waiting_count == 1
+
+        # Limits can be overridden for each process.
+        strict_task = asyncio.ensure_future(start(5, 1))
+        (await tasks[1]).release()
+        (await tasks[3]).release()
+        await asyncio.sleep(0)
+        assert admitted == [0, 1, 3, 4]
+        (await tasks[4]).release()
+        (await strict_task).release()
+        assert admitted == [0, 1, 3, 4, 5]
+        assert scheduler.starting_count == 0
+
+    run_until_complete(run())
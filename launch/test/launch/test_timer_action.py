@@ -153,3 +153,26 @@ def test_timer_can_block_preemption():
     assert len(shutdown_reasons) == 2  # Should see 'shutdown' event twice because
     assert shutdown_reasons[0].reason == 'fast shutdown'
     assert shutdown_reasons[1].reason == 'slow shutdown'
+
+
+def test_timer_action_event_handlers_are_released():
+    """Test that event handlers registered by a timer are unregistered once it fires."""
+    timer_action = launch.actions.TimerAction(period=0.1, actions=[])
+    handler_counts = []
+
+    def record_handler_counts(context):
+        handler_counts.append(context.get_event_handler_counts_by_owner())
+
+    ld = launch.LaunchDescription([
+        timer_action,
+        launch.actions.TimerAction(
+            period=0.5,
+            actions=[launch.actions.OpaqueFunction(function=record_handler_counts)],
+        ),
+    ])
+
+    ls = launch.LaunchService()
+    ls.include_launch_description(ld)
+    assert 0 == ls.run()
+    assert len(handler_counts) == 1
+    assert timer_action not in handler_counts[0]
@@ -0,0 +1,97 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the Tracer class."""
+
+from launch import LaunchContext
+from launch import LaunchDescription
+from launch import LaunchService
+from launch import Tracer
+from launch.actions import OpaqueFunction
+from launch.actions import TimerAction
+from launch.events import IncludeLaunchDescription
+from launch.events import Shutdown
+
+import pytest
+
+
+class RecordingTracer(Tracer):
+
+    def __init__(self):
+        self.records = []
+
+    def on_event_emitted(self, event, *, synchronous):
+        self.records.append(('emitted', event, synchronous))
+
+    def on_event_handler_matched(self, event, event_handler):
+        self.records.append(('matched', event, event_handler))
+
+    def on_entity_visited(self, entity, sub_entities):
+        self.records.append(('visited', entity, sub_entities))
+
+    def on_future_completed(self, future, entity):
+        self.records.append(('completed', future, entity))
+
+    def of_kind(self, kind):
+        return [record[1:] for record in self.records if record[0] == kind]
+
+
+def test_tracer_add_and_remove():
+    """Test attaching and detaching tracers to a LaunchContext."""
+    context = LaunchContext()
+    assert context._tracer is None
+    first_tracer = RecordingTracer()
+    second_tracer = RecordingTracer()
+    context.add_tracer(first_tracer)
+    assert context._tracer is first_tracer
+    context.add_tracer(second_tracer)
+
+    event = Shutdown()
+    context.emit_event_sync(event)
+    assert first_tracer.of_kind('emitted') == [(event, True)]
+    assert second_tracer.of_kind('emitted') == [(event, True)]
+
+    context.remove_tracer(first_tracer)
+    assert context._tracer is second_tracer
+    context.remove_tracer(second_tracer)
+    assert context._tracer is None
+    with pytest.raises(ValueError):
+        context.remove_tracer(second_tracer)
+
+
+def test_tracer_launch_service():
+    """Test the structured payloads passed to tracers by a running LaunchService."""
+    timer_action = TimerAction(period=0., actions=[OpaqueFunction(function=lambda context: None)])
+    ld = LaunchDescription([timer_action])
+    tracer = RecordingTracer()
+    ls = LaunchService()
+    ls.context.add_tracer(tracer)
+    ls.include_launch_description(ld)
+    assert ls.run() == 0
+
+    emitted_events = [event for event, _ in tracer.of_kind('emitted')]
+    include_events = [e for e in emitted_events if isinstance(e, IncludeLaunchDescription)]
+    assert len(include_events) == 1
+    assert include_events[0].launch_description is ld
+    assert any(isinstance(event, Shutdown) for event in emitted_events)
+
+    matched_events = [event for event, _ in tracer.of_kind('matched')]
+    assert include_events[0] in matched_events
+
+    visited_entities = [entity for entity, _ in tracer.of_kind('visited')]
+    assert ld in visited_entities
+    assert timer_action in visited_entities
+
+    completed_entities = [entity for future, entity in tracer.of_kind('completed')]
+    assert timer_action in completed_entities
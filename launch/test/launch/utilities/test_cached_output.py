@@ -0,0 +1,56 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the CachedOutput class."""
+
+from launch.utilities import CachedOutput
+
+import pytest
+
+
+def test_cached_output_unbounded():
+    """Test reading from an unbounded CachedOutput."""
+    cached_output = CachedOutput()
+    assert cached_output.getvalue() == ''
+    assert cached_output.read() == ('', 0)
+    cached_output.write('foo\n')
+    cached_output.write('bar\n')
+    assert cached_output.getvalue() == 'foo\nbar\n'
+    text, offset = cached_output.read()
+    assert (text, offset) == ('foo\nbar\n', 8)
+    assert cached_output.read(offset) == ('', 8)
+    cached_output.write('baz\n')
+    assert cached_output.read(offset) == ('baz\n', 12)
+    assert cached_output.read(6) == ('r\nbaz\n', 12)
+    assert cached_output.getvalue() == 'foo\nbar\nbaz\n'
+
+
+def test_cached_output_size_limit():
+    """Test that the oldest output is discarded once the size limit is exceeded."""
+    with pytest.raises(ValueError):
+        CachedOutput(0)
+    cached_output = CachedOutput(6)
+    cached_output.write('foo\n')
+    cached_output.write('bar\n')
+    assert cached_output.start_offset == 2
+    assert cached_output.end_offset == 8
+    assert cached_output.getvalue() == 'o\nbar\n'
+    # Reading from discarded output starts from the oldest output still stored.
+    assert cached_output.read(0) == ('o\nbar\n', 8)
+    cached_output.write('bazqux\n')
+    assert cached_output.getvalue() == 'azqux\n'
+    assert cached_output.read(8) == ('azqux\n', 15)
+    cached_output.clear()
+    assert cached_output.getvalue() == ''
+    assert cached_output.read(8) == ('', 15)
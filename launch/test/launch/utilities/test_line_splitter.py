@@ -0,0 +1,48 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the LineSplitter class."""
+
+from launch.utilities import LineSplitter
+
+
+def test_line_splitter_complete_lines():
+    """Test that only complete lines are returned, without line terminators."""
+    splitter = LineSplitter()
+    assert splitter.feed(b'foo\nbar\nba') == ['foo', 'bar']
+    assert splitter.pending_text() == 'ba'
+    assert splitter.feed(b'z') == []
+    assert splitter.feed(b'\n\nqux') == ['baz', '']
+    assert splitter.flush() == 'qux'
+    assert splitter.flush() == ''
+    assert splitter.pending_text() == ''
+
+
+def test_line_splitter_multibyte_characters():
+    """Test that multibyte characters split across chunks are decoded correctly."""
+    data = 'héllo wörld\n€uro\nnö newline'.encode('utf-8')
+    splitter = LineSplitter()
+    lines = []
+    for i in range(len(data)):
+        lines += splitter.feed(data[i:i + 1])
+    assert lines == ['héllo wörld', '€uro']
+    assert splitter.flush() == 'nö newline'
+
+
+def test_line_splitter_invalid_bytes():
+    """Test that invalid bytes are replaced."""
+    splitter = LineSplitter()
+    assert splitter.feed(b'foo\xff\n') == ['foo�']
+    assert splitter.feed(b'\xe2\x82') == []
+    assert splitter.flush() == '�'
@@ -0,0 +1,60 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the LineRateLimiter and RepeatedLineCollapser classes."""
+
+from launch.utilities import LineRateLimiter
+from launch.utilities import RepeatedLineCollapser
+
+import pytest
+
+
+def test_line_rate_limiter():
+    """Test that lines beyond the rate limit are dropped."""
+    with pytest.raises(ValueError):
+        LineRateLimiter(0)
+    with pytest.raises(ValueError):
+        LineRateLimiter(1, 0)
+
+    now = 0.0
+    limiter = LineRateLimiter(10, 5, clock=lambda: now)
+    lines = [str(i) for i in range(8)]
+    assert limiter.filter(lines) == lines[:5]
+    assert limiter.dropped_count == 3
+    assert limiter.filter(lines) == []
+    assert limiter.dropped_count == 11
+    # The bucket refills at 10 lines per second, up to 5 lines.
+    now = 0.2
+    assert limiter.filter(lines) == lines[:2]
+    now = 10.0
+    assert limiter.filter(lines) == lines[:5]
+    assert limiter.dropped_count == 20
+    assert limiter.filter(['foo']) == []
+
+
+def test_repeated_line_collapser():
+    """Test that identical consecutive lines are collapsed."""
+    collapser = RepeatedLineCollapser()
+    assert collapser.collapse(['foo', 'foo', 'foo', 'bar']) == [
+        'foo', 'last message repeated 2 times', 'bar'
+    ]
+    assert collapser.collapsed_count == 2
+    assert collapser.collapse(['bar', 'bar']) == []
+    assert collapser.collapsed_count == 4
+    assert collapser.collapse(['baz', 'baz']) == ['last message repeated 2 times', 'baz']
+    assert collapser.flush() == 'last message repeated 1 times'
+    assert collapser.flush() is None
+    # After flushing, the same line is not collapsed anymore.
+    assert collapser.collapse(['baz']) == ['baz']
+    assert collapser.collapsed_count == 5
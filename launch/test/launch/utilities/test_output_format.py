@@ -0,0 +1,55 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the compile_output_format() utility function."""
+
+from launch.utilities import compile_output_format
+
+import pytest
+
+
+class MockDescription:
+    final_name = 'some-proc{}'
+
+
+class MockAction:
+    process_description = MockDescription()
+    values = [1, 2]
+
+
+@pytest.mark.parametrize('output_format', [
+    '{line}',
+    '[{this.process_description.final_name}] {line}',
+    '{line} {line}',
+    '{{literal}} {this.values[1]:>4} {line}',
+    '{line!r:>20}',
+    'no line',
+    '{this.process_description.final_name!r} {line:.2}',
+])
+def test_compile_output_format(output_format):
+    """Test that compiled output formats format lines like str.format()."""
+    this = MockAction()
+    format_output_line = compile_output_format(output_format, this)
+    for line in ['', 'foo', 'with {braces}']:
+        assert format_output_line(line) == output_format.format(line=line, this=this)
+
+
+def test_compile_output_format_errors():
+    """Test that formatting errors show up when formatting lines."""
+    format_output_line = compile_output_format('{other} {line}', MockAction())
+    with pytest.raises(KeyError):
+        format_output_line('foo')
+    format_output_line = compile_output_format('{this.missing} {line}', MockAction())
+    with pytest.raises(AttributeError):
+        format_output_line('foo')
@@ -0,0 +1,69 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the OutputPump class."""
+
+import os
+import time
+
+from launch.utilities import OutputPump
+
+
+def test_output_pump_complete_lines(tmp_path):
+    """Test that pumps appending to the same file only mix complete lines."""
+    combined_path = str(tmp_path / 'combined.log')
+    stdout_path = str(tmp_path / 'stdout.log')
+    stdout_read_fd, stdout_write_fd = os.pipe()
+    stderr_read_fd, stderr_write_fd = os.pipe()
+    pumps = [
+        OutputPump(stdout_read_fd, [stdout_path, combined_path]),
+        OutputPump(stderr_read_fd, [combined_path]),
+    ]
+    for pump in pumps:
+        pump.start()
+    os.write(stdout_write_fd, b'foo')
+    os.write(stderr_write_fd, b'bar\n')
+    time.sleep(0.1)
+    os.write(stdout_write_fd, b'\nbaz')
+    os.close(stdout_write_fd)
+    os.close(stderr_write_fd)
+    for pump in pumps:
+        pump.join(10.0)
+
+    with open(combined_path, 'r') as f:
+        assert f.read().splitlines() == ['bar', 'foo', 'baz']
+    with open(stdout_path, 'r') as f:
+        # The last line is written even if it is not terminated.
+        assert f.read() == 'foo\nbaz'
+
+
+def test_output_pump_timestamps(tmp_path):
+    """Test that each line is prefixed with the time it was read at, even if read in parts."""
+    path = str(tmp_path / 'output.log')
+    read_fd, write_fd = os.pipe()
+    pump = OutputPump(read_fd, [path], timestamps=True, read_size=8)
+    pump.start()
+    os.write(write_fd, b'foo\nbar')
+    time.sleep(0.1)
+    os.write(write_fd, b'\n')
+    time.sleep(0.1)
+    os.write(write_fd, b'0123456789abcdef\n')
+    os.close(write_fd)
+    pump.join(10.0)
+
+    with open(path, 'r') as f:
+        lines = f.read().splitlines()
+    assert [line.split(' ', 1)[1] for line in lines] == ['foo', 'bar', '0123456789abcdef']
+    for line in lines:
+        assert float(line.split(' ', 1)[0]) > 0
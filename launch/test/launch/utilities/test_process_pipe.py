@@ -0,0 +1,50 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the ProcessPipe class."""
+
+import os
+
+from launch.utilities import ProcessPipe
+
+import pytest
+
+
+def test_process_pipe():
+    """Test that both ends stay open until closed, and that closed ends are not reopened."""
+    pipe = ProcessPipe()
+    read_fd = pipe.get_read_end()
+    write_fd = pipe.get_write_end()
+    assert pipe.get_read_end() == read_fd
+    assert not os.get_inheritable(read_fd)
+    assert not os.get_inheritable(write_fd)
+    os.write(write_fd, b'data')
+    assert os.read(read_fd, 4) == b'data'
+    pipe.close_write_end()
+    # End of input, once the write end is closed.
+    assert os.read(read_fd, 4) == b''
+    with pytest.raises(RuntimeError):
+        pipe.get_write_end()
+    pipe.close_read_end()
+    pipe.close_read_end()
+    with pytest.raises(RuntimeError):
+        pipe.get_read_end()
+
+
+def test_process_pipe_closed_before_created():
+    """Test that a pipe is not created once either end is closed."""
+    pipe = ProcessPipe()
+    pipe.close_write_end()
+    with pytest.raises(RuntimeError):
+        pipe.get_read_end()
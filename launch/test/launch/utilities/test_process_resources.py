@@ -0,0 +1,80 @@
+# Copyright 2022 Open Source Robotics Foundation, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the ProcessResources class."""
+
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from launch.utilities import ProcessResources
+
+import pytest
+
+
+def test_process_resources_bad_configuration():
+    """Test that bad CPU affinities, nice values and resource limits are rejected."""
+    with pytest.raises(ValueError):
+        ProcessResources(cpu_affinity=[])
+    with pytest.raises(ValueError):
+        ProcessResources(nice=20)
+    with pytest.raises(ValueError):
+        ProcessResources(rlimits={'no_such_limit': 1})
+    assert ProcessResources().empty
+
+
+@pytest.mark.skipif(platform.system() != 'Linux', reason='requires Linux')
+def test_process_resources_apply():
+    """Test applying resources to a process before it executes its program, and after."""
+    import resource
+    cpu = min(os.sched_getaffinity(0))
+    resources = ProcessResources(cpu_affinity=[cpu], nice=10, rlimits={'nofile': 64})
+    assert not resources.empty
+    script = (
+        'import os, resource; '
+        'print(sorted(os.sched_getaffinity(0)), os.getpriority(os.PRIO_PROCESS, 0), '
+        'resource.getrlimit(resource.RLIMIT_NOFILE)[0])'
+    )
+    output = subprocess.check_output(
+        [sys.executable, '-c', script], preexec_fn=resources.apply)
+    assert output.decode().split() == ['[{}]'.format(cpu), '10', '64']
+
+    assert resources.applies_to_other_processes
+    # Started with a thread, to which resources are applied too.
+    script = 'import threading, time; threading.Thread(target=time.sleep, args=(10,)).start()'
+    process = subprocess.Popen([sys.executable, '-c', script])
+    try:
+        while len(os.listdir('/proc/{}/task'.format(process.pid))) < 2:
+            time.sleep(0.01)
+        resources.apply(process.pid)
+        for thread_id in os.listdir('/proc/{}/task'.format(process.pid)):
+            assert os.sched_getaffinity(int(thread_id)) == {cpu}
+            assert os.getpriority(os.PRIO_PROCESS, int(thread_id)) == 10
+        assert resource.prlimit(process.pid, resource.RLIMIT_NOFILE)[0] == 64
+    finally:
+        process.kill()
+        process.wait()
+
+
+def test_process_resources_with_cpu_affinity():
+    """Test copying resources with a different CPU affinity."""
+    if not hasattr(os, 'sched_setaffinity'):
+        pytest.skip('requires CPU affinity support')
+    resources = ProcessResources(cpu_affinity=[0, 1], nice=5)
+    copy = resources.with_cpu_affinity([1])
+    assert copy.cpu_affinity == {1}
+    assert copy.nice == 5
+    assert resources.cpu_affinity == {0, 1}
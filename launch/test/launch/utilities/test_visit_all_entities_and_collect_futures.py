@@ -96,3 +96,40 @@ def test_visit_all_entities_and_collect_futures_sub_entities():
         else:
             assert isinstance(future_pair[0], MockEntityDescriptionWithFuture)
         assert isinstance(future_pair[1], asyncio.Future)
+
+
+def test_visit_all_entities_and_collect_futures_large_description():
+    """Test with a large, deeply nested, description."""
+    context = LaunchContext()
+    visited = []
+
+    class MockEntityDescriptionNested(LaunchDescriptionEntity):
+
+        def __init__(self, index, sub_entities):
+            self.index = index
+            self.__sub_entities = sub_entities
+            self.__future = asyncio.Future()
+
+        def get_asyncio_future(self):
+            return self.__future
+
+        def visit(self, context):
+            visited.append(self.index)
+            return self.__sub_entities
+
+    # A 10k entities chain, far deeper than the recursion limit, where each
+    # entity also has a leaf entity after the nested one, ~20k entities overall.
+    number_of_levels = 10000
+    entity = None
+    for index in reversed(range(number_of_levels)):
+        sub_entities = None
+        if entity is not None:
+            leaf = MockEntityDescriptionNested(2 * number_of_levels - index - 2, None)
+            sub_entities = [entity, leaf]
+        entity = MockEntityDescriptionNested(index, sub_entities)
+
+    result = visit_all_entities_and_collect_futures(entity, context)
+    # Depth-first order: the chain first, then the leaves from the innermost outwards.
+    expected_order = list(range(2 * number_of_levels - 1))
+    assert visited == expected_order
+    assert [future_pair[0].index for future_pair in result] == expected_order
@@ -88,66 +88,107 @@ def _wait_for_event_with_condition_sync(
     return cond_value
 
 
+def _output_condition(
+    execute_process_action, source, validate_output, *, incremental=False, asserting=False
+):
+    """
+    Return a condition validating the output of a process, reading only new output each call.
+
+    The output is only validated again when there is new output.
+    It is passed the output cached by the process, as returned by get_stdout()
+    or get_stderr() and so bounded by its cached_output_size_limit, or if
+    incremental is True only the complete lines written since the last
+    validation, so that validating does not get slower as the output grows,
+    an incomplete last line being passed once the process exits.
+    If asserting is True, the output is valid unless validate_output raises an
+    AssertionError, otherwise it is valid if validate_output returns True.
+    """
+    read_output = getattr(execute_process_action, 'read_' + source)
+    get_output = getattr(execute_process_action, 'get_' + source)
+    get_pending_output = getattr(execute_process_action, 'get_pending_' + source)
+    offset = 0
+    pending = None
+    valid = False
+
+    def condition():
+        nonlocal offset, pending, valid
+        text, offset = read_output(offset)
+        if incremental:
+            if not text:
+                return valid
+            to_validate = text
+        else:
+            new_pending = get_pending_output()
+            if not text and new_pending == pending:
+                return valid
+            pending = new_pending
+            to_validate = get_output()
+        if not asserting:
+            valid = validate_output(to_validate)
+            return valid
+        try:
+            validate_output(to_validate)
+        except AssertionError:
+            return False
+        valid = True
+        return valid
+    return condition
+
+
 def _get_stdout_event_handler(action, pyevent):
     return event_handlers.OnProcessIO(
         target_action=action, on_stdout=lambda _1: pyevent.set())
 
 
 async def wait_for_output(
-    launch_context, execute_process_action, validate_output, timeout=None
+    launch_context, execute_process_action, validate_output, timeout=None, incremental=False
 ):
     return await _wait_for_event_with_condition(
         launch_context,
         execute_process_action,
         _get_stdout_event_handler,
-        lambda: validate_output(execute_process_action.get_stdout()),
+        _output_condition(
+            execute_process_action, 'stdout', validate_output, incremental=incremental),
         timeout)
 
 
 async def assert_output(
-    launch_context, execute_process_action, validate_output, timeout=None
+    launch_context, execute_process_action, validate_output, timeout=None, incremental=False
 ):
-    def condition():
-        try:
-            validate_output(execute_process_action.get_stdout())
-        except AssertionError:
-            return False
-        return True
     cond_value = await _wait_for_event_with_condition(
         launch_context,
         execute_process_action,
         _get_stdout_event_handler,
-        condition,
+        _output_condition(
+            execute_process_action, 'stdout', validate_output,
+            incremental=incremental, asserting=True),
         timeout)
     if not cond_value:
         validate_output(execute_process_action.get_stdout())
 
 
 def wait_for_output_sync(
-    launch_context, execute_process_action, validate_output, timeout=None
+    launch_context, execute_process_action, validate_output, timeout=None, incremental=False
 ):
     return _wait_for_event_with_condition_sync(
         launch_context,
         execute_process_action,
         _get_stdout_event_handler,
-        lambda: validate_output(execute_process_action.get_stdout()),
+        _output_condition(
+            execute_process_action, 'stdout', validate_output, incremental=incremental),
         timeout)
 
 
 def assert_output_sync(
-    launch_context, execute_process_action, validate_output, timeout=None
+    launch_context, execute_process_action, validate_output, timeout=None, incremental=False
 ):
-    def condition():
-        try:
-            validate_output(execute_process_action.get_stdout())
-        except AssertionError:
-            return False
-        return True
     cond_value = _wait_for_event_with_condition_sync(
         launch_context,
         execute_process_action,
         _get_stdout_event_handler,
-        condition,
+        _output_condition(
+            execute_process_action, 'stdout', validate_output,
+            incremental=incremental, asserting=True),
         timeout)
     if not cond_value:
         validate_output(execute_process_action.get_stdout())
@@ -159,60 +200,54 @@ def _get_stderr_event_handler(action, pyevent):
 
 
 async def wait_for_stderr(
-    launch_context, execute_process_action, validate_output, timeout=None
+    launch_context, execute_process_action, validate_output, timeout=None, incremental=False
 ):
     return await _wait_for_event_with_condition(
         launch_context,
         execute_process_action,
         _get_stderr_event_handler,
-        lambda: validate_output(execute_process_action.get_stderr()),
+        _output_condition(
+            execute_process_action, 'stderr', validate_output, incremental=incremental),
         timeout)
 
 
 async def assert_stderr(
-    launch_context, execute_process_action, validate_output, timeout=None
+    launch_context, execute_process_action, validate_output, timeout=None, incremental=False
 ):
-    def condition():
-        try:
-            validate_output(execute_process_action.get_stderr())
-        except AssertionError:
-            return False
-        return True
     cond_value = await _wait_for_event_with_condition(
         launch_context,
         execute_process_action,
         _get_stderr_event_handler,
-        condition,
+        _output_condition(
+            execute_process_action, 'stderr', validate_output,
+            incremental=incremental, asserting=True),
         timeout)
     if not cond_value:
         validate_output(execute_process_action.get_stderr())
 
 
 def wait_for_stderr_sync(
-    launch_context, execute_process_action, validate_output, timeout=None
+    launch_context, execute_process_action, validate_output, timeout=None, incremental=False
 ):
     return _wait_for_event_with_condition_sync(
         launch_context,
         execute_process_action,
         _get_stderr_event_handler,
-        lambda: validate_output(execute_process_action.get_stderr()),
+        _output_condition(
+            execute_process_action, 'stderr', validate_output, incremental=incremental),
         timeout)
 
 
 def assert_stderr_sync(
-    launch_context, execute_process_action, validate_output, timeout=None
+    launch_context, execute_process_action, validate_output, timeout=None, incremental=False
 ):
-    def condition():
-        try:
-            validate_output(execute_process_action.get_stderr())
-        except AssertionError:
-            return False
-        return True
     cond_value = _wait_for_event_with_condition_sync(
         launch_context,
         execute_process_action,
         _get_stderr_event_handler,
-        condition,
+        _output_condition(
+            execute_process_action, 'stderr', validate_output,
+            incremental=incremental, asserting=True),
         timeout)
     if not cond_value:
         validate_output(execute_process_action.get_stderr())
@@ -29,6 +29,17 @@ print('world', file=sys.stderr)
 time.sleep(5)
 """
 
+PROMPT_SCRIPT = """\
+import sys
+import time
+
+for i in range(100):
+    print('line {}'.format(i))
+sys.stdout.write('prompt> ')
+sys.stdout.flush()
+time.sleep(5)
+"""
+
 
 @pytest.fixture
 def dut():
@@ -46,6 +57,22 @@ def launch_description(dut):
     ])
 
 
+@pytest.fixture
+def prompting_dut():
+    return launch.actions.ExecuteProcess(
+        cmd=[sys.executable, '-c', PROMPT_SCRIPT],
+        cached_output=True,
+        output='screen'
+    )
+
+
+@launch_pytest.fixture
+def prompting_launch_description(prompting_dut):
+    return launch.LaunchDescription([
+        prompting_dut,
+    ])
+
+
 @pytest.mark.launch(fixture=launch_description)
 async def test_async_process_tools(dut, launch_context):
     assert await tools.wait_for_start(launch_context, dut, timeout=10)
@@ -76,3 +103,23 @@ def test_sync_process_tools(dut, launch_context):
     tools.assert_stderr_sync(
         launch_context, dut, check_stderr, timeout=10)
     assert tools.wait_for_exit_sync(launch_context, dut, timeout=10)
+
+
+@pytest.mark.launch(fixture=prompting_launch_description)
+async def test_process_tools_pending_line(prompting_dut, launch_context):
+    def check_prompt(output):
+        # The output validated is the output cached by the process.
+        assert output == prompting_dut.get_stdout()
+        assert output.endswith('line 99\nprompt> ')
+    await tools.assert_output(
+        launch_context, prompting_dut, check_prompt, timeout=10)
+
+    validated = []
+
+    def find_last_line(output):
+        validated.append(output)
+        return 'line 99\n' in output
+    assert await tools.wait_for_output(
+        launch_context, prompting_dut, find_last_line, timeout=10, incremental=True)
+    # Only the complete lines, each passed once.
+    assert ''.join(validated) == ''.join('line {}\n'.format(i) for i in range(100))
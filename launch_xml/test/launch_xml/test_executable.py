@@ -64,5 +64,115 @@ def test_executable_wrong_subtag():
     assert 'whats_this' in str(excinfo.value)
 
 
+def test_executable_respawn_attributes():
+    xml_file = \
+        """\
+        <launch>
+            <executable cmd="ls" respawn="true" respawn_delay="0.5" respawn_backoff="2.0" respawn_max_delay="30.0" respawn_jitter="0.1" respawn_max_restarts="5" respawn_restart_window="60.0"/>
+        </launch>
+        """  # noqa, line too long
+    root_entity, parser = Parser.load(io.StringIO(textwrap.dedent(xml_file)))
+    ld = parser.parse_description(root_entity)
+    assert ld.entities[0].respawn_counters['respawn_count'] == 0
+
+    xml_file = \
+        """\
+        <launch>
+            <executable cmd="ls" respawn="true" respawn_jitter="1.5"/>
+        </launch>
+        """
+    root_entity, parser = Parser.load(io.StringIO(textwrap.dedent(xml_file)))
+    with pytest.raises(ValueError) as excinfo:
+        parser.parse_description(root_entity)
+    assert 'respawn_jitter' in str(excinfo.value)
+
+    xml_file = \
+        """\
+        <launch>
+            <executable cmd="ls" respawn="true" respawn_backoff="2.0"/>
+        </launch>
+        """
+    root_entity, parser = Parser.load(io.StringIO(textwrap.dedent(xml_file)))
+    with pytest.raises(ValueError) as excinfo:
+        parser.parse_description(root_entity)
+    assert 'respawn_delay' in str(excinfo.value)
+
+
+def test_executable_process_resources_attributes():
+    xml_file = \
+        """\
+        <launch>
+            <executable cmd="ls" cpu_affinity="0,1" cpu_affinity-sep="," cpu_affinity_round_robin="true" nice="5" rlimit_nofile="1024" rlimit_core="0"/>
+        </launch>
+        """  # noqa, line too long
+    root_entity, parser = Parser.load(io.StringIO(textwrap.dedent(xml_file)))
+    ld = parser.parse_description(root_entity)
+    process_resources = ld.entities[0].process_resources
+    assert process_resources.cpu_affinity == {0, 1}
+    assert process_resources.nice == 5
+    assert not process_resources.empty
+
+    xml_file = \
+        """\
+        <launch>
+            <executable cmd="ls" nice="20"/>
+        </launch>
+        """
+    root_entity, parser = Parser.load(io.StringIO(textwrap.dedent(xml_file)))
+    with pytest.raises(ValueError) as excinfo:
+        parser.parse_description(root_entity)
+    assert 'nice' in str(excinfo.value)
+
+
+def test_executable_stdin_file_attribute():
+    xml_file = \
+        """\
+        <launch>
+            <executable cmd="cat" stdin_file="/tmp/input.txt"/>
+        </launch>
+        """
+    root_entity, parser = Parser.load(io.StringIO(textwrap.dedent(xml_file)))
+    ld = parser.parse_description(root_entity)
+    stdin_file = ld.entities[0].stdin_file
+    assert '/tmp/input.txt' == ''.join([x.perform(None) for x in stdin_file])
+
+
+def test_executable_output_filter_attributes():
+    xml_file = \
+        """\
+        <launch>
+            <executable cmd="ls" output_rate_limit="100.0" output_rate_burst="50" collapse_repeated_output="true"/>
+        </launch>
+        """  # noqa, line too long
+    root_entity, parser = Parser.load(io.StringIO(textwrap.dedent(xml_file)))
+    ld = parser.parse_description(root_entity)
+    executable = ld.entities[0]
+    assert executable.output_rate_limit == 100.0
+    assert executable.output_rate_burst == 50
+    assert executable.collapse_repeated_output is True
+
+    xml_file = \
+        """\
+        <launch>
+            <executable cmd="ls" output_rate_limit="0"/>
+        </launch>
+        """
+    root_entity, parser = Parser.load(io.StringIO(textwrap.dedent(xml_file)))
+    with pytest.raises(ValueError) as excinfo:
+        parser.parse_description(root_entity)
+    assert 'output_rate_limit' in str(excinfo.value)
+
+    xml_file = \
+        """\
+        <launch>
+            <executable cmd="ls" output_rate_limit="10.0" output_rate_burst="0"/>
+        </launch>
+        """
+    root_entity, parser = Parser.load(io.StringIO(textwrap.dedent(xml_file)))
+    with pytest.raises(ValueError) as excinfo:
+        parser.parse_description(root_entity)
+    assert 'output_rate_burst' in str(excinfo.value)
+
+
 if __name__ == '__main__':
     test_executable()
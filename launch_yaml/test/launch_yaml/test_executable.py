@@ -58,5 +58,63 @@ def test_executable():
     assert(0 == ls.run())
 
 
+def test_executable_process_resources():
+    """Parse executable yaml example with CPU affinity, nice value and resource limits."""
+    yaml_file = \
+        """\
+        launch:
+        -   executable:
+                cmd: ls
+                cpu_affinity: [0, 1]
+                cpu_affinity_round_robin: true
+                nice: 5
+                rlimit_nofile: 1024
+                rlimit_core: 0
+        """
+    yaml_file = textwrap.dedent(yaml_file)
+    root_entity, parser = Parser.load(io.StringIO(yaml_file))
+    ld = parser.parse_description(root_entity)
+    process_resources = ld.entities[0].process_resources
+    assert process_resources.cpu_affinity == {0, 1}
+    assert process_resources.nice == 5
+    assert not process_resources.empty
+
+
+def test_executable_stdin_file():
+    """Parse executable yaml example with a file as standard input."""
+    yaml_file = \
+        """\
+        launch:
+        -   executable:
+                cmd: cat
+                stdin_file: /tmp/input.txt
+        """
+    yaml_file = textwrap.dedent(yaml_file)
+    root_entity, parser = Parser.load(io.StringIO(yaml_file))
+    ld = parser.parse_description(root_entity)
+    stdin_file = ld.entities[0].stdin_file
+    assert '/tmp/input.txt' == ''.join([x.perform(None) for x in stdin_file])
+
+
+def test_executable_output_filters():
+    """Parse executable yaml example with output rate limiting and collapsing."""
+    yaml_file = \
+        """\
+        launch:
+        -   executable:
+                cmd: ls
+                output_rate_limit: 100.0
+                output_rate_burst: 50
+                collapse_repeated_output: true
+        """
+    yaml_file = textwrap.dedent(yaml_file)
+    root_entity, parser = Parser.load(io.StringIO(yaml_file))
+    ld = parser.parse_description(root_entity)
+    executable = ld.entities[0]
+    assert executable.output_rate_limit == 100.0
+    assert executable.output_rate_burst == 50
+    assert executable.collapse_repeated_output is True
+
+
 if __name__ == '__main__':
     test_executable()